@@ -11,6 +11,7 @@ from django_dicom.models.networking.status import ServerStatus
 from django_dicom.models.patient import Patient
 from django_dicom.models.series import Series
 from django_dicom.models.study import Study
+from django_dicom.models.values.compact_value import CompactValue
 from django_dicom.models.values.data_element_value import DataElementValue
 from django_dicom.models.values.sequence_of_items import SequenceOfItems
 from django_dicom.utils.html import Html
@@ -21,6 +22,10 @@ SERVER_STATUS_COLOR = {
     ServerStatus.DOWN: "red",
 }
 SERVER_STATUS_INDICATOR = '<div style="color: {color}; font-size: 40px;">&bull;</div>'
+SERVER_METRICS_SUMMARY = (
+    "<div>{instances} instances ({rate:.2f}/s), {failures} failed, "
+    "{refused} refused, {import_latency} mean import</div>"
+)
 
 
 class DataElementInLine(admin.TabularInline):
@@ -112,6 +117,34 @@ class DataElementValueAdmin(admin.ModelAdmin):
         return qs.select_subclasses()
 
 
+class CompactValueAdmin(admin.ModelAdmin):
+    fields = "id", "value_model", "index", "_raw_peek", "_value", "warnings"
+    readonly_fields = "id", "value_model", "index", "_raw_peek", "_value"
+    list_display = (
+        "id",
+        "value_model",
+        "index",
+        "_raw_peek",
+        "_value_link",
+        "warnings",
+    )
+    list_filter = ("value_model",)
+    ordering = ["id"]
+
+    def _raw_peek(self, compact_value: CompactValue) -> str:
+        return compact_value.get_raw_peek()
+
+    def _value(self, compact_value: CompactValue) -> str:
+        return compact_value.to_html(verbose=True)
+
+    def _value_link(self, compact_value: CompactValue):
+        return compact_value.to_html(verbose=False)
+
+    _raw_peek.short_description = "Raw"
+    _value.short_description = "Value"
+    _value_link.short_description = "Value"
+
+
 class DataElementAdmin(admin.ModelAdmin):
     fields = (
         "id",
@@ -158,7 +191,7 @@ class DataElementAdmin(admin.ModelAdmin):
         return data_element.header.admin_link
 
     def value_instances(self, data_element: DataElement):
-        values = data_element._values.all()
+        values = data_element.get_value_instances()
         links = [value.admin_link for value in values]
         return Html.break_html(links)
 
@@ -177,6 +210,7 @@ class HeaderAdmin(admin.ModelAdmin):
         "series_link",
         "image_link",
         "parent_link",
+        "base_link",
     )
     ordering = ("-id",)
     readonly_fields = (
@@ -186,29 +220,54 @@ class HeaderAdmin(admin.ModelAdmin):
         "image_link",
         "parent_link",
         "index",
+        "base_link",
+        "inherited_elements",
     )
     inlines = (DataElementInLine,)
 
     class Media:
         css = {"all": ("django_dicom/css/hide_admin_original.css",)}
 
+    def get_series(self, header: Header) -> Series:
+        if hasattr(header, "image"):
+            return header.image.series
+        if hasattr(header, "common_series"):
+            return header.common_series
+
     def patient_link(self, header: Header):
-        return header.image.series.patient.admin_link
+        series = self.get_series(header)
+        if series and series.patient:
+            return series.patient.admin_link
 
     def series_link(self, header: Header):
-        return header.image.series.admin_link
+        series = self.get_series(header)
+        if series:
+            return series.admin_link
 
     def image_link(self, header: Header):
-        return header.image.admin_link
+        if hasattr(header, "image"):
+            return header.image.admin_link
 
     def parent_link(self, header: Header):
         if header.parent:
             return header.parent.admin_link
 
+    def base_link(self, header: Header):
+        if header.base:
+            return header.base.admin_link
+
+    def inherited_elements(self, header: Header):
+        if header.base:
+            inherited = header.get_data_elements().exclude(header=header)
+            return Html.json(
+                [data_element.to_verbose_dict() for data_element in inherited]
+            )
+
     parent_link.short_description = "Parent"
     image_link.short_description = "Image"
     series_link.short_description = "Series"
     patient_link.short_description = "Patient"
+    base_link.short_description = "Common Header"
 
 
 class ImageAdmin(admin.ModelAdmin):
@@ -398,6 +457,16 @@ class StorageServiceClassProviderAdmin(admin.ModelAdmin):
     def _status(self, instance: StorageServiceClassProvider) -> str:
         color = SERVER_STATUS_COLOR.get(instance.status)
         html = SERVER_STATUS_INDICATOR.format(color=color)
+        metrics = instance.metrics
+        if metrics["instances"]:
+            mean = metrics["latency"]["import"]["mean"]
+            html += SERVER_METRICS_SUMMARY.format(
+                instances=metrics["instances"],
+                rate=metrics["instances_per_second"],
+                failures=metrics["failures"],
+                refused=metrics["refused"],
+                import_latency="-" if mean is None else f"{mean * 1000:.1f}ms",
+            )
         return mark_safe(html)
 
 
@@ -431,6 +500,7 @@ class PatientAdmin(admin.ModelAdmin):
 
 admin.site.register(DataElementDefinition, DataElementDefinitionAdmin)
 admin.site.register(DataElementValue, DataElementValueAdmin)
+admin.site.register(CompactValue, CompactValueAdmin)
 admin.site.register(DataElement, DataElementAdmin)
 admin.site.register(Header, HeaderAdmin)
 admin.site.register(Image, ImageAdmin)
@@ -33,6 +33,12 @@ class DjangoDicomConfig(AppConfig):
     pynetdicom application entity, used for DICOM networking.
     """
 
+    ingestion_queue = None
+    """
+    Queue of received C-STORE datasets pending import (see the
+    *DICOM_SCP_QUEUE* setting). If None, datasets are imported synchronously.
+    """
+
     def ready(self):
         """
         Overrides :func:`~django.apps.AppConfig.ready` to run code when Django
@@ -43,8 +49,15 @@ class DjangoDicomConfig(AppConfig):
         If the application is served with gunicorn using multiple workers,
         :func:`ready` is executed multiple times and causes server
         instantiation to raise *[Errno 98] Address already in use*. In case the
-        application is meant to be served using multiple workers, the DICOM
-        application entity instantiation needs to be revised.
+        application is meant to be served using multiple workers, set
+        *DICOM_AE_AUTOSTART* to False and serve the storage SCPs using the
+        *run_storage_scp* management command instead (see
+        :class:`~django_dicom.models.networking.runner.StorageScpRunner`).
+
+        Only a process that starts serving a storage SCP recovers the spool
+        (see :meth:`recover_spool`), so that other processes sharing it (e.g.
+        web workers failing to bind the same port, or management commands) do
+        not import or queue the same spooled files.
         """
         tests_startup = getattr(settings, "TESTING_MODE", False)
         ae_autostart = getattr(settings, "DICOM_AE_AUTOSTART", True)
@@ -52,7 +65,9 @@ class DjangoDicomConfig(AppConfig):
         ae_missing = ae_autostart and not (tests_startup or ae_exists)
         if ae_missing:
             self.application_entity = self.create_application_entity()
-            self.start_servers()
+            self.ingestion_queue = self.create_ingestion_queue()
+            if self.start_servers():
+                self.recover_spool()
 
     def create_application_entity(
         self, allow_echo: bool = True, maximum_pdu_size: int = 0
@@ -109,11 +124,48 @@ class DjangoDicomConfig(AppConfig):
 
         return application_entity
 
+    def create_ingestion_queue(self):
+        """
+        Creates and starts the ingestion queue configured by the
+        *DICOM_SCP_QUEUE* setting, if any. The spool is recovered separately
+        (see :meth:`recover_spool`).
+
+        Returns
+        -------
+        :class:`~django_dicom.models.networking.ingestion.IngestionQueue`
+            Started ingestion queue or None
+        """
+        from django_dicom.models.networking.ingestion import IngestionQueue
+
+        ingestion_queue = IngestionQueue.from_settings()
+        if ingestion_queue is not None:
+            ingestion_queue.start(recover=False)
+        return ingestion_queue
+
+    def recover_spool(self):
+        """
+        Queues or imports any datasets left in the spool by a previous run
+        (see :func:`~django_dicom.models.networking.ingestion.recover_spool`).
+
+        Returns
+        -------
+        threading.Thread
+            Recovery thread, or None if the spool is empty
+        """
+        from django_dicom.models.networking.ingestion import recover_spool
+
+        return recover_spool(self.ingestion_queue)
+
     def start_servers(self):
         """
         Creates the :class:`pynetdicom.transport.ThreadedAssociationServer`
         instances to manage requests from storage service class users.
 
+        Returns
+        -------
+        List[ThreadedAssociationServer]
+            Association servers started by the current process
+
         See Also
         --------
         * :class:`~pynetdicom.transport.ThreadedAssociationServer`
@@ -123,9 +175,9 @@ class DjangoDicomConfig(AppConfig):
         """
         StorageServiceClassProvider = self.get_model("StorageServiceClassProvider")
         try:
-            StorageServiceClassProvider.objects.start_servers()
+            return StorageServiceClassProvider.objects.start_servers() or []
         except ProgrammingError:
             # If the Storage SCP model hasn't yet been created in the database,
             # ignore this exception (otherwise, the migrations required to
             # create the table cannot be executed).
-            pass
+            return []
@@ -0,0 +1,38 @@
+"""
+Definition of the :class:`Command` class, used to serve the storage SCPs
+using multiple worker processes.
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django_dicom.models.networking import messages
+from django_dicom.models.networking.runner import StorageScpRunner
+
+
+class Command(BaseCommand):
+    """
+    Serves the storage SCPs using multiple worker processes (see
+    :class:`~django_dicom.models.networking.runner.StorageScpRunner`).
+    """
+
+    help = "Serves the storage SCPs using multiple worker processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes (defaults to the number of CPUs).",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=StorageScpRunner.MODES,
+            default="prefork",
+            help="Whether the workers share the supervisor's listening sockets "
+            "or bind their own with SO_REUSEPORT.",
+        )
+
+    def handle(self, *args, workers: int = None, mode: str = "prefork", **options):
+        config = apps.get_app_config("django_dicom")
+        if config.application_entity is not None:
+            raise CommandError(messages.RUNNER_AUTOSTART)
+        StorageScpRunner(workers=workers, mode=mode).run()
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:09
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+# Frozen copies of the content hash definition at the time of this migration,
+# so that later changes to the value managers do not affect it.
+VALUE_FIELDS = "index", "raw", "value", "warnings"
+CHUNK_SIZE = 500
+
+
+def get_value_hash(ValueModel, values: dict) -> str:
+    prepared = {}
+    for name in VALUE_FIELDS:
+        field = ValueModel._meta.get_field(name)
+        value = values.get(name)
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        value = field.get_prep_value(value)
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        prepared[name] = value
+    content = json.dumps(prepared, sort_keys=True, default=repr)
+    content = f"{ValueModel._meta.label}:{content}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class Migration(migrations.Migration):
+    def populate_content_hash(apps, schema_editor):
+        DataElementValue = apps.get_model("django_dicom", "DataElementValue")
+        value_models = [
+            model
+            for model in apps.get_app_config("django_dicom").get_models()
+            if DataElementValue in model._meta.parents
+        ]
+        for ValueModel in value_models:
+            field_names = {field.name for field in ValueModel._meta.get_fields()}
+            if not set(VALUE_FIELDS).issubset(field_names):
+                # Sequences have no simple value to hash.
+                continue
+            seen = set()
+            chunk = []
+            values = ValueModel.objects.order_by("pk").iterator(chunk_size=CHUNK_SIZE)
+            for value in values:
+                kwargs = {name: getattr(value, name) for name in VALUE_FIELDS}
+                content_hash = get_value_hash(ValueModel, kwargs)
+                # Duplicates created before hashing was introduced keep a
+                # null hash and are simply never matched again.
+                if content_hash in seen:
+                    continue
+                seen.add(content_hash)
+                chunk.append(DataElementValue(pk=value.pk, content_hash=content_hash))
+                if len(chunk) >= CHUNK_SIZE:
+                    DataElementValue.objects.bulk_update(chunk, ["content_hash"])
+                    chunk = []
+            DataElementValue.objects.bulk_update(chunk, ["content_hash"])
+
+    dependencies = [
+        ("django_dicom", "0010_alter_series_sequence_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataelementvalue",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True, unique=True
+            ),
+        ),
+        migrations.RunPython(populate_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0011_dataelementvalue_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportManifestEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("path", models.CharField(max_length=1000, unique=True)),
+                ("size", models.BigIntegerField()),
+                ("mtime", models.BigIntegerField()),
+                (
+                    "uid",
+                    models.CharField(
+                        blank=True,
+                        max_length=64,
+                        null=True,
+                        verbose_name="SOP Instance UID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("CREATED", "Created"),
+                            ("EXISTING", "Existing"),
+                            ("INVALID", "Invalid"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("scanned", models.DateTimeField(auto_now=True)),
+            ],
+            options={"verbose_name_plural": "Import manifest entries"},
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0012_importmanifestentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="header",
+            name="base",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="delta_set",
+                to="django_dicom.header",
+            ),
+        ),
+        migrations.AddField(
+            model_name="series",
+            name="common_header",
+            field=models.OneToOneField(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="common_series",
+                to="django_dicom.header",
+            ),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:34
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0013_header_storage_deltas"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompactValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "value_model",
+                    models.CharField(
+                        choices=[
+                            ("AgeString", "AgeString"),
+                            ("ApplicationEntity", "ApplicationEntity"),
+                            ("CodeString", "CodeString"),
+                            ("CsaHeader", "CsaHeader"),
+                            ("Date", "Date"),
+                            ("DateTime", "DateTime"),
+                            ("DecimalString", "DecimalString"),
+                            ("FloatingPointDouble", "FloatingPointDouble"),
+                            ("FloatingPointSingle", "FloatingPointSingle"),
+                            ("IntegerString", "IntegerString"),
+                            ("LongString", "LongString"),
+                            ("LongText", "LongText"),
+                            ("OtherWord", "OtherWord"),
+                            ("PersonName", "PersonName"),
+                            ("ShortString", "ShortString"),
+                            ("ShortText", "ShortText"),
+                            ("SignedLong", "SignedLong"),
+                            ("SignedShort", "SignedShort"),
+                            ("Time", "Time"),
+                            ("UniqueIdentifier", "UniqueIdentifier"),
+                            ("Unknown", "Unknown"),
+                            ("UnlimitedText", "UnlimitedText"),
+                            ("UnsignedLong", "UnsignedLong"),
+                            ("UnsignedShort", "UnsignedShort"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("index", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "warnings",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(blank=True, null=True),
+                        blank=True,
+                        null=True,
+                        size=None,
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(editable=False, max_length=64, unique=True),
+                ),
+                ("raw_text", models.TextField(blank=True, null=True)),
+                ("raw_integer", models.BigIntegerField(blank=True, null=True)),
+                ("raw_bytes", models.BinaryField(blank=True, null=True)),
+                ("value_text", models.TextField(blank=True, null=True)),
+                ("value_integer", models.BigIntegerField(blank=True, null=True)),
+                ("value_float", models.FloatField(blank=True, null=True)),
+                ("value_date", models.DateField(blank=True, null=True)),
+                ("value_time", models.TimeField(blank=True, null=True)),
+                ("value_datetime", models.DateTimeField(blank=True, null=True)),
+                ("value_json", models.JSONField(blank=True, null=True)),
+            ],
+            options={"ordering": ["index"]},
+        ),
+        migrations.AddField(
+            model_name="dataelement",
+            name="_compact_values",
+            field=models.ManyToManyField(
+                related_name="data_element_set", to="django_dicom.compactvalue"
+            ),
+        ),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:37
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+import django_dicom.models.utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0014_compactvalue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FloatArray",
+            fields=[
+                (
+                    "dataelementvalue_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="django_dicom.dataelementvalue",
+                    ),
+                ),
+                (
+                    "value",
+                    django_dicom.models.utils.fields.NumpyArrayField(
+                        base_field=models.FloatField(blank=True, null=True),
+                        blank=True,
+                        null=True,
+                        size=None,
+                    ),
+                ),
+                (
+                    "raw",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(blank=True, null=True),
+                        blank=True,
+                        null=True,
+                        size=None,
+                    ),
+                ),
+            ],
+            bases=("django_dicom.dataelementvalue",),
+        ),
+        migrations.CreateModel(
+            name="IntegerArray",
+            fields=[
+                (
+                    "dataelementvalue_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="django_dicom.dataelementvalue",
+                    ),
+                ),
+                (
+                    "value",
+                    django_dicom.models.utils.fields.NumpyArrayField(
+                        base_field=models.BigIntegerField(blank=True, null=True),
+                        blank=True,
+                        null=True,
+                        size=None,
+                    ),
+                ),
+                (
+                    "raw",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(blank=True, null=True),
+                        blank=True,
+                        null=True,
+                        size=None,
+                    ),
+                ),
+            ],
+            bases=("django_dicom.dataelementvalue",),
+        ),
+        migrations.AddField(
+            model_name="compactvalue",
+            name="raw_array",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.TextField(blank=True, null=True),
+                blank=True,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="compactvalue",
+            name="value_float_array",
+            field=django_dicom.models.utils.fields.NumpyArrayField(
+                base_field=models.FloatField(blank=True, null=True),
+                blank=True,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="compactvalue",
+            name="value_integer_array",
+            field=django_dicom.models.utils.fields.NumpyArrayField(
+                base_field=models.BigIntegerField(blank=True, null=True),
+                blank=True,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="compactvalue",
+            name="value_model",
+            field=models.CharField(
+                choices=[
+                    ("AgeString", "AgeString"),
+                    ("ApplicationEntity", "ApplicationEntity"),
+                    ("CodeString", "CodeString"),
+                    ("CsaHeader", "CsaHeader"),
+                    ("Date", "Date"),
+                    ("DateTime", "DateTime"),
+                    ("DecimalString", "DecimalString"),
+                    ("FloatArray", "FloatArray"),
+                    ("FloatingPointDouble", "FloatingPointDouble"),
+                    ("FloatingPointSingle", "FloatingPointSingle"),
+                    ("IntegerArray", "IntegerArray"),
+                    ("IntegerString", "IntegerString"),
+                    ("LongString", "LongString"),
+                    ("LongText", "LongText"),
+                    ("OtherWord", "OtherWord"),
+                    ("PersonName", "PersonName"),
+                    ("ShortString", "ShortString"),
+                    ("ShortText", "ShortText"),
+                    ("SignedLong", "SignedLong"),
+                    ("SignedShort", "SignedShort"),
+                    ("Time", "Time"),
+                    ("UniqueIdentifier", "UniqueIdentifier"),
+                    ("Unknown", "Unknown"),
+                    ("UnlimitedText", "UnlimitedText"),
+                    ("UnsignedLong", "UnsignedLong"),
+                    ("UnsignedShort", "UnsignedShort"),
+                ],
+                max_length=32,
+            ),
+        ),
+    ]
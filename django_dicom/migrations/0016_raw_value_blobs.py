@@ -0,0 +1,98 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:40
+
+from django.db import migrations, models
+import django_dicom.models.utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0015_array_values"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="compactvalue",
+            name="raw_bytes_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="compactvalue",
+            name="raw_text_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="csaheader",
+            name="raw_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="otherword",
+            name="raw_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="unknown",
+            name="raw_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="unlimitedtext",
+            name="raw_blob",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="compactvalue",
+            name="raw_bytes",
+            field=django_dicom.models.utils.fields.BlobBinaryField(
+                blank=True, blob_field="raw_bytes_blob", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="compactvalue",
+            name="raw_text",
+            field=django_dicom.models.utils.fields.BlobTextField(
+                blank=True, blob_field="raw_text_blob", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="csaheader",
+            name="raw",
+            field=django_dicom.models.utils.fields.BlobTextField(
+                blank=True, blob_field="raw_blob", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="otherword",
+            name="raw",
+            field=django_dicom.models.utils.fields.BlobBinaryField(
+                blank=True, blob_field="raw_blob", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="unknown",
+            name="raw",
+            field=django_dicom.models.utils.fields.BlobTextField(
+                blank=True, blob_field="raw_blob", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="unlimitedtext",
+            name="raw",
+            field=django_dicom.models.utils.fields.BlobTextField(
+                blank=True, blob_field="raw_blob", null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_dicom", "0016_raw_value_blobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScpMetricsSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("port", models.PositiveIntegerField()),
+                ("worker", models.CharField(max_length=255)),
+                ("metrics", models.JSONField()),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Storage SCP metrics snapshot",
+                "unique_together": {("port", "worker")},
+            },
+        ),
+    ]
@@ -6,7 +6,11 @@ from django_dicom.models.data_element import DataElement
 from django_dicom.models.data_element_definition import DataElementDefinition
 from django_dicom.models.header import Header
 from django_dicom.models.image import Image
-from django_dicom.models.networking import StorageServiceClassProvider
+from django_dicom.models.import_manifest_entry import ImportManifestEntry
+from django_dicom.models.networking import (
+    ScpMetricsSnapshot,
+    StorageServiceClassProvider,
+)
 from django_dicom.models.patient import Patient
 from django_dicom.models.series import Series
 from django_dicom.models.study import Study
@@ -5,7 +5,10 @@ from typing import Any
 
 import pandas as pd
 from django.db import models
+from django.db.models import QuerySet
 from django_dicom.models.managers.data_element import DataElementManager
+from django_dicom.models.utils.utils import ValueStorage, get_value_storage
+from django_dicom.models.values.vr_to_model import ARRAY_VR_TO_MODEL
 from django_dicom.utils.html import Html
 
 
@@ -54,6 +57,12 @@ class DataElement(models.Model):
         "django_dicom.DataElementValue", related_name="data_element_set"
     )
 
+    # Holds a reference to the values if they are saved in compact mode (see
+    # the DICOM_VALUE_STORAGE setting).
+    _compact_values = models.ManyToManyField(
+        "django_dicom.CompactValue", related_name="data_element_set"
+    )
+
     objects = DataElementManager()
 
     _LIST_ELEMENTS = "ScanningSequence", "SequenceVariant"
@@ -92,6 +101,55 @@ class DataElement(models.Model):
 
         return key.replace("_", " ").title() if len(key) > 2 else key.upper()
 
+    def get_value_instances(self) -> QuerySet:
+        """
+        Returns the value instances associated with this data element. Values
+        are read from the value store selected by the *DICOM_VALUE_STORAGE*
+        setting, or from the other one if this data element has no values
+        there (e.g. if it was created before the setting was changed and the
+        values were not migrated). *Sequence of Items* values are always saved
+        as
+        :class:`~django_dicom.models.values.sequence_of_items.SequenceOfItems`
+        instances.
+
+        Returns
+        -------
+        QuerySet
+            Associated value instances
+        """
+
+        multi_table = self._values.select_subclasses()
+        if self.definition.value_representation == "SQ":
+            return multi_table
+        compact = self._compact_values.all()
+        if get_value_storage() is ValueStorage.COMPACT:
+            preferred, fallback = compact, multi_table
+        else:
+            preferred, fallback = multi_table, compact
+        # Evaluating the preferred queryset caches its results.
+        return preferred if preferred else fallback
+
+    def set_value_instances(self, values: list) -> None:
+        """
+        Associates the provided value instances with this data element.
+
+        Parameters
+        ----------
+        values : list
+            :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass or
+            :class:`~django_dicom.models.values.compact_value.CompactValue`
+            instances
+        """
+
+        CompactValue = self._compact_values.model
+        compact = [value for value in values if isinstance(value, CompactValue)]
+        multi_table = [value for value in values if not isinstance(value, CompactValue)]
+        if compact:
+            self._compact_values.set(compact)
+        if multi_table:
+            self._values.set(multi_table)
+
     def to_html(self, **kwargs) -> str:
         """
         Returns an HTML representation of this instance.
@@ -106,7 +164,7 @@ class DataElement(models.Model):
             HTML representaion of this instance
         """
 
-        values = self._values.select_subclasses()
+        values = self.get_value_instances()
         html = [value.to_html(**kwargs) for value in values]
         return html.pop() if len(html) == 1 else html
 
@@ -172,7 +230,7 @@ class DataElement(models.Model):
             Data element value
         """
 
-        values = self._values.select_subclasses()
+        values = self.get_value_instances()
 
         # If this data element's definition has a value representation of SQ
         # (Sequence of Items), it will have a single value (a SequenceOfItems
@@ -201,9 +259,12 @@ class DataElement(models.Model):
     @property
     def value_multiplicity(self) -> int:
         """
-        Returns the number of
+        Returns the number of values contained by this instance. Array values
+        (see :class:`~django_dicom.models.values.float_array.FloatArray` and
+        :class:`~django_dicom.models.values.integer_array.IntegerArray`) count
+        as the number of items in the array, any other
         :class:`~django_dicom.models.values.data_element_value.DataElementValue`
-        related to this instance.
+        as a single value.
 
         Returns
         -------
@@ -219,4 +280,13 @@ class DataElement(models.Model):
            http://dicom.nema.org/dicom/2013/output/chtml/part05/sect_6.4.html
         """
 
-        return self._values.count()
+        array_models = set(ARRAY_VR_TO_MODEL.values())
+        multiplicity = 0
+        for instance in self.get_value_instances():
+            # Compact values keep the name of the value model they replace.
+            model_name = getattr(instance, "value_model", type(instance).__name__)
+            if model_name in array_models:
+                multiplicity += len(instance.value) if instance.value is not None else 0
+            else:
+                multiplicity += 1
+        return multiplicity
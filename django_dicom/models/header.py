@@ -2,16 +2,18 @@
 Definition of the :class:`Header` class.
 """
 import os
-from typing import Any, List
+from typing import Any, Dict, List
 
 from dicom_parser.header import Header as DicomHeader
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import Q, QuerySet
 from django_dicom.models.dicom_entity import DicomEntity
 from django_dicom.models.managers.header import HeaderManager
 from django_dicom.models.patient import Patient
 from django_dicom.models.series import Series
 from django_dicom.models.study import Study
+from django_dicom.models.utils.utils import ValueStorage, get_value_storage
 from django_dicom.utils.html import Html
 from model_utils.models import TimeStampedModel
 
@@ -41,11 +43,86 @@ class Header(TimeStampedModel):
     #: This Data Set's index in the sequence (if *parent* is not None).
     index = models.PositiveIntegerField(blank=True, null=True)
 
+    #: If headers are stored as deltas (see the *DICOM_HEADER_STORAGE*
+    #: setting), the common header of this header's series. Only data elements
+    #: that differ from the common header are saved for this header, and
+    #: common data elements this header does not contain are saved without any
+    #: values.
+    base = models.ForeignKey(
+        "self",
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="delta_set",
+    )
+
     # Cached :class:`~dicom_parser.header.Header` instance.
     _instance = None
 
+    # Cached data element signatures (see get_element_signatures()).
+    _signatures = None
+
     objects = HeaderManager()
 
+    def get_data_elements(self) -> QuerySet:
+        """
+        Returns the data elements of this header, resolving any data elements
+        inherited from the *base* header.
+
+        Returns
+        -------
+        QuerySet
+            :class:`~django_dicom.models.data_element.DataElement` instances
+        """
+        if self.base_id is None:
+            return self.data_element_set.all()
+        DataElement = self.data_element_set.model
+        overridden = self.data_element_set.values("definition")
+        has_values = Q(_values__isnull=False) | Q(_compact_values__isnull=False)
+        own = Q(header=self) & has_values
+        inherited = Q(header_id=self.base_id) & ~Q(definition__in=overridden)
+        return DataElement.objects.filter(own | inherited).distinct()
+
+    def get_element_signatures(self) -> Dict[tuple, tuple]:
+        """
+        Returns the definition ID and value content hashes of each of this
+        header's data elements, used to store other headers relative to this
+        one. The result is cached on this instance.
+
+        Returns
+        -------
+        Dict[tuple, tuple]
+            Definition ID and value content hashes (or None for sequences) by
+            definition key
+        """
+        if self._signatures is None:
+            relations = ["_values", "_compact_values"]
+            if get_value_storage() is ValueStorage.COMPACT:
+                relations.reverse()
+            hashes, signatures = {}, {}
+            # Values are read from the configured value store, or from the
+            # other one for data elements without values there (see
+            # DataElement.get_value_instances()).
+            for index, relation in enumerate(relations):
+                values = self.data_element_set.values_list(
+                    "definition_id",
+                    "definition__tag",
+                    "definition__keyword",
+                    "definition__value_representation",
+                    f"{relation}__content_hash",
+                )
+                for definition_id, tag, keyword, vr, content_hash in values:
+                    key = tuple(tag), keyword
+                    entry = hashes.setdefault(key, (definition_id, vr, (set(), set())))
+                    entry[2][index].add(content_hash)
+            for key, (definition_id, vr, (preferred, fallback)) in hashes.items():
+                content_hashes = preferred if preferred != {None} else fallback
+                comparable = vr != "SQ" and None not in content_hashes
+                signature = frozenset(content_hashes) if comparable else None
+                signatures[key] = definition_id, signature
+            self._signatures = signatures
+        return self._signatures
+
     def to_verbose_list(self) -> List[dict]:
         """
         Returns a list of dictionaries containing the information from the
@@ -57,8 +134,7 @@ class Header(TimeStampedModel):
             Header information as a list of dictionaries
         """
         return [
-            data_element.to_verbose_dict()
-            for data_element in self.data_element_set.all()
+            data_element.to_verbose_dict() for data_element in self.get_data_elements()
         ]
 
     def to_html(self, verbose: bool = False, **kwargs) -> str:
@@ -98,7 +174,7 @@ class Header(TimeStampedModel):
             Data element value
         """
         try:
-            data_element = self.data_element_set.get(definition__keyword=keyword)
+            data_element = self.get_data_elements().get(definition__keyword=keyword)
         except ObjectDoesNotExist:
             return None
         else:
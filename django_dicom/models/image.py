@@ -3,12 +3,12 @@ Definition of the :class:`Image` class.
 """
 import logging
 import os
-import shutil
 import warnings
 from pathlib import Path
 
 import dicom_parser
 import numpy as np
+from dicom_parser.header import Header as DicomHeader
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
@@ -17,7 +17,14 @@ from django_dicom.models.dicom_entity import DicomEntity
 from django_dicom.models.header import Header
 from django_dicom.models.managers.image import ImageManager
 from django_dicom.models.series import Series
-from django_dicom.models.utils import get_dicom_root
+from django_dicom.models.utils import (
+    HeaderStorage,
+    get_dicom_root,
+    get_header_storage,
+    read_header,
+)
+from django_dicom.models.utils.header_batch import get_header_batch
+from django_dicom.models.utils.placement import make_directory, place_file
 from django_dicom.models.utils.validators import (
     digits_and_dots_only,
     validate_file_extension,
@@ -97,6 +104,9 @@ class Image(DicomEntity):
     # Cached :class:`~dicom_parser.image.Image` instance.
     _instance = None
 
+    # Cached :class:`~dicom_parser.header.Header` instance.
+    _dicom_header = None
+
     #: A dictionary of DICOM data element keywords to be used to populate
     #: a created instance's fields.
     FIELD_TO_HEADER = {
@@ -144,14 +154,32 @@ class Image(DicomEntity):
     def create_header_instance(self) -> Header:
         """
         Creates a :class:`~django_dicom.models.header.Header` instance from a
-        :class:`dicom_parser.header.Header`.
+        :class:`dicom_parser.header.Header` using bulk queries (see
+        :meth:`~django_dicom.models.managers.header.HeaderManager.bulk_from_dicom_parser`).
+        If a header batch is active (see
+        :func:`~django_dicom.models.utils.header_batch.header_batch`), the
+        header is created along with the rest of the batch's headers of the
+        same series. If headers are stored as deltas, the created header is
+        stored relative to the series' common header.
 
         Returns
         -------
         :class:`~django_dicom.models.header.Header`
             Created instance
+
+
+        .. # noqa: E501
         """
-        return Header.objects.from_dicom_parser(self.instance.header)
+        base = None
+        if self.series and get_header_storage() is HeaderStorage.DELTA:
+            base = self.series.get_or_create_common_header(self.dicom_header)
+        batch = get_header_batch()
+        if batch is not None:
+            return batch.create(self.dicom_header, base=base)
+        (header,) = Header.objects.bulk_from_dicom_parser(
+            [self.dicom_header], base=base
+        )
+        return header
 
     def save(self, *args, rename: bool = True, **kwargs):
         """
@@ -165,14 +193,21 @@ class Image(DicomEntity):
             Whether to move the file this instance is a reference to to a
             default path under MEDIA_ROOT or not, by default True
         """
+        created_series = False
         if self.dcm and not hasattr(self, "header"):
+            if not self.series and get_header_storage() is HeaderStorage.DELTA:
+                # Delta headers are stored relative to their series' common
+                # header, so the series is resolved before the header is
+                # created.
+                header = Header()
+                header._instance = self.dicom_header
+                self.series, created_series = Series.objects.from_header(header)
             # Add the created Header instance to the passed kwargs
             # so that it may be used to update the new image instance's
             # fields in DicomEntity's `save()` execution.
             self.header = self.create_header_instance()
             kwargs["header"] = self.header
 
-        created_series = False
         if not self.series and "header" in kwargs:
             self.series, created_series = Series.objects.from_header(kwargs["header"])
         if self.dcm and rename:
@@ -183,7 +218,7 @@ class Image(DicomEntity):
         # any signals relying on header data may use the created image's
         # header.
         if created_series:
-            self.series.save()
+            self.series.save(header=self.header)
 
     def get_default_path(self) -> Path:
         """
@@ -198,13 +233,18 @@ class Image(DicomEntity):
         :class:`pathlib.Path`
             This instance's default location
         """
-        relative_path = self.instance.default_relative_path
-        return DICOM_ROOT / relative_path
+        header = self.dicom_header
+        patient_uid = header.get("PatientID")
+        series_uid = header.get("SeriesInstanceUID")
+        name = f'{header.get("InstanceNumber", 0)}.dcm'
+        return DICOM_ROOT / patient_uid / series_uid / name
 
     def rename(self, target: Path) -> None:
         """
         Move the *.dcm* file this instance references to some target
-        destination.
+        destination, using the placement strategy configured by the
+        *DICOM_FILE_PLACEMENT* setting (see
+        :func:`~django_dicom.models.utils.placement.place_file`).
 
         Parameters
         ----------
@@ -212,13 +252,9 @@ class Image(DicomEntity):
             Destination path
         """
         target = Path(settings.MEDIA_ROOT, target)
-        target.parent.mkdir(parents=True, exist_ok=True)
+        make_directory(target.parent)
         dcm_path = self.dcm.name if os.getenv("USE_S3") else self.dcm.path
-        p = Path(dcm_path)
-        if getattr(settings, "KEEP_ORIGINAL_DICOM", False):
-            shutil.copy(str(p), str(target))
-        else:
-            p.rename(target)
+        place_file(Path(dcm_path), target)
         self.dcm = str(target)
 
     @property
@@ -248,6 +284,44 @@ class Image(DicomEntity):
                     self._instance = dicom_parser.Image(dcm_path)
         return self._instance
 
+    @property
+    def dicom_header(self) -> DicomHeader:
+        """
+        Caches the created :class:`dicom_parser.header.Header` instance to
+        prevent multiple reads. The header is read without the pixel data,
+        which is only read if :attr:`instance` is accessed.
+
+        Returns
+        -------
+        :class:`dicom_parser.header.Header`
+            Image header information
+        """
+        if isinstance(self._instance, dicom_parser.Image):
+            return self._instance.header
+        if not isinstance(self._dicom_header, DicomHeader):
+            using_s3 = os.getenv("USE_S3")
+            dcm_path = self.dcm.name if using_s3 else self.dcm.path
+            self.dicom_header = read_header(dcm_path)
+        return self._dicom_header
+
+    @dicom_header.setter
+    def dicom_header(self, header: DicomHeader) -> None:
+        """
+        Sets an already read :class:`dicom_parser.header.Header` instance
+        (e.g. using :func:`~django_dicom.models.utils.utils.read_header`) and
+        stores any warnings raised when it was read.
+
+        Parameters
+        ----------
+        header : :class:`dicom_parser.header.Header`
+            Image header information
+        """
+        self._dicom_header = header
+        # Store raised warnings in the appropriate field
+        for warning in getattr(header, "warnings", []):
+            if warning not in self.warnings:
+                self.warnings += [warning]
+
     @property
     def sequence_type(self) -> str:
         """
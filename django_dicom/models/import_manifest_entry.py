@@ -0,0 +1,63 @@
+"""
+Definition of the :class:`ImportManifestEntry` class.
+"""
+from dicom_parser.utils.choice_enum import ChoiceEnum
+from django.db import models
+from django_dicom.models.managers.import_manifest_entry import (
+    ImportManifestEntryManager,
+)
+
+
+class ImportStatus(ChoiceEnum):
+    """
+    Represents the outcome of scanning a single file during a path import.
+    """
+
+    CREATED = "Created"
+    EXISTING = "Existing"
+    INVALID = "Invalid"
+
+
+class ImportManifestEntry(models.Model):
+    """
+    A model representing the last recorded scan of a single file by
+    :meth:`~django_dicom.models.managers.image.ImageManager.import_path`.
+    Files whose size and modification time match their entry are not read
+    again in later imports.
+    """
+
+    #: Absolute path of the scanned file.
+    path = models.CharField(max_length=1000, unique=True)
+
+    #: File size in bytes.
+    size = models.BigIntegerField()
+
+    #: File modification time in nanoseconds.
+    mtime = models.BigIntegerField()
+
+    #: SOP Instance UID of the imported image.
+    uid = models.CharField(
+        max_length=64, blank=True, null=True, verbose_name="SOP Instance UID"
+    )
+
+    #: Scan outcome.
+    status = models.CharField(max_length=8, choices=ImportStatus.choices())
+
+    #: Last time the file was scanned.
+    scanned = models.DateTimeField(auto_now=True)
+
+    objects = ImportManifestEntryManager()
+
+    class Meta:
+        verbose_name_plural = "Import manifest entries"
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of this instance.
+
+        Returns
+        -------
+        str
+            This instance's string representation
+        """
+        return self.path
@@ -2,15 +2,35 @@
 Definition of a custom :class:`~django.db.models.Manager` for the
 :class:`~django_dicom.models.data_element.DataElement` model.
 """
+from typing import List, Tuple
+
 from dicom_parser.data_element import DataElement as DicomDataElement
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django_dicom.exceptions import DicomImportError
 from django_dicom.models.data_element_definition import DataElementDefinition
 from django_dicom.models.managers.messages import DATA_ELEMENT_CREATION_FAILURE
+from django_dicom.models.utils.utils import ValueStorage, get_value_storage
+from django_dicom.models.values.compact_value import CompactValue
 from django_dicom.models.values.data_element_value import DataElementValue
 
 
+def get_value_manager():
+    """
+    Returns the manager used to get or create values according to the
+    *DICOM_VALUE_STORAGE* setting.
+
+    Returns
+    -------
+    Union[DataElementValueManager, CompactValueManager]
+        Value manager
+    """
+
+    if get_value_storage() is ValueStorage.COMPACT:
+        return CompactValue.objects
+    return DataElementValue.objects
+
+
 class DataElementManager(models.Manager):
     """
     Custom :class:`~django.db.models.Manager` for the
@@ -44,8 +64,8 @@ class DataElementManager(models.Manager):
         """
 
         new_instance = self.create(header=header, definition=definition)
-        value, _ = DataElementValue.objects.from_dicom_parser(data_element)
-        new_instance._values.set(value)
+        value, _ = get_value_manager().from_dicom_parser(data_element)
+        new_instance.set_value_instances(value)
         return new_instance
 
     def from_dicom_parser(self, header, data_element: DicomDataElement):
@@ -78,3 +98,61 @@ class DataElementManager(models.Manager):
                     data_element=data_element, exception=exception
                 )
                 raise DicomImportError(message)
+
+    def bulk_from_dicom_parser(
+        self, data_elements: List[Tuple[object, DicomDataElement]]
+    ) -> list:
+        """
+        Creates new instances for multiple headers at once. Definitions,
+        values, data elements and the relationships between data elements and
+        values are each created using a handful of queries (rather than a few
+        queries per data element).
+
+        Parameters
+        ----------
+        data_elements : List[Tuple[Header, DicomDataElement]]
+            Tuples of the header each created data element should be associated
+            with and a dicom_parser
+            :class:`~dicom_parser.data_element.DataElement` instance
+
+        Returns
+        -------
+        List[DataElement]
+            The created instances
+        """
+
+        dicom_elements = [data_element for _, data_element in data_elements]
+        definitions = DataElementDefinition.objects.bulk_from_dicom_parser(
+            dicom_elements
+        )
+        values = get_value_manager().bulk_from_dicom_parser(dicom_elements)
+        instances = self.bulk_create(
+            [
+                self.model(header=header, definition=definition)
+                for (header, _), definition in zip(data_elements, definitions)
+            ]
+        )
+        relations = {
+            (instance.id, value.id, isinstance(value, CompactValue))
+            for instance, element_values in zip(instances, values)
+            for value in element_values
+        }
+        MultiTableThrough = self.model._values.through
+        MultiTableThrough.objects.bulk_create(
+            [
+                MultiTableThrough(
+                    dataelement_id=element_id, dataelementvalue_id=value_id
+                )
+                for element_id, value_id, compact in sorted(relations)
+                if not compact
+            ]
+        )
+        CompactThrough = self.model._compact_values.through
+        CompactThrough.objects.bulk_create(
+            [
+                CompactThrough(dataelement_id=element_id, compactvalue_id=value_id)
+                for element_id, value_id, compact in sorted(relations)
+                if compact
+            ]
+        )
+        return instances
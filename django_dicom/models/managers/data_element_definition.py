@@ -3,8 +3,14 @@ Definition of a custom :class:`~django.db.models.Manager` for the
 :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
 model.
 """
+import operator
+import threading
+from functools import partial, reduce
+from typing import Dict, List, Tuple
+
 from dicom_parser.data_element import DataElement as DicomDataElement
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 
 
 def data_element_to_definition(data_element: DicomDataElement) -> dict:
@@ -37,13 +43,109 @@ def data_element_to_definition(data_element: DicomDataElement) -> dict:
     }
 
 
+def get_definition_key(definition: dict) -> Tuple[Tuple[str, str], str]:
+    """
+    Returns the (tag, keyword) pair identifying a data element definition.
+
+    Parameters
+    ----------
+    definition : dict
+        :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
+        instantiation keyword arguments
+
+    Returns
+    -------
+    Tuple[Tuple[str, str], str]
+        Definition registry key
+    """
+
+    return tuple(definition["tag"]), definition["keyword"]
+
+
 class DataElementDefinitionManager(models.Manager):
     """
     Custom :class:`~django.db.models.Manager` for the
     :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
     model.
+
+    Definitions are few and immutable, so their primary keys are kept in a
+    process-local registry keyed by (tag, keyword). The registry may be
+    pre-warmed using :meth:`warm_cache` and grows whenever a definition is
+    looked up or created. Entries are only registered once the transaction
+    they were read or created in has been committed.
     """
 
+    #: Process-local registry of definition primary keys by (tag, keyword).
+    _registry: Dict[Tuple[Tuple[str, str], str], int] = {}
+
+    #: Lock guarding updates of the definition registry.
+    _registry_lock = threading.Lock()
+
+    def _update_registry(self, entries: Dict[Tuple[Tuple[str, str], str], int]):
+        with self._registry_lock:
+            self._registry.update(entries)
+
+    def register(self, entries: Dict[Tuple[Tuple[str, str], str], int]) -> None:
+        """
+        Adds definition primary keys to the process-local registry once the
+        current transaction (if any) is committed, so that rolled back
+        definitions are never cached.
+
+        Parameters
+        ----------
+        entries : Dict[Tuple[Tuple[str, str], str], int]
+            Definition primary keys by (tag, keyword)
+        """
+
+        if entries:
+            callback = partial(self._update_registry, dict(entries))
+            transaction.on_commit(callback, using=self.db)
+
+    def warm_cache(self) -> None:
+        """
+        Registers all existing definitions in the process-local registry.
+        """
+
+        entries = {
+            (tuple(tag), keyword): pk
+            for pk, tag, keyword in self.values_list("id", "tag", "keyword")
+        }
+        self.register(entries)
+
+    def clear_cache(self) -> None:
+        """
+        Clears the process-local definition registry.
+        """
+
+        with self._registry_lock:
+            self._registry.clear()
+
+    def from_registry(self, definition: dict):
+        """
+        Returns a
+        :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
+        instance for a registered definition without querying the database.
+
+        Parameters
+        ----------
+        definition : dict
+            :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
+            instantiation keyword arguments
+
+        Returns
+        -------
+        :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
+            Registered definition, or None if not registered
+        """
+
+        pk = self._registry.get(get_definition_key(definition))
+        if pk is None:
+            return None
+        instance = self.model(id=pk, **definition)
+        instance._state.adding = False
+        instance._state.db = self.db
+        return instance
+
     def from_dicom_parser(self, data_element: DicomDataElement) -> tuple:
         """
         Gets or creates a
@@ -65,9 +167,80 @@ class DataElementDefinitionManager(models.Manager):
         """
 
         definition = data_element_to_definition(data_element)
+        registered = self.from_registry(definition)
+        if registered is not None:
+            return registered, False
+        lookup = {"tag": definition["tag"], "keyword": definition["keyword"]}
         try:
-            existing = self.get(tag=definition["tag"], keyword=definition["keyword"])
-            return existing, False
+            instance, created = self.get(**lookup), False
         except self.model.DoesNotExist:
-            new = self.create(**definition)
-            return new, True
+            try:
+                with transaction.atomic(using=self.db):
+                    instance, created = self.create(**definition), True
+            except IntegrityError:
+                # Created concurrently by another process.
+                instance, created = self.get(**lookup), False
+        self.register({get_definition_key(definition): instance.id})
+        return instance, created
+
+    def bulk_from_dicom_parser(self, data_elements: List[DicomDataElement]) -> list:
+        """
+        Gets or creates the
+        :class:`~django_dicom.models.data_element_definition.DataElementDefinition`
+        instances of multiple dicom_parser_
+        :class:`~dicom_parser.data_element.DataElement` instances. Registered
+        definitions require no queries, the rest are looked up using a single
+        query and created using a single insert.
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        data_elements : List[DicomDataElement]
+            Objects representing data elements in memory
+
+        Returns
+        -------
+        List[DataElementDefinition]
+            Data element definitions, ordered to match *data_elements*
+        """
+
+        definitions = [data_element_to_definition(element) for element in data_elements]
+        keys = [get_definition_key(definition) for definition in definitions]
+        unique = dict(zip(keys, definitions))
+        existing = {}
+        for key, definition in unique.items():
+            registered = self.from_registry(definition)
+            if registered is not None:
+                existing[key] = registered
+        unregistered = [key for key in unique if key not in existing]
+        if unregistered:
+            query = reduce(
+                operator.or_,
+                [Q(tag=list(tag), keyword=keyword) for tag, keyword in unregistered],
+            )
+            found = {
+                (tuple(definition.tag), definition.keyword): definition
+                for definition in self.filter(query)
+            }
+            missing = [key for key in unregistered if key not in found]
+            if missing:
+                # Ignore conflicts in case definitions were created
+                # concurrently and re-query to retrieve primary keys.
+                self.bulk_create(
+                    [self.model(**unique[key]) for key in missing],
+                    ignore_conflicts=True,
+                )
+                query = reduce(
+                    operator.or_,
+                    [Q(tag=list(tag), keyword=keyword) for tag, keyword in missing],
+                )
+                found.update(
+                    {
+                        (tuple(definition.tag), definition.keyword): definition
+                        for definition in self.filter(query)
+                    }
+                )
+            self.register({key: found[key].id for key in unregistered})
+            existing.update({key: found[key] for key in unregistered})
+        return [existing[key] for key in keys]
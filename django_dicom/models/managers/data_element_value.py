@@ -11,15 +11,69 @@ django-model-utils_\'s `InheritanceManager documentation`_.
 .. _InheritanceManager documentation:
    https://django-model-utils.readthedocs.io/en/latest/managers.html#inheritancemanager
 """
-from typing import Tuple
+import hashlib
+import json
+from collections import defaultdict
+from typing import List, Tuple
 
+import numpy as np
 from dicom_parser.data_element import DataElement as DicomDataElement
 from dicom_parser.utils.value_representation import ValueRepresentation
-from django.db import DataError
+from django.db import DataError, IntegrityError, transaction
 from django_dicom.models.utils.meta import get_model
-from django_dicom.models.values.vr_to_model import get_value_model
+from django_dicom.models.values.vr_to_model import get_value_model, is_array_element
 from model_utils.managers import InheritanceManager
 
+#: Fields used to identify a unique value instance.
+VALUE_FIELDS = "index", "raw", "value", "warnings"
+
+#: Maximal number of value instances to look up in a single query when
+#: getting or creating values in bulk.
+LOOKUP_CHUNK_SIZE = 500
+
+#: Maximal number of attempts to create values in bulk when conflicting with
+#: values created concurrently.
+MAX_CONFLICT_ATTEMPTS = 3
+
+
+def get_value_hash(ValueModel, values: dict) -> str:
+    """
+    Returns a SHA-256 digest of the database representation of the provided
+    field values, used to identify identical value instances of some
+    :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    subclass.
+
+    Parameters
+    ----------
+    ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        Some
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass
+    values : dict
+        Field names and values (see :attr:`VALUE_FIELDS`)
+
+    Returns
+    -------
+    str
+        Hexadecimal content hash
+
+
+    .. # noqa: E501
+    """
+    prepared = {}
+    for name in VALUE_FIELDS:
+        field = ValueModel._meta.get_field(name)
+        value = values.get(name)
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        value = field.get_prep_value(value)
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        prepared[name] = value
+    content = json.dumps(prepared, sort_keys=True, default=repr)
+    content = f"{ValueModel._meta.label}:{content}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
 
 class DataElementValueManager(InheritanceManager):
     """
@@ -28,6 +82,59 @@ class DataElementValueManager(InheritanceManager):
     model.
     """
 
+    def get_invalid_data_warning(
+        self, data_element: DicomDataElement, error: Exception
+    ) -> str:
+        """
+        Returns the warning logged for data elements whose value could not be
+        read.
+
+        Parameters
+        ----------
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+        error : Exception
+            The raised exception
+
+        Returns
+        -------
+        str
+            Warning message
+        """
+
+        raw = data_element.raw.value
+        value = data_element.value
+        info = f"\nRaw value:\n{raw}\nParsed value:\n{value}"
+        return str(error) + info
+
+    def get_or_create_value(self, ValueModel, **kwargs) -> Tuple:
+        """
+        Gets or creates a *ValueModel* instance with the provided field
+        values. Existing instances are looked up using their
+        :attr:`~django_dicom.models.values.data_element_value.DataElementValue.content_hash`
+        (a single unique index lookup).
+
+        Parameters
+        ----------
+        ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            Some
+            :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass used to instatiate values
+
+        Returns
+        -------
+        Tuple[DataElementValue, bool]
+            data_element_value, created
+
+
+        .. # noqa: E501
+        """
+
+        content_hash = get_value_hash(ValueModel, kwargs)
+        return ValueModel.objects.get_or_create(
+            content_hash=content_hash, defaults=kwargs
+        )
+
     def handle_invalid_data(
         self, ValueModel, data_element: DicomDataElement, error: Exception
     ) -> Tuple:
@@ -64,12 +171,9 @@ class DataElementValueManager(InheritanceManager):
         .. # noqa: E501
         """
 
-        raw = data_element.raw.value
-        value = data_element.value
-        info = f"\nRaw value:\n{raw}\nParsed value:\n{value}"
-        warning = str(error) + info
-        value, created = ValueModel.objects.get_or_create(
-            raw=None, value=None, warnings=[warning]
+        warning = self.get_invalid_data_warning(data_element, error)
+        value, created = self.get_or_create_value(
+            ValueModel, index=None, raw=None, value=None, warnings=[warning]
         )
         return [value], created
 
@@ -96,7 +200,8 @@ class DataElementValueManager(InheritanceManager):
         .. # noqa: E501
         """
 
-        value, created = ValueModel.objects.get_or_create(
+        value, created = self.get_or_create_value(
+            ValueModel,
             index=None,
             raw=data_element.raw.value,
             value=data_element.value,
@@ -131,7 +236,8 @@ class DataElementValueManager(InheritanceManager):
         """
 
         tuples = [
-            ValueModel.objects.get_or_create(
+            self.get_or_create_value(
+                ValueModel,
                 index=i,
                 raw=data_element.raw.value[i],
                 value=data_element.value[i],
@@ -143,6 +249,35 @@ class DataElementValueManager(InheritanceManager):
         created = any([value[1] for value in tuples])
         return values, created
 
+    def handle_array_value(self, ValueModel, data_element: DicomDataElement) -> Tuple:
+        """
+        Handles numeric data elements with a
+        :attr:`~dicom_parser.data_element.DataElement.value_multiplicity`
+        greater than 1, which are saved as a single array value (see
+        :func:`~django_dicom.models.values.vr_to_model.is_array_element`).
+
+        Parameters
+        ----------
+        ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            Some
+            :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass used to instatiate values
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+
+        Returns
+        -------
+        Tuple[List[DataElementValue], bool]
+            data_element_value, created
+
+
+        .. # noqa: E501
+        """
+
+        (kwargs,) = self.get_array_kwargs(data_element)
+        value, created = self.get_or_create_value(ValueModel, **kwargs)
+        return [value], created
+
     def handle_no_value(self, ValueModel) -> Tuple:
         """
         Handles data elements with a
@@ -170,8 +305,8 @@ class DataElementValueManager(InheritanceManager):
         .. # noqa: E501
         """
 
-        value, created = ValueModel.objects.get_or_create(
-            index=None, raw=None, value=None, warnings=None
+        value, created = self.get_or_create_value(
+            ValueModel, index=None, raw=None, value=None, warnings=None
         )
         return [value], created
 
@@ -209,6 +344,8 @@ class DataElementValueManager(InheritanceManager):
 
         if data_element.value_multiplicity == 1:
             return self.handle_single_value(ValueModel, data_element)
+        elif is_array_element(data_element):
+            return self.handle_array_value(ValueModel, data_element)
         elif data_element.value_multiplicity > 1:
             return self.handle_multiple_values(ValueModel, data_element)
         else:
@@ -269,3 +406,241 @@ class DataElementValueManager(InheritanceManager):
         # Handle all other data elements.
         else:
             return self.get_or_create_from_nonsequence(data_element)
+
+    def get_array_kwargs(self, data_element: DicomDataElement) -> List[dict]:
+        """
+        Returns the keyword arguments required to get or create the single
+        array value representing a numeric data element with a value
+        multiplicity greater than 1.
+
+        Parameters
+        ----------
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+
+        Returns
+        -------
+        List[dict]
+            Value instantiation keyword arguments
+        """
+
+        return [
+            {
+                "index": None,
+                "raw": [str(raw) for raw in data_element.raw.value],
+                "value": np.asarray(data_element.value),
+                "warnings": data_element.warnings,
+            }
+        ]
+
+    def get_nonsequence_kwargs(self, data_element: DicomDataElement) -> List[dict]:
+        """
+        Returns the keyword arguments required to get or create the
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass instances representing a non-*Sequence of Items*
+        dicom_parser_ :class:`~dicom_parser.data_element.DataElement`.
+        The returned dictionaries match the lookups used by
+        :meth:`handle_value_multiplicity` and :meth:`handle_invalid_data`.
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+
+        Returns
+        -------
+        List[dict]
+            Value instantiation keyword arguments, ordered by index
+        """
+
+        try:
+            if data_element.value_multiplicity == 1:
+                return [
+                    {
+                        "index": None,
+                        "raw": data_element.raw.value,
+                        "value": data_element.value,
+                        "warnings": data_element.warnings,
+                    }
+                ]
+            elif is_array_element(data_element):
+                return self.get_array_kwargs(data_element)
+            elif data_element.value_multiplicity > 1:
+                return [
+                    {
+                        "index": i,
+                        "raw": data_element.raw.value[i],
+                        "value": data_element.value[i],
+                        "warnings": data_element.warnings,
+                    }
+                    for i in range(len(data_element.raw.value))
+                ]
+            return [{"index": None, "raw": None, "value": None, "warnings": None}]
+        except ValueError as error:
+            warning = self.get_invalid_data_warning(data_element, error)
+            return [{"index": None, "raw": None, "value": None, "warnings": [warning]}]
+
+    def bulk_create_values(self, ValueModel, instances: list) -> list:
+        """
+        Creates the provided (unsaved)
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass instances using one query for the parent table and one for
+        the child table.
+
+        Django's :meth:`~django.db.models.query.QuerySet.bulk_create` does not
+        support multi-table inherited models, so the parent rows are created
+        first and their primary keys are then used to insert the child rows.
+
+        Parameters
+        ----------
+        ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            Some
+            :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass
+        instances : list
+            Unsaved *ValueModel* instances
+
+        Returns
+        -------
+        list
+            Created instances
+
+
+        .. # noqa: E501
+        """
+
+        if not instances:
+            return []
+        DataElementValue = get_model("DataElementValue")
+        parent_link = ValueModel._meta.get_ancestor_link(DataElementValue)
+        parent_fields = [
+            field
+            for field in DataElementValue._meta.concrete_fields
+            if not field.primary_key
+        ]
+        parents = [
+            DataElementValue(
+                **{
+                    field.attname: getattr(instance, field.attname)
+                    for field in parent_fields
+                }
+            )
+            for instance in instances
+        ]
+        DataElementValue.objects.using(self.db).bulk_create(parents)
+        for instance, parent in zip(instances, parents):
+            setattr(instance, DataElementValue._meta.pk.attname, parent.pk)
+            setattr(instance, parent_link.attname, parent.pk)
+        fields = ValueModel._meta.local_concrete_fields
+        ValueModel._base_manager._insert(instances, fields=fields, using=self.db)
+        for instance in instances:
+            instance._state.adding = False
+            instance._state.db = self.db
+        return instances
+
+    def bulk_get_or_create(self, ValueModel, values: List[dict]) -> list:
+        """
+        Gets or creates *ValueModel* instances for all of the provided
+        instantiation keyword arguments. Existing instances are retrieved by
+        their
+        :attr:`~django_dicom.models.values.data_element_value.DataElementValue.content_hash`
+        and any missing instances are then created in bulk.
+
+        Parameters
+        ----------
+        ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            Some
+            :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass
+        values : List[dict]
+            Value instantiation keyword arguments
+
+        Returns
+        -------
+        list
+            *ValueModel* instances, ordered to match *values*
+
+
+        .. # noqa: E501
+        """
+
+        hashes = [get_value_hash(ValueModel, kwargs) for kwargs in values]
+        unique = dict(zip(hashes, values))
+        existing = {}
+        missing = list(unique)
+        for attempt in range(1, MAX_CONFLICT_ATTEMPTS + 1):
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                end = start + LOOKUP_CHUNK_SIZE
+                queryset = ValueModel.objects.using(self.db).filter(
+                    content_hash__in=missing[start:end]
+                )
+                existing.update(
+                    {instance.content_hash: instance for instance in queryset}
+                )
+            missing = [
+                content_hash for content_hash in missing if content_hash not in existing
+            ]
+            new_instances = [
+                ValueModel(content_hash=content_hash, **unique[content_hash])
+                for content_hash in missing
+            ]
+            try:
+                # Identical values may be created concurrently by other
+                # importers, in which case they are looked up again.
+                with transaction.atomic(using=self.db):
+                    created = self.bulk_create_values(ValueModel, new_instances)
+            except IntegrityError:
+                if attempt == MAX_CONFLICT_ATTEMPTS:
+                    raise
+            else:
+                existing.update(zip(missing, created))
+                break
+        return [existing[content_hash] for content_hash in hashes]
+
+    def bulk_from_dicom_parser(self, data_elements: List[DicomDataElement]) -> list:
+        """
+        Gets or creates the
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass instances of multiple dicom_parser_
+        :class:`~dicom_parser.data_element.DataElement` instances at once.
+        Values are grouped by *ValueModel* so that each value table is
+        queried and written to only once.
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        data_elements : List[DicomDataElement]
+            Objects representing data elements in memory
+
+        Returns
+        -------
+        List[List[DataElementValue]]
+            The values of each of the provided data elements
+        """
+
+        results = [[] for _ in data_elements]
+        grouped = defaultdict(list)
+        sequences = []
+        for i, data_element in enumerate(data_elements):
+            if data_element.VALUE_REPRESENTATION == ValueRepresentation.SQ:
+                sequences.append((i, data_element))
+                continue
+            ValueModel = get_value_model(data_element)
+            for kwargs in self.get_nonsequence_kwargs(data_element):
+                grouped[ValueModel].append((i, kwargs))
+        if sequences:
+            SequenceOfItems = get_model("SequenceOfItems")
+            instances = SequenceOfItems.objects.bulk_from_dicom_parser(
+                [data_element for _, data_element in sequences]
+            )
+            for (i, _), instance in zip(sequences, instances):
+                results[i] = [instance]
+        for ValueModel, items in grouped.items():
+            values = [kwargs for _, kwargs in items]
+            instances = self.bulk_get_or_create(ValueModel, values)
+            for (i, _), instance in zip(items, instances):
+                results[i].append(instance)
+        return results
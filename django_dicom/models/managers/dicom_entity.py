@@ -5,7 +5,9 @@ Definition of a custom :class:`~django.db.models.Manager` for the
 from typing import Tuple
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import models, transaction
+from django_dicom.models.utils.entity_cache import get_entity_cache
+from django_dicom.models.utils.locks import lock_uid
 
 
 class DicomEntityManager(models.Manager):
@@ -16,7 +18,11 @@ class DicomEntityManager(models.Manager):
 
     def from_header(self, header) -> Tuple:
         """
-        Get or create an instance using the provided header.
+        Get or create an instance using the provided header. If an entity
+        cache is active (see
+        :func:`~django_dicom.models.utils.entity_cache.entity_cache`), each
+        entity is only looked up once. Creation is serialized across
+        concurrent importers using an advisory lock keyed by the entity's UID.
 
         Parameters
         ----------
@@ -30,11 +36,22 @@ class DicomEntityManager(models.Manager):
         """
 
         uid = header.get_entity_uid(self.model)
+        cache = get_entity_cache()
+        if cache is not None:
+            cached = cache.get(self.model, uid)
+            if cached is not None:
+                return cached, False
         try:
-            existing = self.get(uid=uid)
+            instance, created = self.get(uid=uid), False
         except ObjectDoesNotExist:
-            new_instance = self.model()
-            new_instance.save(header=header)
-            return new_instance, True
-        else:
-            return existing, False
+            with transaction.atomic(using=self.db):
+                lock_uid(self.model, uid, using=self.db)
+                try:
+                    # Created concurrently while waiting for the lock.
+                    instance, created = self.get(uid=uid), False
+                except ObjectDoesNotExist:
+                    instance, created = self.model(), True
+                    instance.save(header=header)
+        if cache is not None:
+            cache.add(instance)
+        return instance, created
@@ -2,12 +2,57 @@
 Definition of a custom :class:`~django.db.models.Manager` for the
 :class:`~django_dicom.models.header.Header` model.
 """
+from typing import Iterable, List, Tuple
+
+from dicom_parser.data_element import DataElement as DicomDataElement
 from dicom_parser.header import Header as DicomHeader
-from django.db import models, transaction
+from dicom_parser.utils.value_representation import ValueRepresentation
+from django.db import DataError, models, transaction
 from django_dicom.exceptions import DicomImportError
 from django_dicom.models.data_element import DataElement
+from django_dicom.models.managers.data_element_definition import (
+    data_element_to_definition,
+    get_definition_key,
+)
+from django_dicom.models.managers.data_element_value import get_value_hash
 from django_dicom.models.managers.messages import HEADER_CREATION_FAILURE
-from django_dicom.models.utils.utils import check_element_inclusion
+from django_dicom.models.utils.import_profile import (
+    ImportProfile,
+    get_import_profile,
+)
+from django_dicom.models.values.data_element_value import DataElementValue
+from django_dicom.models.values.vr_to_model import get_value_model
+
+
+def get_element_signature(data_element: DicomDataElement) -> frozenset:
+    """
+    Returns the content hashes of the values a dicom_parser_
+    :class:`~dicom_parser.data_element.DataElement` would be saved as. Two data
+    elements with the same definition and signature are associated with the
+    same
+    :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    instances.
+
+    .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+    Parameters
+    ----------
+    data_element : :class:`dicom_parser.data_element.DataElement`
+        Object representing a single data element in memory
+
+    Returns
+    -------
+    frozenset
+        Value content hashes, or None for *Sequence of Items* elements
+    """
+
+    if data_element.VALUE_REPRESENTATION == ValueRepresentation.SQ:
+        return None
+    ValueModel = get_value_model(data_element)
+    return frozenset(
+        get_value_hash(ValueModel, kwargs)
+        for kwargs in DataElementValue.objects.get_nonsequence_kwargs(data_element)
+    )
 
 
 class HeaderManager(models.Manager):
@@ -16,17 +61,73 @@ class HeaderManager(models.Manager):
     :class:`~django_dicom.models.header.Header` model.
     """
 
-    def from_dicom_parser(self, header: DicomHeader, **kwargs):
+    def get_delta(
+        self, header: DicomHeader, base=None, profile: ImportProfile = None
+    ) -> Tuple[list, list]:
+        """
+        Returns the included data elements of *header* that should be saved
+        if it is stored relative to the *base* header, i.e. the elements
+        that are missing from *base* or differ from it, as well as the
+        definitions of *base* elements that *header* does not contain.
+
+        Parameters
+        ----------
+        header : :class:`dicom_parser.header.Header`
+            Object representing an entire DICOM header in memory
+        base : :class:`~django_dicom.models.header.Header`, optional
+            Common header to store *header* relative to, by default None
+        profile : :class:`~django_dicom.models.utils.import_profile.ImportProfile`, optional
+            Import profile used to filter the header's data elements, by
+            default None (see
+            :func:`~django_dicom.models.utils.import_profile.get_import_profile`)
+
+        Returns
+        -------
+        Tuple[list, list]
+            Data elements to save, omitted definition IDs
+
+
+        .. # noqa: E501
+        """
+
+        profile = profile or get_import_profile()
+        data_elements = profile.filter(header)
+        if base is None:
+            return data_elements, []
+        signatures = base.get_element_signatures()
+        delta, included = [], set()
+        for data_element in data_elements:
+            definition = data_element_to_definition(data_element)
+            key = get_definition_key(definition)
+            included.add(key)
+            signature = get_element_signature(data_element)
+            _, base_signature = signatures.get(key, (None, None))
+            if signature is None or signature != base_signature:
+                delta.append(data_element)
+        omitted = [
+            definition_id
+            for key, (definition_id, _) in signatures.items()
+            if key not in included
+        ]
+        return delta, omitted
+
+    def from_dicom_parser(self, header: DicomHeader, base=None, **kwargs):
         """
         Creates a new instance from a dicom_parser_
         :class:`dicom_parser.header.Header`.
 
+        If a *base* header is provided, only the data elements that differ
+        from it are saved (see :meth:`get_delta`), and *base* elements missing
+        from *header* are saved without any values to mark their omission.
+
         .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
 
         Parameters
         ----------
         header : :class:`dicom_parser.header.Header`
             Object representing an entire DICOM header in memory
+        base : :class:`~django_dicom.models.header.Header`, optional
+            Common header to store *header* relative to, by default None
 
         Returns
         -------
@@ -39,16 +140,91 @@ class HeaderManager(models.Manager):
             DICOM header read error
         """
 
+        data_elements, omitted = self.get_delta(header, base)
         with transaction.atomic():
-            new_instance = self.create(**kwargs)
-            for data_element in header.data_elements:
-                included_element = check_element_inclusion(data_element)
-                if included_element:
-                    try:
-                        DataElement.objects.from_dicom_parser(
-                            new_instance, data_element
-                        )
-                    except DicomImportError as exception:
-                        message = HEADER_CREATION_FAILURE.format(exception=exception)
-                        raise DicomImportError(message)
+            new_instance = self.create(base=base, **kwargs)
+            # Cache the parsed header to prevent re-reading the file.
+            new_instance._instance = header
+            for data_element in data_elements:
+                try:
+                    DataElement.objects.from_dicom_parser(new_instance, data_element)
+                except DicomImportError as exception:
+                    message = HEADER_CREATION_FAILURE.format(exception=exception)
+                    raise DicomImportError(message)
+            DataElement.objects.bulk_create(
+                [
+                    DataElement(header=new_instance, definition_id=definition_id)
+                    for definition_id in omitted
+                ]
+            )
         return new_instance
+
+    def bulk_from_dicom_parser(
+        self, headers: Iterable[DicomHeader], base=None, **kwargs
+    ) -> List:
+        """
+        Creates new instances from a batch of dicom_parser_
+        :class:`dicom_parser.header.Header` instances.
+
+        Rather than creating each data element and value separately (as done
+        by :meth:`from_dicom_parser`), all of the batch's included data
+        elements are written using a handful of bulk queries. The resulting
+        rows are identical to the ones created by :meth:`from_dicom_parser`.
+        If the database rejects any value (e.g. a value exceeding its field's
+        maximal length), the batch is rolled back and imported header by
+        header instead, so that invalid values are handled as usual. If a
+        *base* header is provided, each header is stored relative to it (see
+        :meth:`from_dicom_parser`).
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        headers : Iterable[:class:`dicom_parser.header.Header`]
+            Objects representing entire DICOM headers in memory
+        base : :class:`~django_dicom.models.header.Header`, optional
+            Common header to store *headers* relative to, by default None
+
+        Returns
+        -------
+        List[:class:`django_dicom.models.header.Header`]
+            Created instances, ordered to match *headers*
+
+        Raises
+        ------
+        DicomImportError
+            DICOM header read error
+        """
+
+        headers = list(headers)
+        profile = get_import_profile()
+        deltas = [self.get_delta(header, base, profile=profile) for header in headers]
+        try:
+            with transaction.atomic():
+                new_instances = self.bulk_create(
+                    [self.model(base=base, **kwargs) for _ in headers]
+                )
+                data_elements = [
+                    (new_instance, data_element)
+                    for new_instance, (delta, _) in zip(new_instances, deltas)
+                    for data_element in delta
+                ]
+                DataElement.objects.bulk_from_dicom_parser(data_elements)
+                DataElement.objects.bulk_create(
+                    [
+                        DataElement(header=new_instance, definition_id=definition_id)
+                        for new_instance, (_, omitted) in zip(new_instances, deltas)
+                        for definition_id in omitted
+                    ]
+                )
+        except DataError:
+            return [
+                self.from_dicom_parser(header, base=base, **kwargs)
+                for header in headers
+            ]
+        except TypeError as exception:
+            message = HEADER_CREATION_FAILURE.format(exception=exception)
+            raise DicomImportError(message)
+        for new_instance, header in zip(new_instances, headers):
+            new_instance._instance = header
+        return new_instances
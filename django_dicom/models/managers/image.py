@@ -2,9 +2,14 @@
 Definition of the :class:`ImageManager` class.
 """
 import logging
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from io import BufferedReader
+from itertools import islice
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Tuple, Union
 
 from dicom_parser.header import Header as DicomHeader
 from django.conf import settings
@@ -17,10 +22,75 @@ from pydicom.errors import InvalidDicomError
 
 from django_dicom.models.managers.dicom_entity import DicomEntityManager
 from django_dicom.models.managers.messages import IMPORT_ERROR, PATIENT_UID_MISMATCH
+from django_dicom.models.utils import (
+    FilePlacement,
+    get_file_placement,
+    read_header,
+    read_identifiers,
+)
+from django_dicom.models.utils.entity_cache import clear_entity_cache, entity_cache
+from django_dicom.models.utils.header_batch import header_batch
+from django_dicom.models.utils.import_profile import import_profile
+from django_dicom.models.utils.locks import lock_uid, lock_uids
+from django_dicom.models.utils.meta import get_model
+from django_dicom.models.utils.placement import (
+    directory_cache,
+    make_directory,
+    place_file,
+)
 from django_dicom.models.utils.progressbar import create_progressbar
+from django_dicom.utils.discovery import ArchiveMember, iter_archive, iter_files
+from django_dicom.utils.networking import ReceivedDataset
 
 IMPORT_LOGGER = logging.getLogger("data_import")
 
+#: Records imported from data held in memory rather than from a local file.
+IN_MEMORY_RECORDS = ArchiveMember, ReceivedDataset
+
+
+def merge_existing(results: Iterator[tuple], existing: deque) -> Iterator[tuple]:
+    """
+    Merges import results with the existing images skipped while the results
+    were being generated (see :meth:`ImageManager.skip_existing`).
+
+    Parameters
+    ----------
+    results : Iterator[tuple]
+        Path, header, image ID, database patient UID and created tuples
+    existing : deque
+        Path, identifiers and database patient UID tuples of skipped files
+
+    Yields
+    -------
+    tuple
+        path, header, image_id, db_patient_uid, created
+    """
+    for result in results:
+        while existing:
+            path, identifiers, db_patient_uid = existing.popleft()
+            yield path, identifiers, None, db_patient_uid, False
+        yield result
+    while existing:
+        path, identifiers, db_patient_uid = existing.popleft()
+        yield path, identifiers, None, db_patient_uid, False
+
+
+def read_member_header(member: ArchiveMember) -> DicomHeader:
+    """
+    Reads the header of an archive member (see :meth:`ImageManager.read_headers`).
+
+    Parameters
+    ----------
+    member : :class:`~django_dicom.utils.discovery.ArchiveMember`
+        Archive member
+
+    Returns
+    -------
+    :class:`dicom_parser.header.Header`
+        Header information
+    """
+    return read_header(member.data)
+
 
 class ImageManager(DicomEntityManager):
     """
@@ -32,6 +102,13 @@ class ImageManager(DicomEntityManager):
     #: read.
     TEMP_DCM_FILE_NAME = "tmp.dcm"
 
+    #: Maximal number of headers each worker process may have read (or be
+    #: reading) ahead of the database writer when importing in parallel.
+    READ_AHEAD_PER_WORKER = 4
+
+    #: Number of files to look up existing images for using a single query.
+    EXISTING_LOOKUP_CHUNK_SIZE = 500
+
     def store_image_data(self, image_data: BufferedReader) -> Path:
         """
         Stores binary image data to a temporary local path under the
@@ -55,7 +132,9 @@ class ImageManager(DicomEntityManager):
         relative_path = default_storage.save(self.TEMP_DCM_FILE_NAME, content)
         return Path(settings.MEDIA_ROOT, relative_path)
 
-    def create_from_dcm(self, path: Path, autoremove: bool = True):
+    def create_from_dcm(
+        self, path: Path, autoremove: bool = True, header: DicomHeader = None
+    ):
         """
         Creates an :class:`~django_dicom.models.image.Image` instance from a
         given path.
@@ -67,6 +146,9 @@ class ImageManager(DicomEntityManager):
         autoremove : bool, optional
             Whether to remove the local copy of the *.dcm* file under
             MEDIA_ROOT if creation fails, by default True
+        header : :class:`dicom_parser.header.Header`, optional
+            The file's already read header information, by default None (read
+            from *path*)
 
         Returns
         -------
@@ -74,16 +156,22 @@ class ImageManager(DicomEntityManager):
             The created image
         """
 
-        try:
-            return self.create(dcm=str(path))
-
+        new_instance = self.model(dcm=str(path))
         # In case the file is located outside MEDIA_ROOT (and therefore is
-        # inaccessible), create an accessible copy and then initialize Image
-        # instance.
-        except SuspiciousFileOperation:
-            with open(path, "rb") as data:
-                local_path = self.store_image_data(data)
-            return self.create_from_dcm(local_path, autoremove=autoremove)
+        # inaccessible), place an accessible version directly at its default
+        # path and then initialize Image instance. This is checked before
+        # saving, as any entities created by a failed save are rolled back.
+        if not os.getenv("USE_S3"):
+            try:
+                new_instance.dcm.path
+            except SuspiciousFileOperation:
+                return self.create_from_external_dcm(path, header=header)
+        try:
+            if header is not None:
+                new_instance.dicom_header = header
+            with transaction.atomic(using=self.db):
+                new_instance.save(force_insert=True, using=self.db)
+            return new_instance
 
         # If the creation failed, remove the local copy and re-raise the
         # exception.
@@ -93,7 +181,50 @@ class ImageManager(DicomEntityManager):
             message = IMPORT_ERROR.format(path=path, exception=e)
             raise RuntimeError(message)
 
-    def get_or_create_from_dcm(self, path: Path, autoremove: bool = True) -> Tuple:
+    def create_from_external_dcm(self, path: Path, header: DicomHeader = None):
+        """
+        Creates an :class:`~django_dicom.models.image.Image` instance from a
+        *.dcm* file located outside MEDIA_ROOT. The file is placed directly at
+        the image's default path using the configured placement strategy (see
+        :func:`~django_dicom.models.utils.placement.place_file`), except that
+        renames are replaced with copies so that the original file is kept.
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path`
+            Local *.dcm* file path outside MEDIA_ROOT
+        header : :class:`dicom_parser.header.Header`, optional
+            The file's already read header information, by default None (read
+            from *path*)
+
+        Returns
+        -------
+        :class:`~django_dicom.models.image.Image`
+            The created image
+        """
+
+        new_instance = self.model()
+        new_instance.dicom_header = header or read_header(path)
+        target = Path(settings.MEDIA_ROOT, new_instance.get_default_path())
+        make_directory(target.parent)
+        placement = get_file_placement()
+        if placement is FilePlacement.RENAME:
+            placement = FilePlacement.COPY
+        place_file(path, target, placement)
+        new_instance.dcm = str(target)
+        try:
+            with transaction.atomic(using=self.db):
+                new_instance.save(force_insert=True, rename=False, using=self.db)
+        except Exception as e:
+            if target.is_file():
+                target.unlink()
+            message = IMPORT_ERROR.format(path=path, exception=e)
+            raise RuntimeError(message)
+        return new_instance
+
+    def get_or_create_from_dcm(
+        self, path: Path, autoremove: bool = True, header: DicomHeader = None
+    ) -> Tuple:
         """
         Gets or creates an :class:`~django_dicom.models.image.Image` instance
         based on the contents of the provided *.dcm* path.
@@ -105,6 +236,9 @@ class ImageManager(DicomEntityManager):
         autoremove : bool, optional
             Whether to remove the local copy of the *.dcm* file under
             MEDIA_ROOT if creation fails, by default True
+        header : :class:`dicom_parser.header.Header`, optional
+            The file's already read header information, by default None (read
+            once from *path* and reused for the creation of the image)
 
         Returns
         -------
@@ -112,15 +246,130 @@ class ImageManager(DicomEntityManager):
             image, created
         """
 
-        header = DicomHeader(path)
+        if header is None:
+            header = read_header(path)
         uid = header.get("SOPInstanceUID")
         try:
-            existing = self.get(uid=uid)
+            return self.get(uid=uid), False
         except ObjectDoesNotExist:
-            new_instance = self.create_from_dcm(path, autoremove=autoremove)
-            return new_instance, True
-        else:
-            return existing, False
+            pass
+        # Serialize the creation of the image across concurrent importers.
+        with transaction.atomic(using=self.db):
+            lock_uid(self.model, uid, using=self.db)
+            try:
+                return self.get(uid=uid), False
+            except ObjectDoesNotExist:
+                new_instance = self.create_from_dcm(
+                    path, autoremove=autoremove, header=header
+                )
+                return new_instance, True
+
+    def write_image_data(self, image, data: bytes) -> Path:
+        """
+        Writes binary image data directly to the image's default path (see
+        :meth:`~django_dicom.models.image.Image.get_default_path`). The data
+        is written to a temporary file in the destination directory first
+        and then moved into place, so that partially written files are never
+        exposed.
+
+        Parameters
+        ----------
+        image : :class:`~django_dicom.models.image.Image`
+            Unsaved image with its header information set
+        data : bytes
+            Binary DICOM image data
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+            Path of the created file
+        """
+
+        target = Path(settings.MEDIA_ROOT, image.get_default_path())
+        make_directory(target.parent)
+        descriptor, temp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, target)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return target
+
+    def create_from_data(self, data: bytes, header: DicomHeader = None):
+        """
+        Creates an :class:`~django_dicom.models.image.Image` instance from
+        binary DICOM image data. The header is read from memory and the data
+        is written only once, to the image's default path.
+
+        Parameters
+        ----------
+        data : bytes
+            Binary DICOM image data
+        header : :class:`dicom_parser.header.Header`, optional
+            The data's already read header information, by default None (read
+            from *data*)
+
+        Returns
+        -------
+        :class:`~django_dicom.models.image.Image`
+            The created image
+        """
+
+        new_instance = self.model()
+        new_instance.dicom_header = header or read_header(data)
+        path = self.write_image_data(new_instance, data)
+        new_instance.dcm = str(path)
+        try:
+            with transaction.atomic(using=self.db):
+                new_instance.save(force_insert=True, rename=False, using=self.db)
+        except Exception as e:
+            if path.is_file():
+                path.unlink()
+            message = IMPORT_ERROR.format(path=path, exception=e)
+            raise RuntimeError(message)
+        return new_instance
+
+    def get_or_create_from_data(
+        self, data: Union[bytes, BinaryIO], header: DicomHeader = None
+    ) -> Tuple:
+        """
+        Gets or creates an :class:`~django_dicom.models.image.Image` instance
+        from binary DICOM image data (e.g. an upload or the output of some
+        in-process producer) without saving it to a temporary file first (see
+        :meth:`create_from_data`).
+
+        Parameters
+        ----------
+        data : Union[bytes, BinaryIO]
+            Binary DICOM image data or a binary file-like object
+        header : :class:`dicom_parser.header.Header`, optional
+            The data's already read header information, by default None (read
+            from *data*)
+
+        Returns
+        -------
+        Tuple[Image, bool]
+            image, created
+        """
+
+        if hasattr(data, "read"):
+            data = data.read()
+        if header is None:
+            header = read_header(data)
+        uid = header.get("SOPInstanceUID")
+        try:
+            return self.get(uid=uid), False
+        except ObjectDoesNotExist:
+            pass
+        # Serialize the creation of the image across concurrent importers.
+        with transaction.atomic(using=self.db):
+            lock_uid(self.model, uid, using=self.db)
+            try:
+                return self.get(uid=uid), False
+            except ObjectDoesNotExist:
+                return self.create_from_data(data, header=header), True
 
     def get_or_create(self, *args, **kwargs) -> Tuple:
         """
@@ -163,6 +412,517 @@ class ImageManager(DicomEntityManager):
         else:
             print("\nNo .dcm files found!")
 
+    def skip_existing(
+        self, paths: Iterable[Path], existing: deque = None
+    ) -> Iterator[Path]:
+        """
+        Filters out the paths of files that were already imported. Only the
+        identifying data elements of each file are read (see
+        :func:`~django_dicom.models.utils.utils.read_identifiers`) and existing
+        images are looked up using a single query per
+        :attr:`EXISTING_LOOKUP_CHUNK_SIZE` files.
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            *.dcm* file paths
+        existing : deque, optional
+            If provided, a tuple of the path and identifiers read from each
+            skipped file and the patient UID of the existing image will be
+            appended
+
+        Yields
+        -------
+        Path
+            Paths of files that have not been imported yet
+        """
+
+        paths = iter(paths)
+        chunk = list(islice(paths, self.EXISTING_LOOKUP_CHUNK_SIZE))
+        while chunk:
+            identifiers = {}
+            for path in chunk:
+                try:
+                    identifiers[path] = read_identifiers(path)
+                except (InvalidDicomError, OSError):
+                    # Leave errors to be handled by the header read.
+                    identifiers[path] = {}
+            uids = {values.get("SOPInstanceUID") for values in identifiers.values()}
+            found = dict(
+                self.filter(uid__in=uids - {None}).values_list(
+                    "uid", "series__patient__uid"
+                )
+            )
+            for path in chunk:
+                uid = identifiers[path].get("SOPInstanceUID")
+                if uid not in found:
+                    yield path
+                elif existing is not None:
+                    existing.append((path, identifiers[path], found[uid]))
+            chunk = list(islice(paths, self.EXISTING_LOOKUP_CHUNK_SIZE))
+
+    def count_imported(self, path: Path, pattern: str = "*.dcm") -> int:
+        """
+        Returns the number of DICOM files under the given directory tree that
+        were already imported. Only the SOP Instance UID of each file is read,
+        and existing images are looked up in chunks (see
+        :meth:`skip_existing`).
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path`
+            Base path for recursive *.dcm* lookup
+        pattern : str, optional
+            Globbing pattern to use for file lookup
+
+        Returns
+        -------
+        int
+            Number of already imported files
+        """
+
+        paths = iter_files(path, pattern=pattern)
+        existing = deque()
+        n_imported = 0
+        for _ in self.skip_existing(paths, existing=existing):
+            n_imported += len(existing)
+            existing.clear()
+        return n_imported + len(existing)
+
+    def read_headers(
+        self, paths: Iterable[Path], workers: int = None, read: Callable = read_header
+    ) -> Iterator[Tuple[Path, DicomHeader, InvalidDicomError]]:
+        """
+        Reads the headers of the provided *.dcm* files, optionally using a
+        pool of worker processes. Headers are yielded in order and at most
+        :attr:`READ_AHEAD_PER_WORKER` headers per worker are kept in memory
+        before they are consumed.
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            *.dcm* file paths
+        workers : int, optional
+            Number of worker processes to read headers with, by default None
+            (read in the current process)
+        read : Callable, optional
+            Function used to read each header (must be picklable if
+            *workers* is provided), by default
+            :func:`~django_dicom.models.utils.utils.read_header`
+
+        Yields
+        -------
+        Tuple[Path, DicomHeader, InvalidDicomError]
+            path, header, error
+        """
+
+        if not workers or workers < 2:
+            for path in paths:
+                try:
+                    yield path, read(path), None
+                except InvalidDicomError as error:
+                    yield path, None, error
+            return
+
+        max_pending = workers * self.READ_AHEAD_PER_WORKER
+        pending = deque()
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for path in paths:
+                pending.append((path, executor.submit(read, path)))
+                # Wait for the oldest read to finish before submitting more.
+                while len(pending) >= max_pending:
+                    yield self._resolve_header_read(*pending.popleft())
+            while pending:
+                yield self._resolve_header_read(*pending.popleft())
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown()
+
+    def _resolve_header_read(
+        self, path: Path, future
+    ) -> Tuple[Path, DicomHeader, InvalidDicomError]:
+        try:
+            return path, future.result(), None
+        except InvalidDicomError as error:
+            return path, None, error
+
+    def restore_moved_files(self, records: Iterable[Tuple[Path, DicomHeader]]):
+        """
+        Moves back any files that were moved to their default location during
+        a rolled back import. Files placed without removing the original (see
+        the *DICOM_FILE_PLACEMENT* setting) are left as they are.
+
+        Parameters
+        ----------
+        records : Iterable[Tuple[Path, DicomHeader]]
+            Original paths and header information of the imported files
+        """
+
+        if get_file_placement() is not FilePlacement.RENAME:
+            return
+        for path, header in records:
+            # In-memory records are written to their default location only
+            # once they are imported.
+            if isinstance(path, IN_MEMORY_RECORDS) or Path(path).exists():
+                continue
+            image = self.model(dcm=str(path))
+            image.dicom_header = header
+            default_path = Path(settings.MEDIA_ROOT, image.get_default_path())
+            if default_path.is_file():
+                default_path.rename(path)
+
+    def get_or_create_from_record(
+        self,
+        path: Union[Path, ArchiveMember, ReceivedDataset],
+        header: DicomHeader,
+        autoremove: bool = True,
+    ) -> Tuple:
+        """
+        Gets or creates an :class:`~django_dicom.models.image.Image` instance
+        from a *.dcm* file path (see :meth:`get_or_create_from_dcm`), an
+        archive member or a received dataset (see
+        :meth:`get_or_create_from_data`).
+
+        Parameters
+        ----------
+        path : Union[Path, ArchiveMember, ReceivedDataset]
+            Local *.dcm* file path, archive member or received dataset
+        header : :class:`dicom_parser.header.Header`
+            The file's already read header information
+        autoremove : bool, optional
+            Whether to remove the local copy of a *.dcm* file under
+            MEDIA_ROOT if its creation fails, by default True
+
+        Returns
+        -------
+        Tuple[Image, bool]
+            image, created
+        """
+
+        if isinstance(path, IN_MEMORY_RECORDS):
+            return self.get_or_create_from_data(path.data, header=header)
+        return self.get_or_create_from_dcm(path, autoremove=autoremove, header=header)
+
+    def get_missing_headers(
+        self, records: List[Tuple[Path, DicomHeader]]
+    ) -> List[DicomHeader]:
+        """
+        Returns the header information of the records whose images do not
+        exist yet, using a single query.
+
+        Parameters
+        ----------
+        records : List[Tuple[Path, DicomHeader]]
+            Paths and header information of the files to import
+
+        Returns
+        -------
+        List[DicomHeader]
+            Header information of the images pending creation
+        """
+
+        headers = {header.get("SOPInstanceUID"): header for _, header in records}
+        existing = self.filter(uid__in=list(headers)).values_list("uid", flat=True)
+        for uid in existing:
+            del headers[uid]
+        return list(headers.values())
+
+    def lock_records(self, records: List[Tuple[Path, DicomHeader]]) -> None:
+        """
+        Acquires the advisory locks of the records' images, series (and their
+        common headers), studies and patients up front and in a fixed order
+        (see :func:`~django_dicom.models.utils.locks.lock_uids`), so that
+        concurrent importers of overlapping chunks cannot deadlock. The locks
+        are held until the current transaction ends.
+
+        Parameters
+        ----------
+        records : List[Tuple[Path, DicomHeader]]
+            Paths and header information of the files to import
+        """
+
+        Header, Patient, Series, Study = (
+            get_model(name) for name in ("Header", "Patient", "Series", "Study")
+        )
+        keys = []
+        for _, header in records:
+            keys += [
+                (Model, header.get(Model.FIELD_TO_HEADER["uid"]))
+                for Model in (self.model, Series, Study, Patient)
+            ]
+            # Common headers are locked by their series' UID.
+            keys.append((Header, header.get("SeriesInstanceUID")))
+        lock_uids(keys, using=self.db)
+
+    def import_chunk(
+        self, records: List[Tuple[Path, DicomHeader]], autoremove: bool = True,
+    ) -> List[Tuple]:
+        """
+        Imports multiple *.dcm* files within a single transaction, creating
+        the headers of each series' new images together (see
+        :class:`~django_dicom.models.utils.header_batch.HeaderBatch`). All of
+        the chunk's locks are acquired up front (see :meth:`lock_records`).
+        If the import fails, the transaction is rolled back and the files are
+        imported again using a savepoint per file, so that only the failing
+        file is lost. The exception is then re-raised once the rest of the
+        files were committed.
+
+        Parameters
+        ----------
+        records : List[Tuple[Path, DicomHeader]]
+            Paths and header information of the files to import
+        autoremove : bool, optional
+            Whether to remove the local copy of a *.dcm* file under
+            MEDIA_ROOT if its creation fails, by default True
+
+        Returns
+        -------
+        List[Tuple[Image, bool]]
+            image, created
+        """
+
+        if len(records) == 1:
+            ((path, header),) = records
+            try:
+                with transaction.atomic():
+                    self.lock_records(records)
+                    return [
+                        self.get_or_create_from_record(
+                            path, header, autoremove=autoremove
+                        )
+                    ]
+            except Exception:
+                # Cached entities may have been rolled back.
+                clear_entity_cache()
+                raise
+        try:
+            with transaction.atomic():
+                self.lock_records(records)
+                # Create the headers of the chunk's new images in bulk.
+                with header_batch(self.get_missing_headers(records)) as batch:
+                    results = [
+                        self.get_or_create_from_record(path, header, autoremove=False)
+                        for path, header in records
+                    ]
+                    batch.discard()
+                return results
+        except Exception:
+            clear_entity_cache()
+            self.restore_moved_files(records)
+        results, failure = [], None
+        # Retry using a savepoint per file.
+        with transaction.atomic():
+            self.lock_records(records)
+            for path, header in records:
+                try:
+                    with transaction.atomic():
+                        result = self.get_or_create_from_record(
+                            path, header, autoremove=autoremove
+                        )
+                except Exception as exception:
+                    clear_entity_cache()
+                    failure = failure or exception
+                else:
+                    results.append(result)
+        if failure is not None:
+            raise failure
+        return results
+
+    def import_headers(
+        self,
+        records: Iterable[Tuple[Path, DicomHeader, InvalidDicomError]],
+        persistent: bool = True,
+        autoremove: bool = True,
+        commit_every: int = None,
+        invalid: deque = None,
+    ) -> Iterator[Tuple[Path, DicomHeader, object, bool]]:
+        """
+        Imports *.dcm* files from their already read header information (see
+        :meth:`read_headers`) in chunks of *commit_every* files per
+        transaction (see :meth:`import_chunk`).
+
+        Parameters
+        ----------
+        records : Iterable[Tuple[Path, DicomHeader, InvalidDicomError]]
+            Paths, header information and header read errors
+        persistent : bool, optional
+            Whether to continue and raise a warning or to raise an exception
+            when failing to read a DICOM file's header
+        autoremove : bool, optional
+            Whether to remove the local copy of a *.dcm* file under
+            MEDIA_ROOT if its creation fails, by default True
+        commit_every : int, optional
+            Number of images to import within a single transaction, by
+            default None (a transaction per image)
+        invalid : deque, optional
+            If provided, the paths of files that could not be read will be
+            appended
+
+        Yields
+        -------
+        Tuple[Path, DicomHeader, Image, bool]
+            path, header, image, created
+        """
+
+        chunk_size = commit_every or 1
+        chunk = []
+        for dcm_path, header, error in records:
+            if error is not None:
+                if not persistent:
+                    raise error
+
+                IMPORT_LOGGER.warning(error)
+                if invalid is not None:
+                    invalid.append(dcm_path)
+                continue
+            chunk.append((dcm_path, header))
+            if len(chunk) >= chunk_size:
+                results = self.import_chunk(chunk, autoremove=autoremove)
+                for (dcm_path, header), (image, created) in zip(chunk, results):
+                    yield dcm_path, header, image, created
+                chunk = []
+        if chunk:
+            results = self.import_chunk(chunk, autoremove=autoremove)
+            for (dcm_path, header), (image, created) in zip(chunk, results):
+                yield dcm_path, header, image, created
+
+    def import_records(
+        self,
+        path: Path,
+        records: Iterable[Tuple[Path, DicomHeader, InvalidDicomError]],
+        existing: deque = None,
+        report: bool = True,
+        persistent: bool = True,
+        autoremove: bool = True,
+        commit_every: int = None,
+        invalid: deque = None,
+        file_stats: dict = None,
+    ) -> QuerySet:
+        """
+        Imports files from their already read header information (see
+        :meth:`read_headers`), validates the patient UIDs of existing images,
+        and reports the results. Used by :meth:`import_path` and
+        :meth:`import_archive`.
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path`
+            Imported directory or archive path
+        records : Iterable[Tuple[Path, DicomHeader, InvalidDicomError]]
+            Paths (or archive members), header information and header read
+            errors
+        existing : deque, optional
+            Skipped existing files (see :meth:`skip_existing`), by default
+            None
+        report : bool, optional
+            Whether to print out a summary report when finished or not, by
+            default True
+        persistent : bool, optional
+            Whether to continue and raise a warning or to raise an exception
+            when failing to read a DICOM file's header
+        autoremove : bool, optional
+            Whether to remove the local copy of a *.dcm* file under
+            MEDIA_ROOT if its creation fails, by default True
+        commit_every : int, optional
+            Number of images to import within a single transaction, by
+            default None (a transaction per image)
+        invalid : deque, optional
+            Paths of files that could not be read (see :meth:`import_headers`),
+            by default None
+        file_stats : dict, optional
+            If provided, the results are recorded in the import manifest using
+            these file stats (see
+            :meth:`~django_dicom.models.managers.import_manifest_entry.ImportManifestEntryManager.skip_unchanged`),
+            by default None
+
+        Returns
+        -------
+        :class:`~django.db.models.query.QuerySet`
+            The created :class:`~django_dicom.models.image.Image` instances
+
+
+        .. # noqa: E501
+        """
+
+        existing = deque() if existing is None else existing
+        if file_stats is not None:
+            ImportManifestEntry = get_model("ImportManifestEntry")
+            manifest_results = []
+
+        if report:
+            counter = {"created": 0, "existing": 0}
+
+        # Keep a list of all the created images' primary keys
+        created_ids = []
+
+        # Keep a list of patient UID mismatches to log
+        patient_uid_mismatch = []
+
+        # Atomic image import
+        # For more information see:
+        # https://docs.djangoproject.com/en/3.0/topics/db/transactions/#controlling-transactions-explicitly
+        imported = self.import_headers(
+            records,
+            persistent=persistent,
+            autoremove=autoremove,
+            commit_every=commit_every,
+            invalid=invalid,
+        )
+        # Resolve each patient, study and series, as well as the import
+        # profile, and create each destination directory only once
+        with entity_cache(), import_profile(), directory_cache():
+            results = (
+                (
+                    path,
+                    header,
+                    image.id,
+                    None if created else image.patient.uid,
+                    created,
+                )
+                for path, header, image, created in imported
+            )
+            for dcm_path, header, image_id, db_patient_uid, created in merge_existing(
+                results, existing
+            ):
+                if report:
+                    counter_key = "created" if created else "existing"
+                    counter[counter_key] += 1
+
+                if created:
+                    created_ids.append(image_id)
+                elif db_patient_uid not in patient_uid_mismatch:
+                    # Validate patient UID for existing images
+                    patient_uid = header.get("PatientID")
+                    if patient_uid != db_patient_uid:
+                        # Log patient UID mismatch
+                        image_uid = header.get("SOPInstanceUID")
+                        message = PATIENT_UID_MISMATCH.format(
+                            image_uid=image_uid,
+                            db_value=db_patient_uid,
+                            patient_uid=patient_uid,
+                        )
+                        IMPORT_LOGGER.warning(message)
+                        patient_uid_mismatch.append(db_patient_uid)
+
+                if file_stats is not None:
+                    status = "CREATED" if created else "EXISTING"
+                    uid = header.get("SOPInstanceUID")
+                    manifest_results.append((dcm_path, uid, status))
+                    manifest_results += [(p, None, "INVALID") for p in invalid]
+                    invalid.clear()
+                    if len(manifest_results) >= ImportManifestEntry.objects.CHUNK_SIZE:
+                        ImportManifestEntry.objects.record(manifest_results, file_stats)
+                        manifest_results = []
+            if file_stats is not None:
+                manifest_results += [(p, None, "INVALID") for p in invalid]
+                ImportManifestEntry.objects.record(manifest_results, file_stats)
+        if report:
+            self.report_import_path_results(path, counter)
+
+        return self.filter(id__in=created_ids)
+
     def import_path(
         self,
         path: Path,
@@ -171,6 +931,10 @@ class ImageManager(DicomEntityManager):
         persistent: bool = True,
         pattern: bool = "*.dcm",
         autoremove: bool = True,
+        workers: int = None,
+        commit_every: int = None,
+        manifest: bool = False,
+        sniff: bool = True,
     ) -> QuerySet:
         """
         Iterates the given directory tree and imports any *.dcm* files found
@@ -190,6 +954,26 @@ class ImageManager(DicomEntityManager):
             when failing to read a DICOM file's header
         pattern : str, optional
             Globbing pattern to use for file import
+        workers : int, optional
+            Number of worker processes used to read headers in parallel, by
+            default None. Database writes are always executed by the calling
+            process.
+        commit_every : int, optional
+            Number of images to import within a single transaction, by
+            default None (a transaction per image). If a transaction fails, its
+            images are imported again using a savepoint per image (see
+            :meth:`import_chunk`).
+        manifest : bool, optional
+            Whether to record the scanned files in the import manifest and
+            skip files that were scanned before and have not changed since
+            (see
+            :class:`~django_dicom.models.import_manifest_entry.ImportManifestEntry`),
+            by default False
+        sniff : bool, optional
+            Whether to skip files that do not begin with a DICOM preamble and
+            prefix without reading them (see
+            :func:`~django_dicom.utils.discovery.is_dicom_file`), by default
+            True
 
         Returns
         -------
@@ -197,61 +981,102 @@ class ImageManager(DicomEntityManager):
             The created :class:`~django_dicom.models.image.Image` instances
         """
 
+        # Pre-warm the data element definition registry
+        get_model("DataElementDefinition").objects.warm_cache()
+
         # Create an iterator
-        iterator = Path(path).rglob(pattern)
+        paths = iter_files(path, pattern=pattern, sniff=sniff)
         if progressbar:
             # Create a progressbar wrapped iterator using tqdm
-            iterator = create_progressbar(iterator, unit="image")
+            paths = create_progressbar(paths, unit="image")
 
-        if report:
-            counter = {"created": 0, "existing": 0}
+        # Skip files that were scanned before and have not changed since
+        if manifest:
+            ImportManifestEntry = get_model("ImportManifestEntry")
+            file_stats, invalid = {}, deque()
+            paths = ImportManifestEntry.objects.skip_unchanged(paths, file_stats)
+        else:
+            file_stats = invalid = None
 
-        # Keep a list of all the created images' primary keys
-        created_ids = []
+        # Skip files that were already imported, keeping their identifiers
+        # to validate their patient UIDs
+        existing = deque()
+        iterator = self.read_headers(
+            self.skip_existing(paths, existing=existing), workers=workers
+        )
 
-        # Keep a list of patient UID mismatches to log
-        patient_uid_mismatch = []
+        return self.import_records(
+            path,
+            iterator,
+            existing=existing,
+            report=report,
+            persistent=persistent,
+            autoremove=autoremove,
+            commit_every=commit_every,
+            invalid=invalid,
+            file_stats=file_stats,
+        )
 
-        for dcm_path in iterator:
+    def import_archive(
+        self,
+        path: Path,
+        progressbar: bool = True,
+        report: bool = True,
+        persistent: bool = True,
+        pattern: str = "*.dcm",
+        workers: int = None,
+        commit_every: int = None,
+        sniff: bool = True,
+    ) -> QuerySet:
+        """
+        Imports the DICOM files within a ZIP or (optionally compressed) TAR
+        archive without extracting it. Members are streamed one at a time
+        (see :func:`~django_dicom.utils.discovery.iter_archive`), their
+        headers are read from memory, and each new image is written only once,
+        directly to its default location (see
+        :meth:`get_or_create_from_data`).
 
-            if not dcm_path.is_file():
-                continue
+        Parameters
+        ----------
+        path : :class:`pathlib.Path`
+            Archive path
+        progressbar : bool, optional
+            Whether to display a progressbar or not, by default True
+        report : bool, optional
+            Whether to print out a summary report when finished or not, by
+            default True
+        persistent : bool, optional
+            Whether to continue and raise a warning or to raise an exception
+            when failing to read a DICOM file's header
+        pattern : str, optional
+            Globbing pattern to use for member import
+        workers : int, optional
+            Number of worker processes used to read headers in parallel, by
+            default None (see :meth:`import_path`)
+        commit_every : int, optional
+            Number of images to import within a single transaction, by
+            default None (see :meth:`import_path`)
+        sniff : bool, optional
+            Whether to skip members that do not begin with a DICOM preamble
+            and prefix, by default True
 
-            # Atomic image import
-            # For more information see:
-            # https://docs.djangoproject.com/en/3.0/topics/db/transactions/#controlling-transactions-explicitly
-            with transaction.atomic():
-                try:
-                    image, created = self.get_or_create_from_dcm(
-                        dcm_path, autoremove=autoremove
-                    )
-                except InvalidDicomError as e:
-                    if not persistent:
-                        raise
-
-                    IMPORT_LOGGER.warning(e)
-                    continue
-            if report:
-                counter_key = "created" if created else "existing"
-                counter[counter_key] += 1
-
-            if created:
-                created_ids.append(image.id)
-            elif image.patient.uid not in patient_uid_mismatch:
-                # Validate patient UID for existing images
-                header = DicomHeader(dcm_path)
-                patient_uid = header.get("PatientID")
-                if patient_uid != image.patient.uid:
-                    # Log patient UID mismatch
-                    image_uid = header.get("SOPInstanceUID")
-                    message = PATIENT_UID_MISMATCH.format(
-                        image_uid=image_uid,
-                        db_value=image.patient.uid,
-                        patient_uid=patient_uid,
-                    )
-                    IMPORT_LOGGER.warning(message)
-                    patient_uid_mismatch.append(image.patient.uid)
-        if report:
-            self.report_import_path_results(path, counter)
+        Returns
+        -------
+        :class:`~django.db.models.query.QuerySet`
+            The created :class:`~django_dicom.models.image.Image` instances
+        """
 
-        return self.filter(id__in=created_ids)
+        # Pre-warm the data element definition registry
+        get_model("DataElementDefinition").objects.warm_cache()
+
+        members = iter_archive(path, pattern=pattern, sniff=sniff)
+        if progressbar:
+            members = create_progressbar(members, unit="image")
+        iterator = self.read_headers(members, workers=workers, read=read_member_header)
+        return self.import_records(
+            path,
+            iterator,
+            report=report,
+            persistent=persistent,
+            commit_every=commit_every,
+        )
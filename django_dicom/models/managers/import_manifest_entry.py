@@ -0,0 +1,112 @@
+"""
+Definition of a custom :class:`~django.db.models.Manager` for the
+:class:`~django_dicom.models.import_manifest_entry.ImportManifestEntry` model.
+"""
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.db import models
+from django.utils import timezone
+
+
+def get_file_stat(path: Path) -> Tuple[int, int]:
+    """
+    Returns the size and modification time (in nanoseconds) of a file.
+
+    Parameters
+    ----------
+    path : :class:`pathlib.Path`
+        File path
+
+    Returns
+    -------
+    Tuple[int, int]
+        size, mtime
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ImportManifestEntryManager(models.Manager):
+    """
+    Custom :class:`~django.db.models.Manager` for the
+    :class:`~django_dicom.models.import_manifest_entry.ImportManifestEntry`
+    model.
+    """
+
+    #: Number of paths to look up or record using a single query.
+    CHUNK_SIZE = 500
+
+    def skip_unchanged(
+        self, paths: Iterable[Path], stats: Dict[str, Tuple[int, int]]
+    ) -> Iterator[Path]:
+        """
+        Filters out the paths of files that were scanned before and have not
+        changed since (based on their size and modification time).
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            File paths
+        stats : Dict[str, Tuple[int, int]]
+            Dictionary to which the size and modification time of every
+            yielded path will be added (by absolute path), to be recorded
+            later using :meth:`record`
+
+        Yields
+        -------
+        Path
+            Paths of new or modified files
+        """
+
+        paths = iter(paths)
+        chunk = list(islice(paths, self.CHUNK_SIZE))
+        while chunk:
+            current = {str(Path(path).absolute()): path for path in chunk}
+            chunk_stats = {key: get_file_stat(path) for key, path in current.items()}
+            recorded = {
+                path: (size, mtime)
+                for path, size, mtime in self.filter(
+                    path__in=list(current)
+                ).values_list("path", "size", "mtime")
+            }
+            for key, path in current.items():
+                if recorded.get(key) != chunk_stats[key]:
+                    stats[key] = chunk_stats[key]
+                    yield path
+            chunk = list(islice(paths, self.CHUNK_SIZE))
+
+    def record(
+        self, results: List[Tuple[Path, str, str]], stats: Dict[str, Tuple[int, int]],
+    ) -> None:
+        """
+        Creates or updates the entries of scanned files.
+
+        Parameters
+        ----------
+        results : List[Tuple[Path, str, str]]
+            Path, SOP Instance UID and
+            :class:`~django_dicom.models.import_manifest_entry.ImportStatus`
+            name tuples
+        stats : Dict[str, Tuple[int, int]]
+            Size and modification time by absolute path, as collected by
+            :meth:`skip_unchanged` (recorded entries are removed)
+        """
+
+        now = timezone.now()
+        entries = {}
+        for path, uid, status in results:
+            key = str(Path(path).absolute())
+            size, mtime = stats.pop(key)
+            entries[key] = self.model(
+                path=key, size=size, mtime=mtime, uid=uid, status=status, scanned=now
+            )
+        self.bulk_create(
+            list(entries.values()),
+            batch_size=self.CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=["path"],
+            update_fields=["size", "mtime", "uid", "status", "scanned"],
+        )
@@ -0,0 +1,82 @@
+"""
+Definition of a custom :class:`~django.db.models.Manager` for the
+:class:`~django_dicom.models.networking.metrics_snapshot.ScpMetricsSnapshot`
+model.
+"""
+from datetime import timedelta
+from typing import Dict, List
+
+from django.db import models
+from django.utils import timezone
+from django_dicom.models.networking.metrics import SNAPSHOT_EXPIRY, ScpMetrics
+
+
+class ScpMetricsSnapshotManager(models.Manager):
+    """
+    Custom :class:`~django.db.models.Manager` for the
+    :class:`~django_dicom.models.networking.metrics_snapshot.ScpMetricsSnapshot`
+    model.
+    """
+
+    def publish(
+        self, metrics: Dict[int, ScpMetrics], worker: str, queue_depth: int = None
+    ) -> None:
+        """
+        Saves the metrics collected by a process, and deletes any expired
+        snapshots (see
+        :attr:`~django_dicom.models.networking.metrics.SNAPSHOT_EXPIRY`).
+
+        Parameters
+        ----------
+        metrics : Dict[int, ScpMetrics]
+            Metrics by storage SCP port
+        worker : str
+            Process identifier (see
+            :func:`~django_dicom.models.networking.metrics.get_worker_id`)
+        queue_depth : int, optional
+            The process's ingestion queue depth, by default None (datasets are
+            imported synchronously)
+        """
+        for port, provider_metrics in metrics.items():
+            summary = {**provider_metrics.to_dict(), "queue_depth": queue_depth}
+            self.update_or_create(
+                port=port, worker=worker, defaults={"metrics": summary}
+            )
+        self.expired().delete()
+
+    def expired(self) -> models.QuerySet:
+        """
+        Returns the snapshots that were not published again within
+        :attr:`~django_dicom.models.networking.metrics.SNAPSHOT_EXPIRY`
+        seconds.
+
+        Returns
+        -------
+        models.QuerySet
+            Expired snapshots
+        """
+        expiry = timezone.now() - timedelta(seconds=SNAPSHOT_EXPIRY)
+        return self.filter(updated__lt=expiry)
+
+    def get_summaries(self, port: int, exclude_worker: str = None) -> List[dict]:
+        """
+        Returns the metrics summaries recently published for a storage SCP.
+
+        Parameters
+        ----------
+        port : int
+            Storage SCP port
+        exclude_worker : str, optional
+            Process identifier to exclude (e.g. the current process, whose
+            metrics are read from memory), by default None
+
+        Returns
+        -------
+        List[dict]
+            Metrics summaries
+        """
+        expiry = timezone.now() - timedelta(seconds=SNAPSHOT_EXPIRY)
+        snapshots = self.filter(port=port, updated__gte=expiry)
+        if exclude_worker is not None:
+            snapshots = snapshots.exclude(worker=exclude_worker)
+        return list(snapshots.values_list("metrics", flat=True))
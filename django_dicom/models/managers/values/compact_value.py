@@ -0,0 +1,250 @@
+"""
+Definition of the :class:`CompactValueManager` class.
+"""
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from dicom_parser.data_element import DataElement as DicomDataElement
+from dicom_parser.utils.value_representation import ValueRepresentation
+from django.db import DataError, models, transaction
+from django_dicom.models.managers.data_element_value import (
+    LOOKUP_CHUNK_SIZE,
+    VALUE_FIELDS,
+    get_value_hash,
+)
+from django_dicom.models.utils.meta import get_model
+from django_dicom.models.values.vr_to_model import get_value_model
+
+
+class CompactValueManager(models.Manager):
+    """
+    Custom manager for the
+    :class:`~django_dicom.models.values.compact_value.CompactValue` model.
+    """
+
+    def get_instances(self, ValueModel, values: List[dict]) -> Dict[str, object]:
+        """
+        Returns unsaved instances representing the provided *ValueModel*
+        instantiation keyword arguments by their content hash.
+
+        Parameters
+        ----------
+        ValueModel : :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            The :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            subclass the values would otherwise be saved as
+        values : List[dict]
+            Value instantiation keyword arguments
+
+        Returns
+        -------
+        Dict[str, CompactValue]
+            Unsaved instances by content hash
+
+
+        .. # noqa: E501
+        """
+
+        return {
+            get_value_hash(ValueModel, kwargs): self.model(
+                value_model=ValueModel.__name__,
+                content_hash=get_value_hash(ValueModel, kwargs),
+                **kwargs,
+            )
+            for kwargs in values
+        }
+
+    def bulk_get_or_create(
+        self, instances: Dict[str, object]
+    ) -> Tuple[Dict[str, object], bool]:
+        """
+        Gets or creates the provided unsaved instances. Existing instances are
+        retrieved by their content hash and any missing instances are then
+        created using a single query. Instances created concurrently by other
+        importers are ignored and looked up again.
+
+        Parameters
+        ----------
+        instances : Dict[str, CompactValue]
+            Unsaved instances by content hash
+
+        Returns
+        -------
+        Tuple[Dict[str, CompactValue], bool]
+            Saved instances by content hash, whether any were missing
+        """
+
+        hashes = list(instances)
+        existing = {}
+        for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+            end = start + LOOKUP_CHUNK_SIZE
+            chunk = hashes[start:end]
+            existing.update(self.in_bulk(chunk, field_name="content_hash"))
+        missing = [
+            content_hash for content_hash in hashes if content_hash not in existing
+        ]
+        if missing:
+            self.bulk_create(
+                [instances[content_hash] for content_hash in missing],
+                ignore_conflicts=True,
+            )
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                end = start + LOOKUP_CHUNK_SIZE
+                chunk = missing[start:end]
+                existing.update(self.in_bulk(chunk, field_name="content_hash"))
+        return existing, bool(missing)
+
+    def from_dicom_parser(self, data_element: DicomDataElement) -> Tuple[list, bool]:
+        """
+        Get or create the values of a dicom_parser_
+        :class:`~dicom_parser.data_element.DataElement`. *Sequence of Items*
+        data elements are handled by
+        :meth:`~django_dicom.models.managers.data_element_value.DataElementValueManager.from_dicom_parser`.
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+
+        Returns
+        -------
+        Tuple[list, bool]
+            values, created
+
+
+        .. # noqa: E501
+        """
+
+        DataElementValue = get_model("DataElementValue")
+        if data_element.VALUE_REPRESENTATION == ValueRepresentation.SQ:
+            return DataElementValue.objects.from_dicom_parser(data_element)
+        ValueModel = get_value_model(data_element)
+        values = DataElementValue.objects.get_nonsequence_kwargs(data_element)
+        instances = self.get_instances(ValueModel, values)
+        try:
+            with transaction.atomic(using=self.db):
+                existing, created = self.bulk_get_or_create(instances)
+        except DataError as error:
+            warning = DataElementValue.objects.get_invalid_data_warning(
+                data_element, error
+            )
+            values = [
+                {"index": None, "raw": None, "value": None, "warnings": [warning]}
+            ]
+            instances = self.get_instances(ValueModel, values)
+            existing, created = self.bulk_get_or_create(instances)
+        return [existing[content_hash] for content_hash in instances], created
+
+    def bulk_from_dicom_parser(self, data_elements: List[DicomDataElement]) -> list:
+        """
+        Gets or creates the values of multiple dicom_parser_
+        :class:`~dicom_parser.data_element.DataElement` instances at once.
+
+        .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+        Parameters
+        ----------
+        data_elements : List[DicomDataElement]
+            Objects representing data elements in memory
+
+        Returns
+        -------
+        list
+            The values of each of the provided data elements
+        """
+
+        DataElementValue = get_model("DataElementValue")
+        SequenceOfItems = get_model("SequenceOfItems")
+        results = [[] for _ in data_elements]
+        hashes = defaultdict(list)
+        instances = {}
+        sequences = []
+        for i, data_element in enumerate(data_elements):
+            if data_element.VALUE_REPRESENTATION == ValueRepresentation.SQ:
+                sequences.append((i, data_element))
+                continue
+            ValueModel = get_value_model(data_element)
+            values = DataElementValue.objects.get_nonsequence_kwargs(data_element)
+            element_instances = self.get_instances(ValueModel, values)
+            hashes[i] = list(element_instances)
+            instances.update(element_instances)
+        if sequences:
+            sequence_instances = SequenceOfItems.objects.bulk_from_dicom_parser(
+                [data_element for _, data_element in sequences]
+            )
+            for (i, _), sequence in zip(sequences, sequence_instances):
+                results[i] = [sequence]
+        existing, _ = self.bulk_get_or_create(instances)
+        for i, element_hashes in hashes.items():
+            results[i] = [existing[content_hash] for content_hash in element_hashes]
+        return results
+
+    def migrate_values(self, chunk_size: int = LOOKUP_CHUNK_SIZE) -> int:
+        """
+        Copies all existing
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass instances (other than *Sequence of Items*) and their data
+        element relationships to the compact value table, in chunks of
+        *chunk_size* values. The original rows are kept, and values that were
+        already copied are skipped, so this method may safely be run again
+        (e.g. after switching the *DICOM_VALUE_STORAGE* setting to
+        *"compact"*).
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of values copied in each transaction, by default
+            :attr:`~django_dicom.models.managers.data_element_value.LOOKUP_CHUNK_SIZE`
+
+        Returns
+        -------
+        int
+            Number of values copied
+
+
+        .. # noqa: E501
+        """
+
+        DataElement = get_model("DataElement")
+        DataElementValue = get_model("DataElementValue")
+        MultiTableThrough = DataElement._values.through
+        CompactThrough = DataElement._compact_values.through
+        queryset = (
+            DataElementValue.objects.filter(sequenceofitems__isnull=True)
+            .select_subclasses()
+            .order_by("id")
+        )
+        n_values, last_id = 0, 0
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                return n_values
+            last_id = chunk[-1].id
+            instances, value_hashes = {}, {}
+            for value in chunk:
+                ValueModel = type(value)
+                if ValueModel is DataElementValue:
+                    continue
+                kwargs = {name: getattr(value, name) for name in VALUE_FIELDS}
+                content_hash = value.content_hash or get_value_hash(ValueModel, kwargs)
+                instances[content_hash] = self.model(
+                    value_model=ValueModel.__name__, content_hash=content_hash, **kwargs
+                )
+                value_hashes[value.id] = content_hash
+            with transaction.atomic(using=self.db):
+                existing, _ = self.bulk_get_or_create(instances)
+                relations = MultiTableThrough.objects.filter(
+                    dataelementvalue_id__in=list(value_hashes)
+                ).values_list("dataelement_id", "dataelementvalue_id")
+                CompactThrough.objects.bulk_create(
+                    [
+                        CompactThrough(
+                            dataelement_id=element_id,
+                            compactvalue_id=existing[value_hashes[value_id]].id,
+                        )
+                        for element_id, value_id in relations
+                    ],
+                    ignore_conflicts=True,
+                )
+            n_values += len(value_hashes)
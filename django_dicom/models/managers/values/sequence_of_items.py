@@ -1,9 +1,53 @@
 """
 Definition of the :class:`SequenceOfItemsManager` class.
 """
+import hashlib
+import json
+from typing import Dict, List, Tuple
+
 from dicom_parser.data_element import DataElement as DicomDataElement
-from django_dicom.models.managers.data_element_value import DataElementValueManager
+from dicom_parser.header import Header as DicomHeader
+from dicom_parser.utils.value_representation import ValueRepresentation
+from django.db import DataError, IntegrityError, transaction
+from django_dicom.models.managers.data_element_value import (
+    LOOKUP_CHUNK_SIZE,
+    MAX_CONFLICT_ATTEMPTS,
+    DataElementValueManager,
+    get_value_hash,
+)
+from django_dicom.models.utils.import_profile import (
+    ImportProfile,
+    get_import_profile,
+)
 from django_dicom.models.utils.meta import get_model
+from django_dicom.models.utils.utils import get_sequence_deduplication
+from django_dicom.models.values.vr_to_model import get_value_model
+
+
+def get_item_nodes(
+    data_elements: List[DicomDataElement],
+) -> List[Tuple[int, int, DicomHeader]]:
+    """
+    Flattens the items of the provided *Sequence of Items* data elements into
+    an ordered list of nodes.
+
+    Parameters
+    ----------
+    data_elements : List[DicomDataElement]
+        *Sequence of Items* data elements
+
+    Returns
+    -------
+    List[Tuple[int, int, DicomHeader]]
+        The position of each item's sequence within *data_elements*, the
+        item's index within its sequence, and the item's header
+    """
+
+    return [
+        (position, index, dicom_header)
+        for position, data_element in enumerate(data_elements)
+        for index, dicom_header in enumerate(data_element.value)
+    ]
 
 
 class SequenceOfItemsManager(DataElementValueManager):
@@ -13,10 +57,204 @@ class SequenceOfItemsManager(DataElementValueManager):
     model.
     """
 
+    def get_sequence_hash(
+        self, data_element: DicomDataElement, profile: ImportProfile
+    ) -> str:
+        """
+        Returns a SHA-256 digest of a *Sequence of Items* data element's
+        included content (see
+        :class:`~django_dicom.models.utils.import_profile.ImportProfile`),
+        used to identify identical sequences.
+
+        Parameters
+        ----------
+        data_element : DicomDataElement
+            Sequence of items data element
+        profile : :class:`~django_dicom.models.utils.import_profile.ImportProfile`
+            Import profile used to filter the nested data elements
+
+        Returns
+        -------
+        str
+            Hexadecimal content hash
+
+
+        .. # noqa: E501
+        """
+
+        items = []
+        for dicom_header in data_element.value:
+            item = []
+            for nested_element in profile.filter(dicom_header):
+                vr = nested_element.VALUE_REPRESENTATION
+                if vr == ValueRepresentation.SQ:
+                    hashes = [self.get_sequence_hash(nested_element, profile)]
+                else:
+                    ValueModel = get_value_model(nested_element)
+                    hashes = [
+                        get_value_hash(ValueModel, kwargs)
+                        for kwargs in self.get_nonsequence_kwargs(nested_element)
+                    ]
+                item.append([list(nested_element.tag), vr.name, hashes])
+            items.append(sorted(item))
+        content = f"{self.model._meta.label}:{json.dumps(items)}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get_or_create_sequences(self, hashes: List[str]) -> Tuple[list, Dict]:
+        """
+        Gets or creates a sequence for each of the provided content hashes
+        (see :meth:`get_sequence_hash`). Sequences created concurrently by
+        other importers are looked up again.
+
+        Parameters
+        ----------
+        hashes : List[str]
+            Sequence content hashes
+
+        Returns
+        -------
+        Tuple[list, Dict[str, SequenceOfItems]]
+            Sequences ordered to match *hashes*, created sequences by content
+            hash
+        """
+
+        existing, created = {}, {}
+        missing = list(dict.fromkeys(hashes))
+        for attempt in range(1, MAX_CONFLICT_ATTEMPTS + 1):
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                end = start + LOOKUP_CHUNK_SIZE
+                queryset = self.filter(content_hash__in=missing[start:end])
+                existing.update(
+                    {instance.content_hash: instance for instance in queryset}
+                )
+            missing = [
+                content_hash for content_hash in missing if content_hash not in existing
+            ]
+            new_instances = [
+                self.model(content_hash=content_hash) for content_hash in missing
+            ]
+            try:
+                with transaction.atomic(using=self.db):
+                    new_instances = self.bulk_create_values(self.model, new_instances)
+            except IntegrityError:
+                if attempt == MAX_CONFLICT_ATTEMPTS:
+                    raise
+            else:
+                created = dict(zip(missing, new_instances))
+                existing.update(created)
+                break
+        return [existing[content_hash] for content_hash in hashes], created
+
+    def create_items(
+        self,
+        sequences: list,
+        data_elements: List[DicomDataElement],
+        profile: ImportProfile,
+    ) -> None:
+        """
+        Creates the nested headers of the provided sequences in bulk. The
+        headers' *Sequence of Items* data elements are in turn created
+        together using :meth:`bulk_from_dicom_parser`, so that each nesting
+        level of the sequence trees is inserted using a handful of queries.
+        If the database rejects any value, the items are created header by
+        header instead.
+
+        Parameters
+        ----------
+        sequences : list
+            Created sequences
+        data_elements : List[DicomDataElement]
+            The *Sequence of Items* data elements matching *sequences*
+        profile : :class:`~django_dicom.models.utils.import_profile.ImportProfile`
+            Import profile used to filter the nested data elements
+
+
+        .. # noqa: E501
+        """
+
+        Header = get_model("Header")
+        DataElement = get_model("DataElement")
+        nodes = get_item_nodes(data_elements)
+        if not nodes:
+            return
+        try:
+            with transaction.atomic(using=self.db):
+                headers = Header.objects.bulk_create(
+                    [
+                        Header(parent=sequences[position], index=index)
+                        for position, index, _ in nodes
+                    ]
+                )
+                DataElement.objects.bulk_from_dicom_parser(
+                    [
+                        (header, nested_element)
+                        for header, (_, _, dicom_header) in zip(headers, nodes)
+                        for nested_element in profile.filter(dicom_header)
+                    ]
+                )
+        except DataError:
+            for position, index, dicom_header in nodes:
+                Header.objects.from_dicom_parser(
+                    dicom_header, parent=sequences[position], index=index
+                )
+        else:
+            for header, (_, _, dicom_header) in zip(headers, nodes):
+                header._instance = dicom_header
+
+    def bulk_from_dicom_parser(
+        self, data_elements: List[DicomDataElement], deduplicate: bool = None
+    ) -> list:
+        """
+        Creates the sequences of multiple *Sequence of Items* data elements
+        at once. The sequences' items are flattened (see
+        :func:`get_item_nodes`) and inserted breadth-first, a nesting level at
+        a time (see :meth:`create_items`).
+
+        If *deduplicate* is True, identical sequences (see
+        :meth:`get_sequence_hash`) are only created once, and any existing
+        identical sequences are reused.
+
+        Parameters
+        ----------
+        data_elements : List[DicomDataElement]
+            *Sequence of Items* data elements
+        deduplicate : bool, optional
+            Whether to reuse identical sequences, by default None (see the
+            *DICOM_SEQUENCE_DEDUPLICATION* setting)
+
+        Returns
+        -------
+        List[SequenceOfItems]
+            Sequences ordered to match *data_elements*
+        """
+
+        if not data_elements:
+            return []
+        profile = get_import_profile()
+        if deduplicate is None:
+            deduplicate = get_sequence_deduplication()
+        with transaction.atomic(using=self.db):
+            if deduplicate:
+                hashes = [
+                    self.get_sequence_hash(data_element, profile)
+                    for data_element in data_elements
+                ]
+                sequences, created = self.get_or_create_sequences(hashes)
+                unique = dict(zip(hashes, data_elements))
+                data_elements = [unique[content_hash] for content_hash in created]
+                self.create_items(list(created.values()), data_elements, profile)
+            else:
+                sequences = self.bulk_create_values(
+                    self.model, [self.model() for _ in data_elements]
+                )
+                self.create_items(sequences, data_elements, profile)
+        return sequences
+
     def from_dicom_parser(self, data_element: DicomDataElement) -> tuple:
         """
         Create a sequence of items by reading the included headers and
-        populating the database accordingly.
+        populating the database accordingly (see
+        :meth:`bulk_from_dicom_parser`).
 
         Parameters
         ----------
@@ -28,10 +266,5 @@ class SequenceOfItemsManager(DataElementValueManager):
         Tuple[DataElementValue, bool]
             The data element and whether is was created or not
         """
-        Header = get_model("Header")
-        sequence = self.create()
-        for i_header, dicom_header in enumerate(data_element.value):
-            _ = Header.objects.from_dicom_parser(
-                dicom_header, parent=sequence, index=i_header
-            )
+        (sequence,) = self.bulk_from_dicom_parser([data_element])
         return sequence, True
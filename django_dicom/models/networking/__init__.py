@@ -5,6 +5,7 @@ Models supporting networking functionality with pynetdicom_.
    https://pydicom.github.io/pynetdicom/stable/index.html
 """
 
+from django_dicom.models.networking.metrics_snapshot import ScpMetricsSnapshot
 from django_dicom.models.networking.storage_scp import StorageServiceClassProvider
 
 # flake8: noqa: F401
@@ -0,0 +1,171 @@
+"""
+Definition of the :class:`AssociationBatch` class, used to import the
+datasets received within a single association together.
+"""
+import time
+from pathlib import Path
+from typing import List, Union
+from weakref import WeakKeyDictionary
+
+from django_dicom.models.networking.ingestion import import_received_records
+from django_dicom.models.networking.logging import log_batch_import
+from django_dicom.models.networking.metrics import ScpMetrics
+from django_dicom.models.networking.utils import encode_dataset, save_dataset
+from django_dicom.utils.networking import (
+    ReceivedDataset,
+    get_association_batch_configuration,
+)
+from pynetdicom import events
+
+ASSOCIATION_BATCHES = WeakKeyDictionary()
+"""
+Batches of the datasets received within each active association.
+"""
+
+
+class AssociationBatch:
+    """
+    Collects the datasets received within a single association, to be
+    imported together once the association is released or aborted (see
+    :func:`~django_dicom.models.networking.ingestion.import_received_records`).
+    Only the spooled datasets' paths and the encoded datasets held in memory
+    are kept, and their headers are read once the batch is imported, so that
+    decoded pixel data is never retained.
+
+    Datasets held in memory that fail to import are saved to the spool, to be
+    imported once it is recovered. However, they are lost if the process exits
+    before the association ends, so *spool* should be enabled if every
+    acknowledged dataset must survive a crash.
+    """
+
+    def __init__(self, spool: bool = False, memory_limit: int = 256 * 2 ** 20):
+        """
+        Creates a new association batch.
+
+        Parameters
+        ----------
+        spool : bool, optional
+            Whether to save all received datasets to disk, by default False
+        memory_limit : int, optional
+            Maximal size (in bytes) of the datasets held in memory, any
+            datasets beyond it are saved to disk, by default 256 MiB
+        """
+        self.spool = spool
+        self.memory_limit = memory_limit
+        self.memory_size = 0
+        self.records: List[Union[Path, ReceivedDataset]] = []
+
+    def add(self, event: events.Event, metrics: ScpMetrics = None) -> None:
+        """
+        Adds a C-STORE request provided dataset to the batch.
+
+        Parameters
+        ----------
+        event : events.Event
+            C-STORE request event
+        metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+            Metrics to record the write latency to, by default None
+
+
+        .. # noqa: E501
+        """
+        metrics = metrics or ScpMetrics()
+        size = event.request.DataSet.getbuffer().nbytes
+        if self.spool or self.memory_size + size > self.memory_limit:
+            with metrics.measure("write"):
+                path = save_dataset(event, durable=True)
+            self.records.append(path)
+            return
+        with metrics.measure("write"):
+            data = encode_dataset(event)
+        self.memory_size += len(data)
+        dataset = ReceivedDataset(event.request.AffectedSOPInstanceUID, data)
+        self.records.append(dataset)
+
+    def import_records(self, metrics: ScpMetrics = None) -> int:
+        """
+        Imports the batch's datasets.
+
+        Parameters
+        ----------
+        metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+            Metrics to record the amortized import latency and any failures
+            to, by default None
+
+        Returns
+        -------
+        int
+            Number of imported datasets
+
+
+        .. # noqa: E501
+        """
+        records, self.records, self.memory_size = self.records, [], 0
+        if not records:
+            return 0
+        start = time.perf_counter()
+        n_imported = import_received_records(records)
+        log_batch_import(n_imported, len(records))
+        if metrics is not None:
+            elapsed = time.perf_counter() - start
+            metrics.observe("import", elapsed / len(records), count=len(records))
+            if n_imported < len(records):
+                metrics.record_failures(len(records) - n_imported)
+        return n_imported
+
+
+def add_to_association_batch(event: events.Event, metrics: ScpMetrics = None) -> bool:
+    """
+    Adds a C-STORE request provided dataset to its association's batch, if
+    datasets are batched by association (see the
+    *DICOM_SCP_ASSOCIATION_BATCH* setting).
+
+    Parameters
+    ----------
+    event : events.Event
+        C-STORE request event
+    metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+        Metrics to record the write latency to, by default None
+
+    Returns
+    -------
+    bool
+        Whether the dataset was added to a batch
+
+
+    .. # noqa: E501
+    """
+    batch = ASSOCIATION_BATCHES.get(event.assoc)
+    if batch is None:
+        configuration = get_association_batch_configuration()
+        if configuration is None:
+            return False
+        batch = ASSOCIATION_BATCHES[event.assoc] = AssociationBatch(**configuration)
+    batch.add(event, metrics=metrics)
+    return True
+
+
+def import_association_batch(event: events.Event, metrics: ScpMetrics = None) -> int:
+    """
+    Imports the datasets received within a released or aborted association.
+
+    Parameters
+    ----------
+    event : events.Event
+        Association release or abort event
+    metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+        Metrics to record the amortized import latency and any failures to,
+        by default None
+
+    Returns
+    -------
+    int
+        Number of imported datasets
+
+
+    .. # noqa: E501
+    """
+    batch = ASSOCIATION_BATCHES.pop(event.assoc, None)
+    if batch is None:
+        return 0
+    return batch.import_records(metrics=metrics)
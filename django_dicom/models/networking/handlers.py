@@ -4,13 +4,31 @@ Event handlers for associated service classes.
 import logging
 
 from django_dicom.models.networking import messages
+from django_dicom.models.networking.association_batch import (
+    add_to_association_batch,
+    import_association_batch,
+)
 from django_dicom.models.networking.logging import log_c_store_received
-from django_dicom.models.networking.utils import import_dataset_to_db
+from django_dicom.models.networking.metrics import (
+    get_association_metrics,
+    release_association_metrics,
+)
+from django_dicom.models.networking.utils import (
+    get_ingestion_queue,
+    import_dataset_to_db,
+    queue_dataset,
+)
 from pynetdicom import events
 from pynetdicom.status import Status
 
 logger = logging.getLogger("data.dicom.networking")
 
+OUT_OF_RESOURCES = 0xA700
+"""
+C-STORE *Refused: Out of Resources* status, returned when the ingestion queue
+is full.
+"""
+
 
 def handle_echo(event: events.Event) -> Status:
     """
@@ -32,7 +50,12 @@ def handle_echo(event: events.Event) -> Status:
 
 def handle_store(event: events.Event) -> Status:
     """
-    Handle a C-STORE request event and save dataset to the database.
+    Handle a C-STORE request event and save dataset to the database. If an
+    ingestion queue is configured (see the *DICOM_SCP_QUEUE* setting), the
+    dataset is saved to disk and queued for import, and the request is refused
+    with an out of resources status if the queue is full. If datasets are
+    batched by association (see the *DICOM_SCP_ASSOCIATION_BATCH* setting),
+    the dataset is added to its association's batch instead.
 
     Parameters
     ----------
@@ -52,18 +75,54 @@ def handle_store(event: events.Event) -> Status:
        https://pydicom.github.io/pynetdicom/stable/reference/generated/pynetdicom._handlers.doc_handle_store.html#pynetdicom._handlers.doc_handle_store
     """
     log_c_store_received()
-    import_dataset_to_db(event)
+    metrics = get_association_metrics(event)
+    metrics.record_instance(event.request.DataSet.getbuffer().nbytes)
+    try:
+        if add_to_association_batch(event, metrics=metrics):
+            return Status.SUCCESS
+        ingestion_queue = get_ingestion_queue()
+        if ingestion_queue is None:
+            import_dataset_to_db(event, metrics=metrics)
+        elif not queue_dataset(event, ingestion_queue, metrics=metrics):
+            metrics.record_failures(refused=True)
+            return OUT_OF_RESOURCES
+    except Exception:
+        metrics.record_failures()
+        raise
     return Status.SUCCESS
 
 
+def handle_release(event: events.Event) -> None:
+    """
+    Handle an association release or abort event, stop tracking the
+    association's metrics, and import the datasets batched within the
+    association, if any (see
+    :func:`~django_dicom.models.networking.association_batch.add_to_association_batch`).
+
+    Parameters
+    ----------
+    event : events.Event
+        Association release or abort event
+
+
+    .. # noqa: E501
+    """
+    metrics = release_association_metrics(event)
+    import_association_batch(event, metrics=metrics)
+
+
 handlers = [
     (events.EVT_C_ECHO, handle_echo),
     (events.EVT_C_STORE, handle_store),
+    (events.EVT_RELEASED, handle_release),
+    (events.EVT_ABORTED, handle_release),
 ]
 """
-Default handlers specification used to intercept C-STORE and C-ECHO requests.
+Default handlers specification used to intercept C-STORE and C-ECHO requests,
+as well as association releases and aborts.
 
 See Also
 --------
 * :func:`handle_store`
+* :func:`handle_release`
 """
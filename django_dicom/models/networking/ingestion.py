@@ -0,0 +1,482 @@
+"""
+Definition of the :class:`IngestionQueue` class, used to import the datasets
+received by C-STORE requests asynchronously.
+"""
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+from dicom_parser.header import Header as DicomHeader
+from django.db import close_old_connections
+from django_dicom.models.image import Image
+from django_dicom.models.networking import messages
+from django_dicom.models.networking.metrics import ScpMetrics
+from django_dicom.models.networking.utils import (
+    DICOM_ROOT,
+    TEMP_DICOM_FILE_TEMPLATE,
+    save_received_dataset,
+)
+from django_dicom.models.utils.entity_cache import entity_cache
+from django_dicom.models.utils.import_profile import import_profile
+from django_dicom.models.utils.placement import directory_cache
+from django_dicom.models.utils.utils import read_header
+from django_dicom.utils.networking import (
+    ReceivedDataset,
+    get_ingestion_queue_configuration,
+)
+
+logger = logging.getLogger("data.dicom.networking")
+
+
+def import_spooled_records(
+    records: List[Tuple[Union[Path, ReceivedDataset], DicomHeader]]
+) -> int:
+    """
+    Imports received datasets from their already read header information
+    within a single transaction (see
+    :meth:`~django_dicom.models.managers.image.ImageManager.import_chunk`),
+    resolving each patient, study and series only once. Imported files are
+    removed from the spool. Any files that failed to import are kept, and any
+    datasets held in memory that failed to import are saved to the spool, to
+    be retried once the spool is recovered (see :func:`recover_spool`).
+
+    Parameters
+    ----------
+    records : List[Tuple[Union[Path, ReceivedDataset], DicomHeader]]
+        Spooled *.dcm* file paths (or received datasets held in memory, see
+        :class:`~django_dicom.utils.networking.ReceivedDataset`) and header
+        information
+
+    Returns
+    -------
+    int
+        Number of imported datasets
+    """
+    if not records:
+        return 0
+    try:
+        with entity_cache(), import_profile(), directory_cache():
+            Image.objects.import_chunk(records, autoremove=False)
+    except Exception as exception:
+        message = messages.SPOOL_IMPORT_ERROR.format(exception=exception)
+        logger.warning(message)
+    uids = [header.get("SOPInstanceUID") for _, header in records]
+    imported = set(Image.objects.filter(uid__in=uids).values_list("uid", flat=True))
+    n_spooled = 0
+    for (path, _), uid in zip(records, uids):
+        if isinstance(path, ReceivedDataset):
+            if uid not in imported:
+                save_received_dataset(path, durable=True)
+                n_spooled += 1
+        # Files placed without removing the source (see the
+        # *DICOM_FILE_PLACEMENT* setting) are removed from the spool.
+        elif uid in imported and path.is_file():
+            path.unlink()
+    if n_spooled:
+        logger.warning(messages.SPOOL_FAILED_DATASETS.format(n_datasets=n_spooled))
+    return len(imported)
+
+
+def read_received_header(record: Union[Path, ReceivedDataset]) -> DicomHeader:
+    """
+    Reads the header of a spooled *.dcm* file or of a received dataset held in
+    memory, without its pixel data (see
+    :func:`~django_dicom.models.utils.utils.read_header`).
+
+    Parameters
+    ----------
+    record : Union[Path, ReceivedDataset]
+        Spooled *.dcm* file path or received dataset
+
+    Returns
+    -------
+    :class:`dicom_parser.header.Header`
+        Header information
+    """
+    if isinstance(record, ReceivedDataset):
+        return read_header(record.data)
+    return read_header(record)
+
+
+def import_received_records(records: Iterable[Union[Path, ReceivedDataset]]) -> int:
+    """
+    Reads the headers of spooled *.dcm* files and received datasets held in
+    memory (see :func:`read_received_header`) and imports them (see
+    :func:`import_spooled_records`). Received datasets that cannot be read
+    are saved to the spool, like those that fail to import.
+
+    Parameters
+    ----------
+    records : Iterable[Union[Path, ReceivedDataset]]
+        Spooled *.dcm* file paths and received datasets
+
+    Returns
+    -------
+    int
+        Number of imported datasets
+    """
+    readable = []
+    headers = Image.objects.read_headers(records, read=read_received_header)
+    for record, header, error in headers:
+        if error is None:
+            readable.append((record, header))
+            continue
+        logger.warning(error)
+        if isinstance(record, ReceivedDataset):
+            save_received_dataset(record, durable=True)
+    return import_spooled_records(readable)
+
+
+def import_spooled_files(paths: Iterable[Path]) -> int:
+    """
+    Imports spooled *.dcm* files (see
+    :func:`~django_dicom.models.networking.utils.queue_dataset` and
+    :func:`import_received_records`).
+
+    Parameters
+    ----------
+    paths : Iterable[Path]
+        Spooled *.dcm* file paths
+
+    Returns
+    -------
+    int
+        Number of imported files
+    """
+    paths = [Path(path) for path in paths if Path(path).is_file()]
+    return import_received_records(paths)
+
+
+def import_spooled_batches(paths: List[Path], batch_size: int = 50) -> int:
+    """
+    Imports spooled *.dcm* files in batches of up to *batch_size* files (see
+    :func:`import_spooled_files`).
+
+    Parameters
+    ----------
+    paths : List[Path]
+        Spooled *.dcm* file paths
+    batch_size : int, optional
+        Maximal number of files imported together, by default 50
+
+    Returns
+    -------
+    int
+        Number of imported files
+    """
+    n_imported = 0
+    for start in range(0, len(paths), batch_size):
+        end = start + batch_size
+        batch = paths[start:end]
+        close_old_connections()
+        try:
+            n_imported += import_spooled_files(batch)
+        except Exception as exception:
+            message = messages.SPOOL_IMPORT_ERROR.format(exception=exception)
+            logger.warning(message)
+        finally:
+            close_old_connections()
+    return n_imported
+
+
+def get_spooled_files() -> List[Path]:
+    """
+    Returns the *.dcm* files currently in the spool directory.
+
+    Returns
+    -------
+    List[Path]
+        Spooled *.dcm* file paths
+    """
+    pattern = TEMP_DICOM_FILE_TEMPLATE.format(instance_uid="*")
+    return sorted(DICOM_ROOT.glob(pattern))
+
+
+def recover_spool(ingestion_queue: "IngestionQueue" = None) -> threading.Thread:
+    """
+    Queues any datasets left in the spool by a previous run (e.g. following a
+    restart, or an import failure) in a background thread, or imports them
+    if C-STORE datasets are not queued (see the *DICOM_SCP_QUEUE* setting).
+    Only one of the processes sharing a spool should recover it.
+
+    Parameters
+    ----------
+    ingestion_queue : IngestionQueue, optional
+        Ingestion queue to queue spooled datasets to, by default None (import
+        them within the background thread)
+
+    Returns
+    -------
+    threading.Thread
+        Recovery thread, or None if the spool is empty
+    """
+    paths = get_spooled_files()
+    if not paths:
+        return None
+    if ingestion_queue is None:
+        logger.info(messages.SPOOL_RECOVERY_IMPORT.format(n_files=len(paths)))
+        target = import_spooled_batches
+    else:
+        logger.info(messages.SPOOL_RECOVERY.format(n_files=len(paths)))
+        target = ingestion_queue.recover
+    thread = threading.Thread(
+        target=target, args=(paths,), name="dicom-spool-recovery", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+class QueuedDataset(NamedTuple):
+    """
+    A spooled dataset pending import.
+    """
+
+    #: Spooled *.dcm* file path.
+    path: Path
+
+    #: The time (see :func:`time.monotonic`) the dataset was queued at.
+    queued_at: float
+
+    #: Metrics of the association the dataset was received within, if any.
+    metrics: ScpMetrics = None
+
+
+class IngestionQueue:
+    """
+    A bounded queue of spooled C-STORE datasets, imported in batches by a pool
+    of worker threads or dispatched to Celery workers.
+    """
+
+    #: Supported backends.
+    BACKENDS = "thread", "celery"
+
+    def __init__(
+        self,
+        backend: str = "thread",
+        max_size: int = 1000,
+        workers: int = 2,
+        batch_size: int = 50,
+    ):
+        """
+        Creates a new ingestion queue. Worker threads are started once
+        :meth:`start` is called.
+
+        Parameters
+        ----------
+        backend : str, optional
+            Either *"thread"*, to import batches within this process, or
+            *"celery"*, to dispatch batches to Celery workers, by default
+            "thread"
+        max_size : int, optional
+            Maximal number of queued datasets, by default 1000
+        workers : int, optional
+            Number of worker threads, by default 2
+        batch_size : int, optional
+            Maximal number of datasets imported (or dispatched) together, by
+            default 50
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(messages.INVALID_QUEUE_BACKEND.format(backend=backend))
+        self.backend = backend
+        self.max_size = max_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=max_size)
+        self._threads = []
+
+    @classmethod
+    def from_settings(cls):
+        """
+        Creates the ingestion queue configured by the *DICOM_SCP_QUEUE*
+        setting.
+
+        Returns
+        -------
+        IngestionQueue
+            Ingestion queue, or None if C-STORE datasets should be imported
+            synchronously
+        """
+        configuration = get_ingestion_queue_configuration()
+        if configuration is not None:
+            return cls(**configuration)
+
+    @property
+    def depth(self) -> int:
+        """
+        Returns the number of queued datasets.
+
+        Returns
+        -------
+        int
+            Queue depth
+        """
+        return self._queue.qsize()
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Returns whether the queue is full.
+
+        Returns
+        -------
+        bool
+            Whether new datasets should be refused
+        """
+        return self._queue.full()
+
+    def put(self, path: Path, metrics: ScpMetrics = None) -> bool:
+        """
+        Queues a spooled *.dcm* file for import.
+
+        Parameters
+        ----------
+        path : Path
+            Spooled *.dcm* file path
+        metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+            Metrics to record the dataset's queue wait and import latencies
+            to, by default None
+
+        Returns
+        -------
+        bool
+            Whether the file was queued (False if the queue is full)
+
+
+        .. # noqa: E501
+        """
+        try:
+            self._queue.put_nowait(QueuedDataset(path, time.monotonic(), metrics))
+        except queue.Full:
+            return False
+        return True
+
+    def start(self, recover: bool = True) -> None:
+        """
+        Starts the worker threads and queues any files left in the spool by a
+        previous run (see :func:`recover_spool`).
+
+        Parameters
+        ----------
+        recover : bool, optional
+            Whether to queue previously spooled files, by default True (only
+            one of the queues sharing a spool should recover it)
+        """
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self.work, name=f"dicom-ingestion-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        if recover:
+            recover_spool(self)
+
+    def recover(self, paths: List[Path]) -> None:
+        """
+        Queues previously spooled files, waiting for room in the queue as
+        required.
+
+        Parameters
+        ----------
+        paths : List[Path]
+            Spooled *.dcm* file paths
+        """
+        for path in paths:
+            self._queue.put(QueuedDataset(path, time.monotonic()))
+
+    def get_batch(self) -> List[QueuedDataset]:
+        """
+        Waits for a queued dataset and returns it along with any others that
+        are already queued, up to :attr:`batch_size`.
+
+        Returns
+        -------
+        List[QueuedDataset]
+            Queued datasets
+        """
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def dispatch(self, batch: List[Path]) -> int:
+        """
+        Imports a batch of spooled files (see :func:`import_spooled_files`),
+        or sends it to a Celery worker.
+
+        Parameters
+        ----------
+        batch : List[Path]
+            Spooled *.dcm* file paths
+
+        Returns
+        -------
+        int
+            Number of imported files, or None if sent to a Celery worker
+        """
+        if self.backend == "celery":
+            from django_dicom.tasks import import_spooled
+
+            import_spooled.delay([str(path) for path in batch])
+            return
+        close_old_connections()
+        try:
+            return import_spooled_files(batch)
+        finally:
+            close_old_connections()
+
+    def process(self, batch: List[QueuedDataset]) -> None:
+        """
+        Dispatches a batch of queued datasets (see :meth:`dispatch`) and
+        records their queue wait and amortized import latencies, as well as
+        any import failures.
+
+        Parameters
+        ----------
+        batch : List[QueuedDataset]
+            Queued datasets
+        """
+        start = time.monotonic()
+        for item in batch:
+            if item.metrics is not None:
+                item.metrics.observe("queue_wait", start - item.queued_at)
+        n_imported = self.dispatch([item.path for item in batch])
+        if n_imported is None:
+            return
+        elapsed = (time.monotonic() - start) / len(batch)
+        for item in batch:
+            if item.metrics is None:
+                continue
+            # Files that failed to import are kept in the spool.
+            if item.path.exists():
+                item.metrics.record_failures()
+            else:
+                item.metrics.observe("import", elapsed)
+
+    def work(self) -> None:
+        """
+        Worker thread loop.
+        """
+        while True:
+            batch = self.get_batch()
+            try:
+                self.process(batch)
+            except Exception as exception:
+                message = messages.SPOOL_IMPORT_ERROR.format(exception=exception)
+                logger.warning(message)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def join(self) -> None:
+        """
+        Blocks until all queued datasets were processed.
+        """
+        self._queue.join()
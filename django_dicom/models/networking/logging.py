@@ -15,6 +15,16 @@ def log_dataset_saved(file_name: str, level=logging.DEBUG) -> None:
     logger.log(level, message)
 
 
+def log_dataset_queued(file_name: str, depth: int, level=logging.DEBUG) -> None:
+    message = messages.DATASET_QUEUED.format(file_name=file_name, depth=depth)
+    logger.log(level, message)
+
+
+def log_queue_full(depth: int, level=logging.WARNING) -> None:
+    message = messages.QUEUE_FULL.format(depth=depth)
+    logger.log(level, message)
+
+
 def log_import_start(file_name: str, level=logging.DEBUG) -> None:
     message = messages.IMAGE_IMPORT_START.format(file_name=file_name)
     logger.log(level, message)
@@ -25,11 +35,8 @@ def log_import_end(file_name: str, level=logging.DEBUG) -> None:
     logger.log(level, message)
 
 
-def log_cleanup_start(file_name: str, level=logging.DEBUG) -> None:
-    message = messages.TEMP_DICOM_REMOVAL_START.format(file_name=file_name)
-    logger.log(level, message)
-
-
-def log_cleanup_end(file_name: str, level=logging.DEBUG) -> None:
-    message = messages.TEMP_DICOM_REMOVAL_END.format(file_name=file_name)
+def log_batch_import(n_imported: int, n_received: int, level=logging.INFO) -> None:
+    message = messages.ASSOCIATION_BATCH_IMPORTED.format(
+        n_imported=n_imported, n_received=n_received
+    )
     logger.log(level, message)
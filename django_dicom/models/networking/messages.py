@@ -1,20 +1,44 @@
 APPLICATION_ENTITY_START = "Starting DICOM networking application entity '{title}'..."
 APPLICATION_ENTITY_SUCCESS = "DICOM networking application entity successfully created."
+ASSOCIATION_BATCH_IMPORTED = (
+    "Imported {n_imported} of {n_received} datasets received within the association."
+)
 C_ECHO_ENABLED = "C-ECHO request handling enabled."
 C_ECHO_RECEIVED = "C-ECHO request received."
 C_STORE_RECEIVED = "C-STORE request received."
 IMAGE_IMPORT_END = "Successfully imported {file_name} to the database."
 IMAGE_IMPORT_START = "Importing {file_name} to the database..."
+INVALID_QUEUE_BACKEND = "Invalid ingestion queue backend: '{backend}'!"
+INVALID_RUNNER_MODE = "Invalid storage SCP runner mode: '{mode}'!"
+METRICS_PUBLISH_ERROR = (
+    "Failed to publish storage SCP metrics with the following exception: {exception}"
+)
 PDU_LIMIT_CONFIGURATION = (
     "DICOM dataset transfer PDU size limited to {maximum_pdu_size} data units."
 )
-TEMP_DICOM_REMOVAL_END = "Successfully deleted {file_name}."
-TEMP_DICOM_REMOVAL_START = "Removing temporary file {file_name}..."
+RUNNER_AUTOSTART = "Storage SCP servers were already started by this process! Set DICOM_AE_AUTOSTART to False to serve them using the storage SCP runner."
+RUNNER_START = (
+    "Serving {n_providers} storage SCPs using {n_workers} worker processes ({mode})..."
+)
+RUNNER_WORKER_EXITED = (
+    "Storage SCP worker {index} exited with code {exitcode}! Restarting..."
+)
+RUNNER_WORKER_START = "Storage SCP worker {index} started (PID {pid})."
 SERVER_START = "Starting storage SCP at {provider}..."
 SERVER_START_SUCCESS = "SUCCESS! Storage SCP server successfully started."
 SERVER_START_ERROR = (
     "Failed to start storage SCP server with the following exception: {exception}"
 )
+DATASET_QUEUED = "{file_name} queued for import (queue depth: {depth})."
+QUEUE_FULL = "Ingestion queue is full ({depth} datasets)! Refusing C-STORE request."
+SPOOL_IMPORT_ERROR = (
+    "Failed to import spooled datasets with the following exception: {exception}"
+)
+SPOOL_FAILED_DATASETS = (
+    "Saved {n_datasets} received datasets that failed to import to the spool."
+)
+SPOOL_RECOVERY = "Queueing {n_files} previously spooled datasets for import..."
+SPOOL_RECOVERY_IMPORT = "Importing {n_files} previously spooled datasets..."
 SERVER_NOT_CREATED = "Server instantiation failed with no exception! No new server found in the app's application entity."
 WRITE_DICOM_DATASET = "Writing DICOM dataset..."
 WRITE_DICOM_END = "DICOM dataset successfully created as {file_name}."
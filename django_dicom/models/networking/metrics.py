@@ -0,0 +1,448 @@
+"""
+Definition of the :class:`ScpMetrics` class, used to collect storage SCP
+throughput and latency measurements. Measurements are kept in memory by the
+process serving the storage SCP, and periodically published to the database
+(see :func:`start_metrics_publisher`) so that they may be summed across
+processes (see :func:`merge_metrics`).
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+from weakref import WeakKeyDictionary
+
+from django.apps import apps
+from django.db import close_old_connections
+from django_dicom.models.networking import messages
+from django_dicom.models.utils.meta import get_model
+from pynetdicom import events
+
+#: Upper bounds (in seconds) of the latency histograms' buckets.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, float("inf"))
+
+#: Measured latencies.
+LATENCIES = "write", "import", "queue_wait"
+
+#: Summed counters.
+COUNTERS = "bytes_received", "instances", "failures", "refused"
+
+#: Number of seconds between publications of the metrics collected by the
+#: current process.
+PUBLISH_INTERVAL = 5
+
+#: Number of seconds since their last publication after which the metrics of
+#: a process are no longer reported (e.g. once it exited).
+SNAPSHOT_EXPIRY = 60
+
+#: Metrics by storage SCP port.
+PROVIDER_METRICS: Dict[int, "ScpMetrics"] = {}
+
+#: Metrics of the currently active associations.
+ASSOCIATION_METRICS = WeakKeyDictionary()
+
+_registry_lock = threading.Lock()
+
+_publisher: threading.Thread = None
+
+logger = logging.getLogger("data.dicom.networking")
+
+
+class Histogram:
+    """
+    A latency histogram using fixed buckets (see :attr:`LATENCY_BUCKETS`).
+    """
+
+    __slots__ = "counts", "count", "total"
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float, count: int = 1) -> None:
+        """
+        Adds a measurement to the histogram.
+
+        Parameters
+        ----------
+        seconds : float
+            Measured latency
+        count : int, optional
+            Number of times the latency was measured, by default 1
+        """
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += count
+        self.count += count
+        self.total += seconds * count
+
+    def to_dict(self) -> dict:
+        """
+        Returns a JSON serializable representation of this histogram, with
+        cumulative bucket counts.
+
+        Returns
+        -------
+        dict
+            Histogram summary
+        """
+        buckets, cumulative = {}, 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        mean = self.total / self.count if self.count else None
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": mean,
+            "buckets": buckets,
+        }
+
+
+class ScpMetrics:
+    """
+    Throughput and latency counters of a storage SCP or a single association.
+    Measurements recorded by an association's metrics are also recorded by
+    its *parent* (i.e. its storage SCP's metrics).
+    """
+
+    def __init__(self, parent=None):
+        """
+        Creates new metrics.
+
+        Parameters
+        ----------
+        parent : ScpMetrics, optional
+            Metrics to record the same measurements to, by default None
+        """
+        self.parent = parent
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        self.bytes_received = 0
+        self.instances = 0
+        self.failures = 0
+        self.refused = 0
+        self.latencies = {name: Histogram() for name in LATENCIES}
+        self._lock = threading.Lock()
+
+    def record_instance(self, size: int) -> None:
+        """
+        Records a received instance.
+
+        Parameters
+        ----------
+        size : int
+            Received dataset size (in bytes)
+        """
+        with self._lock:
+            self.instances += 1
+            self.bytes_received += size
+        if self.parent is not None:
+            self.parent.record_instance(size)
+
+    def record_failures(self, n_failed: int = 1, refused: bool = False) -> None:
+        """
+        Records instances that failed to import, or were refused.
+
+        Parameters
+        ----------
+        n_failed : int, optional
+            Number of instances, by default 1
+        refused : bool, optional
+            Whether the instances were refused (see the *DICOM_SCP_QUEUE*
+            setting), by default False
+        """
+        with self._lock:
+            if refused:
+                self.refused += n_failed
+            else:
+                self.failures += n_failed
+        if self.parent is not None:
+            self.parent.record_failures(n_failed, refused=refused)
+
+    def observe(self, name: str, seconds: float, count: int = 1) -> None:
+        """
+        Records a latency measurement.
+
+        Parameters
+        ----------
+        name : str
+            Latency name (see :attr:`LATENCIES`)
+        seconds : float
+            Measured latency
+        count : int, optional
+            Number of instances the latency applies to (e.g. the amortized
+            import latency of a batch), by default 1
+        """
+        with self._lock:
+            self.latencies[name].observe(seconds, count)
+        if self.parent is not None:
+            self.parent.observe(name, seconds, count)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Records the latency of the code executed within the context, if it
+        does not raise an exception.
+
+        Parameters
+        ----------
+        name : str
+            Latency name (see :attr:`LATENCIES`)
+        """
+        start = time.perf_counter()
+        yield
+        self.observe(name, time.perf_counter() - start)
+
+    def to_dict(self) -> dict:
+        """
+        Returns a JSON serializable representation of these metrics.
+
+        Returns
+        -------
+        dict
+            Metrics summary
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "started": self.started_at,
+                "uptime": elapsed,
+                "bytes_received": self.bytes_received,
+                "instances": self.instances,
+                "instances_per_second": self.instances / elapsed if elapsed else 0,
+                "failures": self.failures,
+                "refused": self.refused,
+                "latency": {
+                    name: histogram.to_dict()
+                    for name, histogram in self.latencies.items()
+                },
+            }
+
+
+def get_provider_metrics(port: int) -> ScpMetrics:
+    """
+    Returns the metrics of the storage SCP listening on the provided port,
+    creating them if required. Used to record measurements, reads should use
+    :attr:`PROVIDER_METRICS` directly.
+
+    Parameters
+    ----------
+    port : int
+        Storage SCP port
+
+    Returns
+    -------
+    ScpMetrics
+        Storage SCP metrics
+    """
+    try:
+        return PROVIDER_METRICS[port]
+    except KeyError:
+        with _registry_lock:
+            return PROVIDER_METRICS.setdefault(port, ScpMetrics())
+
+
+def register_provider_metrics(port: int) -> ScpMetrics:
+    """
+    Registers the metrics of a storage SCP served by the current process and
+    starts publishing them (see :func:`start_metrics_publisher`). Called once
+    the storage SCP starts serving, so that its uptime is measured from then.
+
+    Parameters
+    ----------
+    port : int
+        Storage SCP port
+
+    Returns
+    -------
+    ScpMetrics
+        Storage SCP metrics
+    """
+    metrics = get_provider_metrics(port)
+    start_metrics_publisher()
+    return metrics
+
+
+def get_worker_id() -> str:
+    """
+    Returns an identifier of the current process, used to publish its
+    metrics.
+
+    Returns
+    -------
+    str
+        Host name and process ID
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def publish_metrics() -> None:
+    """
+    Publishes the metrics of the storage SCPs served by the current process,
+    along with its ingestion queue's depth (see
+    :meth:`~django_dicom.models.managers.metrics_snapshot.ScpMetricsSnapshotManager.publish`).
+
+
+    .. # noqa: E501
+    """
+    ingestion_queue = apps.get_app_config("django_dicom").ingestion_queue
+    queue_depth = None if ingestion_queue is None else ingestion_queue.depth
+    ScpMetricsSnapshot = get_model("ScpMetricsSnapshot")
+    ScpMetricsSnapshot.objects.publish(
+        dict(PROVIDER_METRICS), get_worker_id(), queue_depth=queue_depth
+    )
+
+
+def run_metrics_publisher(interval: float = PUBLISH_INTERVAL) -> None:
+    """
+    Metrics publisher thread loop (see :func:`publish_metrics`).
+
+    Parameters
+    ----------
+    interval : float, optional
+        Number of seconds between publications, by default
+        :attr:`PUBLISH_INTERVAL`
+    """
+    while True:
+        time.sleep(interval)
+        close_old_connections()
+        try:
+            publish_metrics()
+        except Exception as exception:
+            message = messages.METRICS_PUBLISH_ERROR.format(exception=exception)
+            logger.warning(message)
+        finally:
+            close_old_connections()
+
+
+def start_metrics_publisher() -> threading.Thread:
+    """
+    Starts publishing the metrics collected by the current process, unless
+    already started (threads do not survive forking, so forked worker
+    processes start their own).
+
+    Returns
+    -------
+    threading.Thread
+        Metrics publisher thread
+    """
+    global _publisher
+    with _registry_lock:
+        if _publisher is None or not _publisher.is_alive():
+            _publisher = threading.Thread(
+                target=run_metrics_publisher, name="dicom-metrics", daemon=True
+            )
+            _publisher.start()
+    return _publisher
+
+
+def merge_metrics(summaries: List[dict]) -> dict:
+    """
+    Sums the metrics summaries (see :meth:`ScpMetrics.to_dict`) collected by
+    the processes serving a storage SCP. The uptime is measured from the
+    earliest start, and the queue depth is summed over the processes that
+    queue received datasets.
+
+    Parameters
+    ----------
+    summaries : List[dict]
+        Metrics summaries
+
+    Returns
+    -------
+    dict
+        Merged metrics summary, including the number of *workers* and their
+        total *queue_depth* (None if no worker queues received datasets)
+    """
+    merged = ScpMetrics().to_dict()
+    merged.update(started=None, uptime=0, instances_per_second=0)
+    merged["workers"] = len(summaries)
+    merged["queue_depth"] = None
+    for summary in summaries:
+        for name in COUNTERS:
+            merged[name] += summary[name]
+        queue_depth = summary.get("queue_depth")
+        if queue_depth is not None:
+            merged["queue_depth"] = (merged["queue_depth"] or 0) + queue_depth
+        for name, histogram in summary["latency"].items():
+            merged_histogram = merged["latency"][name]
+            merged_histogram["count"] += histogram["count"]
+            merged_histogram["sum"] += histogram["sum"]
+            for bound, count in histogram["buckets"].items():
+                merged_histogram["buckets"][bound] += count
+    for histogram in merged["latency"].values():
+        if histogram["count"]:
+            histogram["mean"] = histogram["sum"] / histogram["count"]
+    if summaries:
+        merged["started"] = min(summary["started"] for summary in summaries)
+        merged["uptime"] = max(time.time() - merged["started"], 0)
+        if merged["uptime"]:
+            merged["instances_per_second"] = merged["instances"] / merged["uptime"]
+    return merged
+
+
+def get_association_metrics(event: events.Event) -> ScpMetrics:
+    """
+    Returns the metrics of the association an event was triggered by.
+
+    Parameters
+    ----------
+    event : events.Event
+        Association event
+
+    Returns
+    -------
+    ScpMetrics
+        Association metrics
+    """
+    metrics = ASSOCIATION_METRICS.get(event.assoc)
+    if metrics is None:
+        parent = get_provider_metrics(event.assoc.acceptor.port)
+        metrics = ASSOCIATION_METRICS[event.assoc] = ScpMetrics(parent=parent)
+    return metrics
+
+
+def release_association_metrics(event: events.Event) -> ScpMetrics:
+    """
+    Stops tracking the metrics of a released or aborted association.
+
+    Parameters
+    ----------
+    event : events.Event
+        Association release or abort event
+
+    Returns
+    -------
+    ScpMetrics
+        Association metrics, or None if no instances were received
+    """
+    return ASSOCIATION_METRICS.pop(event.assoc, None)
+
+
+def get_active_association_metrics(port: int) -> list:
+    """
+    Returns the metrics of the currently active associations with the storage
+    SCP listening on the provided port.
+
+    Parameters
+    ----------
+    port : int
+        Storage SCP port
+
+    Returns
+    -------
+    List[dict]
+        Association metrics summaries
+    """
+    return [
+        {
+            "address": assoc.requestor.address,
+            "port": assoc.requestor.port,
+            **metrics.to_dict(),
+        }
+        for assoc, metrics in list(ASSOCIATION_METRICS.items())
+        if assoc.acceptor.port == port and assoc.is_established
+    ]
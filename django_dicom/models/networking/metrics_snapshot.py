@@ -0,0 +1,44 @@
+"""
+Definition of the :class:`ScpMetricsSnapshot` model.
+"""
+from django.db import models
+from django_dicom.models.managers.metrics_snapshot import ScpMetricsSnapshotManager
+
+
+class ScpMetricsSnapshot(models.Model):
+    """
+    A model representing the storage SCP metrics last published by a single
+    process serving it (see
+    :func:`~django_dicom.models.networking.metrics.start_metrics_publisher`).
+    """
+
+    #: Storage SCP port.
+    port = models.PositiveIntegerField()
+
+    #: Publishing process identifier (see
+    #: :func:`~django_dicom.models.networking.metrics.get_worker_id`).
+    worker = models.CharField(max_length=255)
+
+    #: Metrics summary (see
+    #: :meth:`~django_dicom.models.networking.metrics.ScpMetrics.to_dict`).
+    metrics = models.JSONField()
+
+    #: Last time the metrics were published.
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = ScpMetricsSnapshotManager()
+
+    class Meta:
+        unique_together = "port", "worker"
+        verbose_name = "Storage SCP metrics snapshot"
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of this instance.
+
+        Returns
+        -------
+        str
+            This instance's string representation
+        """
+        return f"{self.worker}@{self.port}"
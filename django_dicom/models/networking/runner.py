@@ -0,0 +1,303 @@
+"""
+Definition of the :class:`StorageScpRunner` class, used to serve the storage
+SCPs using multiple worker processes.
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from typing import Dict, List
+
+from django.apps import apps
+from django.db import connections
+from django_dicom.models.networking import messages
+from django_dicom.models.networking.handlers import handlers
+from django_dicom.models.networking.ingestion import (
+    IngestionQueue,
+    get_spooled_files,
+    import_spooled_batches,
+)
+from django_dicom.models.networking.metrics import register_provider_metrics
+from django_dicom.models.networking.storage_scp import StorageServiceClassProvider
+from pynetdicom.transport import ThreadedAssociationServer
+
+logger = logging.getLogger("data.dicom.networking")
+
+
+class SharedSocketAssociationServer(ThreadedAssociationServer):
+    """
+    A threaded association server that either accepts associations from an
+    already listening socket shared by multiple processes, or binds its own
+    socket with *SO_REUSEPORT* so that the kernel spreads associations across
+    the processes binding the same address.
+    """
+
+    def __init__(self, *args, listening_socket: socket.socket = None, **kwargs):
+        """
+        Creates a new association server.
+
+        Parameters
+        ----------
+        listening_socket : socket.socket, optional
+            Listening socket to accept associations from, by default None
+            (bind a socket with *SO_REUSEPORT*)
+        """
+        self.listening_socket = listening_socket
+        super().__init__(*args, **kwargs)
+
+    def server_bind(self) -> None:
+        """
+        Overrides :meth:`~pynetdicom.transport.AssociationServer.server_bind`
+        to use the shared listening socket, if provided.
+        """
+        if self.listening_socket is None:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            super().server_bind()
+            return
+        self.socket.close()
+        self.socket = self.listening_socket
+        self.server_address = self.socket.getsockname()
+
+    def server_activate(self) -> None:
+        """
+        Overrides :meth:`socketserver.TCPServer.server_activate` to skip
+        listening on an already listening shared socket.
+        """
+        if self.listening_socket is None:
+            super().server_activate()
+
+
+class StorageScpRunner:
+    """
+    Serves the storage SCPs using a supervisor process and a number of worker
+    processes. In *"prefork"* mode, the supervisor binds the listening
+    sockets and the workers inherit them, otherwise (*"reuseport"*) each
+    worker binds its own sockets with *SO_REUSEPORT*. Either way,
+    associations are spread across the workers by the kernel, and workers
+    that exit are restarted.
+    """
+
+    #: Supported modes.
+    MODES = "prefork", "reuseport"
+
+    #: Number of seconds between worker liveness checks.
+    MONITOR_INTERVAL = 1
+
+    #: Listening sockets' backlog size.
+    BACKLOG = 128
+
+    def __init__(
+        self, workers: int = None, mode: str = "prefork", providers: list = None
+    ):
+        """
+        Creates a new runner.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes, by default None (the number of CPUs)
+        mode : str, optional
+            Either *"prefork"* or *"reuseport"*, by default "prefork"
+        providers : list, optional
+            Storage SCPs to serve, by default None (all
+            :class:`~django_dicom.models.networking.storage_scp.StorageServiceClassProvider`
+            instances)
+
+
+        .. # noqa: E501
+        """
+        if mode not in self.MODES:
+            raise ValueError(messages.INVALID_RUNNER_MODE.format(mode=mode))
+        self.workers = workers or os.cpu_count()
+        self.mode = mode
+        if providers is None:
+            providers = StorageServiceClassProvider.objects.all()
+        self.providers = list(providers)
+        self.sockets: Dict[int, socket.socket] = {}
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self._stopped = threading.Event()
+
+    def bind_sockets(self) -> Dict[int, socket.socket]:
+        """
+        Binds a listening socket for each storage SCP.
+
+        Returns
+        -------
+        Dict[int, socket.socket]
+            Listening sockets by storage SCP ID
+        """
+        sockets = {}
+        for provider in self.providers:
+            listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listening_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listening_socket.bind((provider.ip or "", provider.port))
+            listening_socket.listen(self.BACKLOG)
+            sockets[provider.id] = listening_socket
+        return sockets
+
+    def start_server(
+        self, provider: StorageServiceClassProvider
+    ) -> SharedSocketAssociationServer:
+        """
+        Starts a storage SCP's association server within a worker process.
+
+        Parameters
+        ----------
+        provider : StorageServiceClassProvider
+            Storage SCP to serve
+
+        Returns
+        -------
+        SharedSocketAssociationServer
+            Non-blocking association server
+        """
+        application_entity = provider.application_entity
+        server = application_entity.make_server(
+            (provider.ip or "", provider.port),
+            contexts=provider._supported_contexts,
+            evt_handlers=handlers,
+            server_class=SharedSocketAssociationServer,
+            listening_socket=self.sockets.get(provider.id),
+        )
+        thread = threading.Thread(
+            target=server.serve_forever, name=f"AcceptorServer@{provider}"
+        )
+        thread.daemon = True
+        thread.start()
+        application_entity._servers.append(server)
+        register_provider_metrics(provider.port)
+        return server
+
+    def serve(self, index: int) -> None:
+        """
+        Worker process entry point. Serves all storage SCPs until the process
+        is terminated.
+
+        Parameters
+        ----------
+        index : int
+            Worker index
+        """
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *args: stopped.set())
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        config = apps.get_app_config("django_dicom")
+        config.application_entity = config.create_application_entity()
+        ingestion_queue = IngestionQueue.from_settings()
+        if ingestion_queue is not None:
+            # The spool is recovered by the supervisor (see recover_spool()).
+            ingestion_queue.start(recover=False)
+            config.ingestion_queue = ingestion_queue
+        servers = [self.start_server(provider) for provider in self.providers]
+        logger.info(messages.RUNNER_WORKER_START.format(index=index, pid=os.getpid()))
+        stopped.wait()
+        for server in servers:
+            server.shutdown()
+        connections.close_all()
+
+    def recover_spool(self) -> int:
+        """
+        Imports any datasets left in the spool by a previous run before the
+        worker processes are started (and before the listening sockets are
+        bound), so that workers never queue spooled files that are already
+        being imported by another worker, including once restarted.
+
+        Returns
+        -------
+        int
+            Number of imported datasets
+        """
+        paths = get_spooled_files()
+        if not paths:
+            return 0
+        logger.info(messages.SPOOL_RECOVERY_IMPORT.format(n_files=len(paths)))
+        return import_spooled_batches(paths)
+
+    def start_worker(self, index: int) -> multiprocessing.Process:
+        """
+        Forks a worker process.
+
+        Parameters
+        ----------
+        index : int
+            Worker index
+
+        Returns
+        -------
+        multiprocessing.Process
+            Started worker process
+        """
+        # Database connections must not be shared with forked processes.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        process = context.Process(
+            target=self.serve, args=(index,), name=f"storage-scp-worker-{index}"
+        )
+        process.start()
+        return process
+
+    def stop(self, *args) -> None:
+        """
+        Stops supervising and terminates the worker processes (may be used as
+        a signal handler).
+        """
+        self._stopped.set()
+
+    def run(self) -> None:
+        """
+        Recovers the spool (see :meth:`recover_spool`), then starts the worker
+        processes and supervises them until stopped (see :meth:`stop`),
+        restarting any worker that exits.
+        """
+        self.recover_spool()
+        if self.mode == "prefork":
+            self.sockets = self.bind_sockets()
+        logger.info(
+            messages.RUNNER_START.format(
+                n_workers=self.workers, n_providers=len(self.providers), mode=self.mode,
+            )
+        )
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        try:
+            for index in range(self.workers):
+                self.processes[index] = self.start_worker(index)
+            while not self._stopped.wait(self.MONITOR_INTERVAL):
+                self.restart_exited_workers()
+        finally:
+            self.terminate_workers()
+            for listening_socket in self.sockets.values():
+                listening_socket.close()
+
+    def restart_exited_workers(self) -> List[int]:
+        """
+        Restarts any worker processes that exited.
+
+        Returns
+        -------
+        List[int]
+            Restarted worker indices
+        """
+        restarted = []
+        for index, process in list(self.processes.items()):
+            if not process.is_alive():
+                message = messages.RUNNER_WORKER_EXITED.format(
+                    index=index, exitcode=process.exitcode
+                )
+                logger.warning(message)
+                self.processes[index] = self.start_worker(index)
+                restarted.append(index)
+        return restarted
+
+    def terminate_workers(self) -> None:
+        """
+        Terminates the worker processes and waits for them to exit.
+        """
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes.values():
+            process.join()
+        self.processes = {}
@@ -10,11 +10,20 @@ from django.db import models
 from django_dicom.models.managers.storage_scp import StorageScpQuerySet
 from django_dicom.models.networking import messages
 from django_dicom.models.networking.handlers import handlers
+from django_dicom.models.networking.metrics import (
+    PROVIDER_METRICS,
+    get_active_association_metrics,
+    get_worker_id,
+    merge_metrics,
+    register_provider_metrics,
+)
+from django_dicom.models.networking.metrics_snapshot import ScpMetricsSnapshot
 from django_dicom.models.networking.status import ServerStatus
 from django_dicom.models.networking.utils import (
     MAX_PORT_NUMBER,
     PRESENTATION_CONTEXTS,
     UID_MAX_LENGTH,
+    get_ingestion_queue,
 )
 from django_dicom.models.utils.fields import ChoiceArrayField
 from pynetdicom import AE, AllStoragePresentationContexts
@@ -126,6 +135,7 @@ class StorageServiceClassProvider(models.Model):
         else:
             if isinstance(server, ThreadedAssociationServer):
                 self._log_server_start_success()
+                register_provider_metrics(self.port)
                 return server
             else:
                 self._log_silent_failure()
@@ -275,6 +285,59 @@ class StorageServiceClassProvider(models.Model):
         """
         return self.check_status()
 
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns the number of received datasets pending import.
+
+        Returns
+        -------
+        int
+            Ingestion queue depth, or None if datasets are imported
+            synchronously
+
+        See Also
+        --------
+        * :class:`~django_dicom.models.networking.ingestion.IngestionQueue`
+        """
+        ingestion_queue = get_ingestion_queue()
+        if ingestion_queue is not None:
+            return ingestion_queue.depth
+
+    @property
+    def metrics(self) -> dict:
+        """
+        Returns the storage SCP's throughput and latency metrics, summed
+        across the processes serving it (see
+        :func:`~django_dicom.models.networking.metrics.merge_metrics`). The
+        current process's metrics are read from memory, and those of any other
+        processes from their last published snapshots.
+
+        Returns
+        -------
+        dict
+            Storage SCP metrics, including the current process's active
+            associations' metrics
+
+        See Also
+        --------
+        * :class:`~django_dicom.models.networking.metrics.ScpMetrics`
+        * :class:`~django_dicom.models.networking.metrics_snapshot.ScpMetricsSnapshot`
+        """
+        worker = get_worker_id()
+        summaries = ScpMetricsSnapshot.objects.get_summaries(
+            self.port, exclude_worker=worker
+        )
+        local_metrics = PROVIDER_METRICS.get(self.port)
+        if local_metrics is not None:
+            summaries.append(
+                {**local_metrics.to_dict(), "queue_depth": self.queue_depth}
+            )
+        return {
+            **merge_metrics(summaries),
+            "associations": get_active_association_metrics(self.port),
+        }
+
     @property
     def is_down(self) -> bool:
         """
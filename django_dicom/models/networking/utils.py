@@ -2,18 +2,27 @@
 Utilities for the networking module.
 """
 import logging
+import os
+from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO, Callable
+from weakref import WeakKeyDictionary
 
+from dicom_parser.header import Header as DicomHeader
+from django.apps import apps
 from django_dicom.models.image import Image
 from django_dicom.models.networking import messages
 from django_dicom.models.networking.logging import (
-    log_cleanup_end,
-    log_cleanup_start,
+    log_dataset_queued,
     log_dataset_saved,
     log_import_end,
     log_import_start,
+    log_queue_full,
 )
-from django_dicom.models.utils import get_dicom_root
+from django_dicom.models.networking.metrics import ScpMetrics
+from django_dicom.models.utils import get_dicom_root, read_header
+from django_dicom.models.utils.entity_cache import EntityCache, entity_cache
+from django_dicom.utils.networking import ReceivedDataset
 from pydicom.filewriter import write_file_meta_info
 from pynetdicom import AllStoragePresentationContexts, events
 
@@ -40,14 +49,20 @@ Tuples of presentation context UIDs and string representations.
 
 TEMP_DICOM_FILE_TEMPLATE = "{instance_uid}.dcm"
 """
-File name template to use when creating temporary *.dcm* files to import to
-the database (used on C-STORE requests).
+File name template to use when spooling C-STORE datasets queued for import
+(see :func:`queue_dataset`).
 """
 
 DICOM_ROOT = get_dicom_root()
 """
-DICOM data root directory with MEDIA_ROOT. Used to store the temporary *.dcm*
-files created on C-STORE requests.
+DICOM data root directory with MEDIA_ROOT. Used to spool the *.dcm* files
+queued for import on C-STORE requests.
+"""
+
+ASSOCIATION_ENTITY_CACHES = WeakKeyDictionary()
+"""
+Entity caches by association, used to resolve the patient, study and series
+of the datasets received within a single association only once.
 """
 
 
@@ -69,63 +84,235 @@ def get_temp_path(instance_uid: str) -> Path:
     return DICOM_ROOT / file_name
 
 
-def save_dataset(event: events.Event) -> Path:
+def write_dataset(content: BinaryIO, event: events.Event) -> None:
     """
-    Save the dataset to a temporary location within MEDIA_ROOT.
+    Writes a C-STORE request provided dataset in the DICOM file format, i.e.
+    the preamble, prefix, File Meta Information and the encoded dataset as
+    received.
 
     Parameters
     ----------
+    content : BinaryIO
+        Binary file-like object to write to
     event : events.Event
         C-STORE request event
-    path : Path
-        Destination path
     """
-    instance_uid = event.request.AffectedSOPInstanceUID
+    # Write the preamble and prefix
+    logging.debug(messages.WRITE_DICOM_PREFIX)
+    content.write(b"\x00" * 128)
+    content.write(b"DICM")
+
+    # Encode and write the File Meta Information
+    logging.debug(messages.WRITE_DICOM_METADATA)
+    write_file_meta_info(content, event.file_meta)
+
+    # Write the encoded dataset
+    logging.debug(messages.WRITE_DICOM_DATASET)
+    content.write(event.request.DataSet.getbuffer())
+
+
+def encode_dataset(event: events.Event) -> bytes:
+    """
+    Returns a C-STORE request provided dataset in the DICOM file format (see
+    :func:`write_dataset`).
+
+    Parameters
+    ----------
+    event : events.Event
+        C-STORE request event
+
+    Returns
+    -------
+    bytes
+        Binary DICOM image data
+    """
+    content = BytesIO()
+    write_dataset(content, event)
+    return content.getvalue()
+
+
+def read_event_header(event: events.Event) -> DicomHeader:
+    """
+    Returns the header information of a C-STORE request provided dataset,
+    using the dataset pynetdicom already decoded rather than reading it again.
+
+    Parameters
+    ----------
+    event : events.Event
+        C-STORE request event
+
+    Returns
+    -------
+    :class:`dicom_parser.header.Header`
+        Header information
+    """
+    dataset = event.dataset
+    dataset.file_meta = event.file_meta
+    return read_header(dataset)
+
+
+def spool_file(
+    instance_uid: str, write: Callable[[BinaryIO], None], durable: bool = False
+) -> Path:
+    """
+    Writes a dataset to a temporary location within MEDIA_ROOT. The dataset
+    is written under a partial file name first, so that only complete files
+    are ever found at the returned path.
+
+    Parameters
+    ----------
+    instance_uid : str
+        SOP Class Instance UID
+    write : Callable[[BinaryIO], None]
+        Writes the dataset in the DICOM file format to a binary file-like
+        object
+    durable : bool, optional
+        Whether to flush the file to disk before returning, by default False
+
+    Returns
+    -------
+    Path
+        Saved dataset path
+    """
     path = get_temp_path(instance_uid)
-    with open(path, "wb") as content:
-        # Write the preamble and prefix
-        logging.debug(messages.WRITE_DICOM_PREFIX)
-        content.write(b"\x00" * 128)
-        content.write(b"DICM")
-
-        # Encode and write the File Meta Information
-        logging.debug(messages.WRITE_DICOM_METADATA)
-        write_file_meta_info(content, event.file_meta)
-
-        # Write the encoded dataset
-        logging.debug(messages.WRITE_DICOM_DATASET)
-        dataset = event.request.DataSet.getvalue()
-        content.write(dataset)
+    partial_path = path.with_suffix(".part")
+    with open(partial_path, "wb") as content:
+        write(content)
+        if durable:
+            content.flush()
+            os.fsync(content.fileno())
+    os.replace(partial_path, path)
     log_dataset_saved(path.name)
     return path
 
 
-def cleanup_temp_dcm(path: Path) -> None:
+def save_dataset(event: events.Event, durable: bool = False) -> Path:
     """
-    Delete the temporary *.dcm* file created within DICOM_ROOT for database
-    import.
+    Save the dataset to a temporary location within MEDIA_ROOT (see
+    :func:`spool_file`).
 
     Parameters
     ----------
-    path : Path
-        Temporary *.dcm* file path
+    event : events.Event
+        C-STORE request event
+    durable : bool, optional
+        Whether to flush the file to disk before returning, by default False
+
+    Returns
+    -------
+    Path
+        Saved dataset path
+    """
+    instance_uid = event.request.AffectedSOPInstanceUID
+    return spool_file(
+        instance_uid, lambda content: write_dataset(content, event), durable=durable
+    )
+
+
+def save_received_dataset(dataset: ReceivedDataset, durable: bool = False) -> Path:
+    """
+    Save a dataset held in memory to a temporary location within MEDIA_ROOT
+    (see :func:`spool_file`).
+
+    Parameters
+    ----------
+    dataset : :class:`~django_dicom.utils.networking.ReceivedDataset`
+        Received dataset
+    durable : bool, optional
+        Whether to flush the file to disk before returning, by default False
+
+    Returns
+    -------
+    Path
+        Saved dataset path
+    """
+    return spool_file(
+        dataset.instance_uid,
+        lambda content: content.write(dataset.data),
+        durable=durable,
+    )
+
+
+def import_dataset_to_db(event: events.Event, metrics: ScpMetrics = None) -> None:
     """
-    log_cleanup_start(path.name)
-    path.unlink()
-    log_cleanup_end(path.name)
+    Import a C-STORE request provided dataset to the database. The header is
+    read from the already decoded dataset and the data is written only once,
+    straight to the image's default location (see
+    :meth:`~django_dicom.models.managers.image.ImageManager.get_or_create_from_data`).
+
+    Parameters
+    ----------
+    event : events.Event
+        C-STORE request event
+    metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+        Metrics to record the import latency (including writing the file) to,
+        by default None
 
 
-def import_dataset_to_db(event: events.Event) -> None:
+    .. # noqa: E501
     """
-    Save a C-STORE request provided dataset and import to the database.
+    instance_uid = event.request.AffectedSOPInstanceUID
+    log_import_start(instance_uid)
+    metrics = metrics or ScpMetrics()
+    header = read_event_header(event)
+    data = encode_dataset(event)
+    cache = ASSOCIATION_ENTITY_CACHES.setdefault(event.assoc, EntityCache())
+    with entity_cache(cache), metrics.measure("import"):
+        try:
+            Image.objects.get_or_create_from_data(data, header=header)
+        except Exception:
+            # Cached entities may have been rolled back.
+            cache.clear()
+            raise
+    log_import_end(instance_uid)
+
+
+def get_ingestion_queue():
+    """
+    Returns the app's ingestion queue, if C-STORE datasets are imported
+    asynchronously (see the *DICOM_SCP_QUEUE* setting).
+
+    Returns
+    -------
+    :class:`~django_dicom.models.networking.ingestion.IngestionQueue`
+        Active ingestion queue or None
+    """
+    config = apps.get_app_config("django_dicom")
+    return config.ingestion_queue
+
+
+def queue_dataset(
+    event: events.Event, ingestion_queue, metrics: ScpMetrics = None
+) -> bool:
+    """
+    Durably save a C-STORE request provided dataset and queue it for import.
 
     Parameters
     ----------
     event : events.Event
         C-STORE request event
+    ingestion_queue : :class:`~django_dicom.models.networking.ingestion.IngestionQueue`
+        Ingestion queue
+    metrics : :class:`~django_dicom.models.networking.metrics.ScpMetrics`, optional
+        Metrics to record the dataset's latencies to, by default None
+
+    Returns
+    -------
+    bool
+        Whether the dataset was queued (False if the queue is full)
+
+
+    .. # noqa: E501
     """
-    path = save_dataset(event)
-    log_import_start(path.name)
-    Image.objects.get_or_create(dcm=path)
-    log_import_end(path.name)
-    cleanup_temp_dcm(path)
+    if ingestion_queue.is_full:
+        log_queue_full(ingestion_queue.depth)
+        return False
+    metrics = metrics or ScpMetrics()
+    with metrics.measure("write"):
+        path = save_dataset(event, durable=True)
+    if not ingestion_queue.put(path, metrics=metrics):
+        path.unlink()
+        log_queue_full(ingestion_queue.depth)
+        return False
+    log_dataset_queued(path.name, ingestion_queue.depth)
+    return True
@@ -19,11 +19,13 @@ from dicom_parser.utils.code_strings import (
 )
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 
 from django_dicom.models.dicom_entity import DicomEntity
 from django_dicom.models.utils import help_text
+from django_dicom.models.utils.locks import lock_uid
+from django_dicom.models.utils.meta import get_model
 from django_dicom.models.utils.fields import ChoiceArrayField
 from django_dicom.models.utils.sequence_type import SEQUENCE_TYPE_CHOICES
 from django_dicom.models.utils.validators import digits_and_dots_only
@@ -299,6 +301,18 @@ class Series(DicomEntity):
         "django_dicom.Patient", on_delete=models.PROTECT, blank=True, null=True
     )
 
+    #: If headers are stored as deltas (see the *DICOM_HEADER_STORAGE*
+    #: setting), the :class:`~django_dicom.models.header.Header` instance
+    #: holding the data elements common to this series' images.
+    common_header = models.OneToOneField(
+        "django_dicom.Header",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        editable=False,
+        related_name="common_series",
+    )
+
     #: A dictionary of DICOM data element keywords to be used to populate
     #: a created instance's fields.
     FIELD_TO_HEADER = {
@@ -366,7 +380,8 @@ class Series(DicomEntity):
             if not self.study:
                 self.study, _ = header.get_or_create_study()
         if not self.sequence_type:
-            self.update_sequence_type(save=False)
+            sample_header = header.instance if header else None
+            self.update_sequence_type(save=False, header=sample_header)
         super().save(*args, **kwargs)
 
     def get_path(self) -> Path:
@@ -384,7 +399,7 @@ class Series(DicomEntity):
         )
         return Path(dcm_path).parent
 
-    def update_sequence_type(self, save: bool = True):
+    def update_sequence_type(self, save: bool = True, header: DicomHeader = None):
         """
         Checks the sequence type identifier detected by *dicom_parser* and
         updates the serialized value if required.
@@ -393,13 +408,17 @@ class Series(DicomEntity):
         ----------
         save : bool
             Whether to save changes or not, default is True
+        header : DicomHeader, optional
+            Already read sample header to detect the sequence type from, by
+            default None (read the header of the first image in the series)
         """
+        if header is None:
+            try:
+                sample_image = self.image_set.first()
+            except ValueError:
+                return
         try:
-            sample_image = self.image_set.first()
-        except ValueError:
-            return
-        try:
-            sample_header = sample_image.header.instance
+            sample_header = header or sample_image.header.instance
             detected = sample_header.detected_sequence
         except AttributeError:
             pass
@@ -409,6 +428,38 @@ class Series(DicomEntity):
                 if save:
                     self.save()
 
+    def get_or_create_common_header(self, header: DicomHeader):
+        """
+        Returns this series' common header, creating it from the provided
+        header information if it does not exist yet. Creation is serialized
+        across concurrent importers using an advisory lock keyed by this
+        series' UID.
+
+        Parameters
+        ----------
+        header : DicomHeader
+            Header information of an image in this series
+
+        Returns
+        -------
+        :class:`~django_dicom.models.header.Header`
+            Common header
+        """
+        if self.common_header_id is None:
+            Header = get_model("Header")
+            with transaction.atomic():
+                lock_uid(Header, self.uid)
+                # May have been created concurrently while waiting for the lock.
+                self.refresh_from_db(fields=["common_header"])
+                if self.common_header_id is None:
+                    (self.common_header,) = Header.objects.bulk_from_dicom_parser(
+                        [header]
+                    )
+                    Series.objects.filter(id=self.id).update(
+                        common_header=self.common_header
+                    )
+        return self.common_header
+
     def get_sample_header(self) -> DicomHeader:
         """
         Return a sample :class:`~dicom_parser.header.Header` instance
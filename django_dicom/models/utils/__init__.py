@@ -1,8 +1,21 @@
 """
 Utilities for the :mod:`~django_dicom.models` module.
 """
+from django_dicom.models.utils.import_profile import (
+    ImportProfile,
+    get_import_profile,
+    import_profile,
+)
 from django_dicom.models.utils.utils import (
+    FilePlacement,
+    HeaderStorage,
+    ValueStorage,
     get_dicom_root,
+    get_file_placement,
+    get_header_storage,
+    get_value_storage,
+    read_header,
+    read_identifiers,
     snake_case_to_camel_case,
 )
 
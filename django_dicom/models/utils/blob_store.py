@@ -0,0 +1,102 @@
+"""
+A content-addressed filesystem store for large raw values.
+
+Raw values larger than the *DICOM_BLOB_THRESHOLD* setting (in bytes) are
+compressed and written to a file named after their SHA-256 digest under
+*DICOM_BLOB_ROOT*, and only the digest is kept in the database (see
+:class:`~django_dicom.models.utils.fields.BlobTextField` and
+:class:`~django_dicom.models.utils.fields.BlobBinaryField`). Identical values
+are only written once.
+"""
+import hashlib
+import os
+import tempfile
+import zlib
+from pathlib import Path
+
+from django.conf import settings
+from django_dicom.models.utils.utils import get_mri_root
+
+#: Default blob store directory name (under the MRI root directory).
+DEFAULT_BLOB_DIR_NAME = "blobs"
+
+#: By default, raw values are always kept in the database.
+DEFAULT_BLOB_THRESHOLD = None
+
+#: zlib compression level used for blobs.
+COMPRESSION_LEVEL = 6
+
+
+def get_blob_root() -> Path:
+    default = get_mri_root() / DEFAULT_BLOB_DIR_NAME
+    path = getattr(settings, "DICOM_BLOB_ROOT", default)
+    return Path(path)
+
+
+def get_blob_threshold() -> int:
+    return getattr(settings, "DICOM_BLOB_THRESHOLD", DEFAULT_BLOB_THRESHOLD)
+
+
+def get_blob_path(key: str) -> Path:
+    """
+    Returns the path of the blob with the given key.
+
+    Parameters
+    ----------
+    key : str
+        Blob key (SHA-256 hexadecimal digest of its content)
+
+    Returns
+    -------
+    Path
+        Blob path
+    """
+    return get_blob_root() / key[:2] / key[2:]
+
+
+def put_blob(content: bytes) -> str:
+    """
+    Writes the provided content to the blob store, unless an identical blob
+    already exists. Blobs are written to a temporary file first and then moved
+    into place, so that concurrent writers never expose partial blobs.
+
+    Parameters
+    ----------
+    content : bytes
+        Blob content
+
+    Returns
+    -------
+    str
+        Blob key
+    """
+    key = hashlib.sha256(content).hexdigest()
+    path = get_blob_path(key)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(descriptor, "wb") as temp_file:
+                temp_file.write(zlib.compress(content, COMPRESSION_LEVEL))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    return key
+
+
+def get_blob(key: str) -> bytes:
+    """
+    Reads a blob from the blob store.
+
+    Parameters
+    ----------
+    key : str
+        Blob key
+
+    Returns
+    -------
+    bytes
+        Blob content
+    """
+    return zlib.decompress(get_blob_path(key).read_bytes())
@@ -0,0 +1,110 @@
+"""
+Definition of the :class:`EntityCache` class and the :func:`entity_cache`
+context manager, used to resolve DICOM entities by UID once per import.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+#: The currently active entity cache (if any).
+_active_cache: ContextVar = ContextVar("entity_cache", default=None)
+
+
+class EntityCache:
+    """
+    Import-scoped cache of
+    :class:`~django_dicom.models.dicom_entity.DicomEntity` instances by model
+    and UID.
+
+    Cached instances may have been created within a transaction that was
+    later rolled back, so the cache must be cleared whenever an import
+    transaction fails.
+    """
+
+    def __init__(self):
+        self._entities = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, model, uid: str):
+        """
+        Returns the cached instance of *model* with the given *uid*.
+
+        Parameters
+        ----------
+        model : :class:`~django_dicom.models.dicom_entity.DicomEntity`
+            DICOM entity model
+        uid : str
+            DICOM entity UID
+
+        Returns
+        -------
+        :class:`~django_dicom.models.dicom_entity.DicomEntity`
+            Cached instance or None
+        """
+        return self._entities.get((model._meta.label, uid))
+
+    def add(self, instance) -> None:
+        """
+        Adds an instance to the cache.
+
+        Parameters
+        ----------
+        instance : :class:`~django_dicom.models.dicom_entity.DicomEntity`
+            DICOM entity instance
+        """
+        self._entities[(instance._meta.label, instance.uid)] = instance
+
+    def clear(self) -> None:
+        """
+        Clears the cache.
+        """
+        self._entities.clear()
+
+
+def get_entity_cache() -> EntityCache:
+    """
+    Returns the currently active entity cache (see :func:`entity_cache`).
+
+    Returns
+    -------
+    EntityCache
+        Active entity cache or None
+    """
+    return _active_cache.get()
+
+
+def clear_entity_cache() -> None:
+    """
+    Clears the currently active entity cache, if any.
+    """
+    cache = _active_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
+@contextmanager
+def entity_cache(cache: EntityCache = None) -> Iterator[EntityCache]:
+    """
+    Activates an entity cache within the context. If no cache is provided
+    and one is already active, it is reused.
+
+    Parameters
+    ----------
+    cache : EntityCache, optional
+        Cache to activate, by default None (reuse the active cache or create
+        a new one)
+
+    Yields
+    ------
+    EntityCache
+        Active entity cache
+    """
+    if cache is None:
+        cache = _active_cache.get() or EntityCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
@@ -1,8 +1,12 @@
 """
 Custom :class:`~django.db.models.Field` subclasses.
 """
+import numpy as np
 from django import forms
 from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from django_dicom.models.utils.blob_store import get_blob, get_blob_threshold, put_blob
 
 
 class ChoiceArrayField(ArrayField):
@@ -22,3 +26,106 @@ class ChoiceArrayField(ArrayField):
         # care for it.
         # pylint:disable=bad-super-call
         return super(ArrayField, self).formfield(**defaults)
+
+
+class NumpyArrayField(ArrayField):
+    """
+    An :class:`~django.contrib.postgres.fields.ArrayField` that accepts and
+    returns :class:`numpy.ndarray` instances.
+    """
+
+    def from_db_value(self, value, expression, connection) -> np.ndarray:
+        if value is None:
+            return value
+        return np.asarray(value)
+
+    def get_db_prep_value(self, value, connection, prepared: bool = False):
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        return super().get_db_prep_value(value, connection, prepared=prepared)
+
+
+class BlobDescriptor(DeferredAttribute):
+    """
+    Loads values kept in the blob store (see
+    :mod:`~django_dicom.models.utils.blob_store`) when they are first
+    accessed.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if value is None:
+            key = getattr(instance, self.field.blob_field)
+            if key:
+                value = self.field.from_blob(get_blob(key))
+                instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so that __get__ is
+        # called even though the (empty) column value is set on the instance.
+        instance.__dict__[self.field.attname] = value
+
+
+class BlobFieldMixin:
+    """
+    Keeps values larger than the *DICOM_BLOB_THRESHOLD* setting in the blob
+    store (see :mod:`~django_dicom.models.utils.blob_store`) rather than in the
+    database. The blob's key is saved to the *blob_field* of the model
+    instead, and the value is read from the blob store when accessed.
+    """
+
+    descriptor_class = BlobDescriptor
+
+    def __init__(self, *args, blob_field: str, **kwargs):
+        self.blob_field = blob_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["blob_field"] = self.blob_field
+        return name, path, args, kwargs
+
+    def to_blob(self, value) -> bytes:
+        raise NotImplementedError
+
+    def from_blob(self, content: bytes):
+        raise NotImplementedError
+
+    def pre_save(self, model_instance, add: bool):
+        value = super().pre_save(model_instance, add)
+        threshold = get_blob_threshold()
+        if value is not None and threshold is not None:
+            content = self.to_blob(value)
+            if len(content) > threshold:
+                setattr(model_instance, self.blob_field, put_blob(content))
+                return None
+        return value
+
+
+class BlobTextField(BlobFieldMixin, models.TextField):
+    """
+    A :class:`~django.db.models.TextField` keeping large values in the blob
+    store.
+    """
+
+    def to_blob(self, value) -> bytes:
+        return str(value).encode()
+
+    def from_blob(self, content: bytes) -> str:
+        return content.decode()
+
+
+class BlobBinaryField(BlobFieldMixin, models.BinaryField):
+    """
+    A :class:`~django.db.models.BinaryField` keeping large values in the blob
+    store.
+    """
+
+    def to_blob(self, value) -> bytes:
+        return bytes(value)
+
+    def from_blob(self, content: bytes) -> bytes:
+        return content
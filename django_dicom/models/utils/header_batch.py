@@ -0,0 +1,116 @@
+"""
+Definition of the :class:`HeaderBatch` class and the :func:`header_batch`
+context manager, used to create the headers of images imported together
+using bulk queries.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator
+
+from dicom_parser.header import Header as DicomHeader
+from django_dicom.models.utils.meta import get_model
+
+#: The currently active header batch (if any).
+_active_batch: ContextVar = ContextVar("header_batch", default=None)
+
+
+class HeaderBatch:
+    """
+    Header information of images pending creation. Once the header of one of
+    the pending images is requested (see :meth:`create`), the headers of all
+    pending images in the same series are created together (see
+    :meth:`~django_dicom.models.managers.header.HeaderManager.bulk_from_dicom_parser`).
+
+    Created headers belong to the transaction they were created in, so the
+    batch must not outlive it.
+
+
+    .. # noqa: E501
+    """
+
+    def __init__(self, headers: Iterable[DicomHeader] = ()):
+        """
+        Creates a new header batch.
+
+        Parameters
+        ----------
+        headers : Iterable[DicomHeader], optional
+            Header information of the images pending creation, by default ()
+        """
+        self._pending: Dict[str, Dict[str, DicomHeader]] = {}
+        self._created = {}
+        for header in headers:
+            series = self._pending.setdefault(header.get("SeriesInstanceUID"), {})
+            series.setdefault(header.get("SOPInstanceUID"), header)
+
+    def create(self, header: DicomHeader, base=None):
+        """
+        Returns the :class:`~django_dicom.models.header.Header` instance
+        created for an image's header information, creating it along with the
+        rest of the pending headers of its series if required.
+
+        Parameters
+        ----------
+        header : DicomHeader
+            Image header information
+        base : :class:`~django_dicom.models.header.Header`, optional
+            Common header of the image's series, by default None
+
+        Returns
+        -------
+        :class:`~django_dicom.models.header.Header`
+            Created instance
+        """
+        uid = header.get("SOPInstanceUID")
+        if uid not in self._created:
+            series = self._pending.pop(header.get("SeriesInstanceUID"), {})
+            series[uid] = header
+            Header = get_model("Header")
+            created = Header.objects.bulk_from_dicom_parser(series.values(), base=base)
+            self._created.update(zip(series, created))
+        return self._created.pop(uid)
+
+    def discard(self) -> None:
+        """
+        Deletes any created headers that were never requested (e.g. of images
+        created concurrently by another importer) and clears the batch.
+        """
+        unused = [instance.id for instance in self._created.values()]
+        self._pending.clear()
+        self._created.clear()
+        if unused:
+            get_model("Header").objects.filter(id__in=unused).delete()
+
+
+def get_header_batch() -> HeaderBatch:
+    """
+    Returns the currently active header batch (see :func:`header_batch`).
+
+    Returns
+    -------
+    HeaderBatch
+        Active header batch or None
+    """
+    return _active_batch.get()
+
+
+@contextmanager
+def header_batch(headers: Iterable[DicomHeader]) -> Iterator[HeaderBatch]:
+    """
+    Activates a header batch within the context.
+
+    Parameters
+    ----------
+    headers : Iterable[DicomHeader]
+        Header information of the images pending creation
+
+    Yields
+    ------
+    HeaderBatch
+        Active header batch
+    """
+    token = _active_batch.set(HeaderBatch(headers))
+    try:
+        yield _active_batch.get()
+    finally:
+        _active_batch.reset(token)
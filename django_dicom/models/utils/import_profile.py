@@ -0,0 +1,351 @@
+"""
+Definition of the :class:`ImportProfile` class and the :func:`import_profile`
+context manager, used to resolve the data elements saved by an import once
+per import rather than once per data element.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List
+
+from dicom_parser.data_element import DataElement as DicomDataElement
+from dicom_parser.header import Header as DicomHeader
+from dicom_parser.utils.value_representation import ValueRepresentation
+from django.conf import settings
+from django_dicom.models.utils.utils import (
+    IMPORT_CONFIGURATIONS,
+    PIXEL_ARRAY_TAG,
+    ImportMode,
+    get_import_mode,
+)
+
+#: The currently active import profile (if any).
+_active_profile: ContextVar = ContextVar("import_profile", default=None)
+
+#: Profile settings that are added to the settings they are applied to, rather
+#: than replacing them.
+CUMULATIVE_KEYS = "exclude_tags", "exclude_vrs"
+
+
+def parse_tag(tag: Iterable[str]) -> tuple:
+    """
+    Returns a tag in the format used by dicom_parser_
+    :class:`~dicom_parser.data_element.DataElement` instances.
+
+    .. _dicom_parser: https://github.com/ZviBaratz/dicom_parser/
+
+    Parameters
+    ----------
+    tag : Iterable[str]
+        Tag group and element as hexadecimal strings
+
+    Returns
+    -------
+    tuple
+        Normalized tag
+    """
+    group, element = tag
+    return group.lower().zfill(4), element.lower().zfill(4)
+
+
+def parse_value_representation(vr) -> ValueRepresentation:
+    if isinstance(vr, ValueRepresentation):
+        return vr
+    return ValueRepresentation[vr.upper()]
+
+
+def get_element_size(data_element: DicomDataElement) -> int:
+    """
+    Returns the approximate size (in bytes) of a data element's value.
+    *Sequence of Items* values are measured by their number of items, as their
+    nested data elements are filtered separately.
+
+    Parameters
+    ----------
+    data_element : :class:`dicom_parser.data_element.DataElement`
+        Object representing a single data element in memory
+
+    Returns
+    -------
+    int
+        Value size
+    """
+    value = data_element.raw.value
+    if value is None:
+        return 0
+    if data_element.VALUE_REPRESENTATION == ValueRepresentation.SQ:
+        return len(value)
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return len(str(value))
+
+
+class ImportProfile:
+    """
+    A compiled set of rules determining which data elements are saved to the
+    database. All lookups are done against precomputed sets, so filtering a
+    data element does not depend on the number of rules.
+
+    Profiles may be specialized for certain modalities or manufacturers (see
+    :meth:`for_header`).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        exclude_tags: Iterable = (),
+        exclude_vrs: Iterable = (),
+        include: Iterable = None,
+        max_size: int = None,
+        modalities: dict = None,
+        manufacturers: dict = None,
+    ):
+        """
+        Compiles a new import profile.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Whether to save any data elements at all, by default True
+        exclude_tags : Iterable, optional
+            Tags of data elements that should not be saved, by default ()
+        exclude_vrs : Iterable, optional
+            Value representations that should not be saved, by default ()
+        include : Iterable, optional
+            If provided, only data elements with one of the listed keywords or
+            tags are saved, by default None
+        max_size : int, optional
+            Maximal data element value size (see :func:`get_element_size`),
+            by default None
+        modalities : dict, optional
+            Profile settings by *Modality* value, applied on top of this
+            profile's settings, by default None
+        manufacturers : dict, optional
+            Profile settings by (case-insensitive) *Manufacturer* value
+            prefix, applied on top of this profile's and the modality's
+            settings, by default None
+        """
+        self.enabled = enabled
+        self.exclude_tags = frozenset(parse_tag(tag) for tag in exclude_tags)
+        self.exclude_vrs = frozenset(
+            parse_value_representation(vr) for vr in exclude_vrs
+        )
+        if include is None:
+            self.include_tags = self.include_keywords = None
+        else:
+            include = list(include)
+            self.include_keywords = frozenset(
+                entry for entry in include if isinstance(entry, str)
+            )
+            self.include_tags = frozenset(
+                parse_tag(entry) for entry in include if not isinstance(entry, str)
+            )
+        self.max_size = max_size
+        self.modalities = modalities or {}
+        self.manufacturers = {
+            prefix.upper(): rules for prefix, rules in (manufacturers or {}).items()
+        }
+        self._settings = {
+            "enabled": enabled,
+            "exclude_tags": self.exclude_tags,
+            "exclude_vrs": self.exclude_vrs,
+            "include": None if include is None else include,
+            "max_size": max_size,
+        }
+        self._specialized = {}
+
+    @classmethod
+    def from_settings(cls):
+        """
+        Compiles the import profile configured by the *DICOM_IMPORT_MODE* and
+        *DICOM_IMPORT_PROFILE* settings.
+
+        Returns
+        -------
+        ImportProfile
+            Compiled import profile
+        """
+        import_mode = get_import_mode()
+        default = IMPORT_CONFIGURATIONS[ImportMode.NORMAL]
+        configuration = IMPORT_CONFIGURATIONS.get(import_mode, default)
+        if configuration is None:
+            return cls(enabled=False)
+        exclude_tags = list(configuration["tags"])
+        if exclude_tags:
+            exclude_tags.append(PIXEL_ARRAY_TAG)
+        rules = {"exclude_tags": exclude_tags, "exclude_vrs": configuration["vrs"]}
+        return cls(**merge_rules(rules, getattr(settings, "DICOM_IMPORT_PROFILE", {})))
+
+    def get_specialization_key(self, header: DicomHeader) -> tuple:
+        """
+        Returns the modality and manufacturer settings keys matching the
+        provided header.
+
+        Parameters
+        ----------
+        header : :class:`dicom_parser.header.Header`
+            Object representing an entire DICOM header in memory
+
+        Returns
+        -------
+        tuple
+            Modality and manufacturer keys (None if not configured)
+        """
+        modality = manufacturer = None
+        if self.modalities:
+            modality = header.raw.get("Modality")
+            modality = modality if modality in self.modalities else None
+        if self.manufacturers:
+            value = str(header.raw.get("Manufacturer") or "").upper()
+            for prefix in self.manufacturers:
+                if value.startswith(prefix):
+                    manufacturer = prefix
+                    break
+        return modality, manufacturer
+
+    def for_header(self, header: DicomHeader):
+        """
+        Returns this profile specialized for the modality and manufacturer of
+        the provided header. Specialized profiles are compiled once and then
+        cached.
+
+        Parameters
+        ----------
+        header : :class:`dicom_parser.header.Header`
+            Object representing an entire DICOM header in memory
+
+        Returns
+        -------
+        ImportProfile
+            Import profile to filter the header's data elements with
+        """
+        key = self.get_specialization_key(header)
+        if key == (None, None):
+            return self
+        try:
+            return self._specialized[key]
+        except KeyError:
+            modality, manufacturer = key
+            rules = dict(self._settings)
+            if modality is not None:
+                rules = merge_rules(rules, self.modalities[modality])
+            if manufacturer is not None:
+                rules = merge_rules(rules, self.manufacturers[manufacturer])
+            profile = self._specialized[key] = ImportProfile(**rules)
+            return profile
+
+    def includes(self, data_element: DicomDataElement) -> bool:
+        """
+        Returns whether the provided data element should be saved.
+
+        Parameters
+        ----------
+        data_element : :class:`dicom_parser.data_element.DataElement`
+            Object representing a single data element in memory
+
+        Returns
+        -------
+        bool
+            Whether to save the data element
+        """
+        if not self.enabled:
+            return False
+        tag = data_element.tag
+        if self.include_tags is not None and not (
+            tag in self.include_tags or data_element.keyword in self.include_keywords
+        ):
+            return False
+        if tag in self.exclude_tags:
+            return False
+        if data_element.VALUE_REPRESENTATION in self.exclude_vrs:
+            return False
+        return self.max_size is None or get_element_size(data_element) <= self.max_size
+
+    def filter(self, header: DicomHeader) -> List[DicomDataElement]:
+        """
+        Returns the data elements of the provided header that should be
+        saved.
+
+        Parameters
+        ----------
+        header : :class:`dicom_parser.header.Header`
+            Object representing an entire DICOM header in memory
+
+        Returns
+        -------
+        List[:class:`dicom_parser.data_element.DataElement`]
+            Included data elements
+        """
+        if not self.enabled:
+            return []
+        profile = self.for_header(header)
+        return [
+            data_element
+            for data_element in header.data_elements
+            if profile.includes(data_element)
+        ]
+
+
+def merge_rules(rules: dict, overrides: dict) -> dict:
+    """
+    Returns profile settings updated with *overrides*. Excluded tags and value
+    representations are added to the existing ones, and any other setting is
+    replaced.
+
+    Parameters
+    ----------
+    rules : dict
+        Profile settings
+    overrides : dict
+        Profile settings to apply
+
+    Returns
+    -------
+    dict
+        Merged profile settings
+    """
+    merged = dict(rules)
+    for key, value in overrides.items():
+        if key in CUMULATIVE_KEYS:
+            merged[key] = [*merged.get(key, ()), *value]
+        else:
+            merged[key] = value
+    return merged
+
+
+def get_import_profile() -> ImportProfile:
+    """
+    Returns the currently active import profile (see :func:`import_profile`),
+    or compiles one from the project's settings.
+
+    Returns
+    -------
+    ImportProfile
+        Import profile
+    """
+    return _active_profile.get() or ImportProfile.from_settings()
+
+
+@contextmanager
+def import_profile(profile: ImportProfile = None) -> Iterator[ImportProfile]:
+    """
+    Activates an import profile within the context. If no profile is provided
+    and one is already active, it is reused.
+
+    Parameters
+    ----------
+    profile : ImportProfile, optional
+        Profile to activate, by default None (reuse the active profile or
+        compile one from the project's settings)
+
+    Yields
+    ------
+    ImportProfile
+        Active import profile
+    """
+    if profile is None:
+        profile = _active_profile.get() or ImportProfile.from_settings()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
@@ -0,0 +1,74 @@
+"""
+Definition of the :func:`lock_uid` and :func:`lock_uids` functions, used to
+serialize the creation of DICOM entities across concurrent importers.
+"""
+import hashlib
+from typing import Iterable, Tuple
+
+from django.db import connections
+from django.db.models import Model
+
+
+def get_lock_key(model: Model, uid: str) -> int:
+    """
+    Returns a signed 64-bit advisory lock key for the given model and UID.
+
+    Parameters
+    ----------
+    model : :class:`~django.db.models.Model`
+        DICOM entity model
+    uid : str
+        DICOM entity UID
+
+    Returns
+    -------
+    int
+        Advisory lock key
+    """
+    content = f"{model._meta.label}:{uid}".encode()
+    digest = hashlib.sha1(content).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def lock_uid(model: Model, uid: str, using: str = "default") -> None:
+    """
+    Acquires a transaction-level PostgreSQL advisory lock for the given model
+    and UID. The lock is held until the current transaction ends, so this
+    function should be called within an atomic block.
+
+    Parameters
+    ----------
+    model : :class:`~django.db.models.Model`
+        DICOM entity model
+    uid : str
+        DICOM entity UID
+    using : str, optional
+        Database alias, by default "default"
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [get_lock_key(model, uid)])
+
+
+def lock_uids(keys: Iterable[Tuple[Model, str]], using: str = "default") -> None:
+    """
+    Acquires the transaction-level PostgreSQL advisory locks for multiple
+    models and UIDs using a single query. The locks are acquired in ascending
+    key order, so that transactions locking overlapping sets of UIDs this way
+    never wait for each other in a cycle. Acquiring any of them again within
+    the same transaction (see :func:`lock_uid`) does not wait.
+
+    Parameters
+    ----------
+    keys : Iterable[Tuple[Model, str]]
+        DICOM entity models and UIDs
+    using : str, optional
+        Database alias, by default "default"
+    """
+    lock_keys = sorted({get_lock_key(model, uid) for model, uid in keys})
+    if not lock_keys:
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(key) FROM unnest(%s::bigint[]) AS key",
+            [lock_keys],
+        )
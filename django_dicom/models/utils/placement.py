@@ -0,0 +1,168 @@
+"""
+Utilities used to place imported files at their default location (see the
+*DICOM_FILE_PLACEMENT* setting) and the :func:`directory_cache` context
+manager, used to create each destination directory once per import.
+"""
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+from django_dicom.models.utils.utils import FilePlacement, get_file_placement
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+#: Linux ioctl request number used to clone a file's extents
+#: (copy-on-write).
+FICLONE = 0x40049409
+
+#: Strategies attempted (in order) if some placement strategy is not supported
+#: for a particular file.
+FALLBACKS = {
+    FilePlacement.RENAME: [FilePlacement.RENAME, FilePlacement.COPY],
+    FilePlacement.HARDLINK: [
+        FilePlacement.HARDLINK,
+        FilePlacement.REFLINK,
+        FilePlacement.COPY,
+    ],
+    FilePlacement.REFLINK: [FilePlacement.REFLINK, FilePlacement.COPY],
+    FilePlacement.COPY: [FilePlacement.COPY],
+}
+
+#: The directories created within the currently active directory cache (if
+#: any).
+_active_cache: ContextVar = ContextVar("directory_cache", default=None)
+
+logger = logging.getLogger("data_import")
+
+
+def make_directory(path: Path) -> None:
+    """
+    Creates a directory (and any missing parents). Within a
+    :func:`directory_cache` context, each directory is only created once.
+
+    Parameters
+    ----------
+    path : :class:`pathlib.Path`
+        Directory path
+    """
+    cache = _active_cache.get()
+    if cache is not None and path in cache:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    if cache is not None:
+        cache.add(path)
+
+
+@contextmanager
+def directory_cache() -> Iterator[set]:
+    """
+    Activates a directory cache within the context (see
+    :func:`make_directory`). If one is already active, it is reused.
+
+    Yields
+    ------
+    set
+        Created directories
+    """
+    cache = _active_cache.get()
+    if cache is None:
+        cache = set()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def reflink(source: Path, target: Path) -> None:
+    """
+    Creates a copy-on-write clone of *source* at *target*.
+
+    Parameters
+    ----------
+    source : :class:`pathlib.Path`
+        Source file path
+    target : :class:`pathlib.Path`
+        Destination path
+
+    Raises
+    ------
+    OSError
+        Cloning is not supported
+    """
+    if fcntl is None:
+        raise OSError("File cloning is not supported on this platform!")
+    with open(source, "rb") as source_file, open(target, "wb") as target_file:
+        fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+    shutil.copymode(source, target)
+
+
+def _place(source: Path, target: Path, placement: FilePlacement) -> None:
+    if placement is FilePlacement.RENAME:
+        os.rename(source, target)
+        return
+    # Other strategies create the file under a temporary name first, so that
+    # existing files are replaced atomically.
+    descriptor, temp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    os.close(descriptor)
+    try:
+        if placement is FilePlacement.HARDLINK:
+            os.unlink(temp_path)
+            os.link(source, temp_path)
+        elif placement is FilePlacement.REFLINK:
+            reflink(source, temp_path)
+        else:
+            shutil.copy(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def place_file(
+    source: Path, target: Path, placement: FilePlacement = None
+) -> FilePlacement:
+    """
+    Places *source* at *target* using the provided placement strategy,
+    falling back to the next strategy in :attr:`FALLBACKS` if it is not
+    supported (e.g. hard links across file systems or clones on file systems
+    without copy-on-write support). Copy fallbacks of renames remove the
+    source file.
+
+    Parameters
+    ----------
+    source : :class:`pathlib.Path`
+        Source file path
+    target : :class:`pathlib.Path`
+        Destination path (its directory must exist)
+    placement : FilePlacement, optional
+        Placement strategy, by default None (see the *DICOM_FILE_PLACEMENT*
+        setting)
+
+    Returns
+    -------
+    FilePlacement
+        The strategy that was used
+    """
+    placement = placement or get_file_placement()
+    *strategies, last = FALLBACKS[placement]
+    for strategy in strategies:
+        try:
+            _place(source, target, strategy)
+        except OSError as error:
+            logger.debug(f"Failed to {strategy.value.lower()} {source}: {error}")
+        else:
+            return strategy
+    _place(source, target, last)
+    if placement is FilePlacement.RENAME:
+        os.unlink(source)
+    return last
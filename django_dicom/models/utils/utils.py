@@ -1,6 +1,11 @@
+import warnings
 from enum import Enum
+from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO, Union
 
+import pydicom
+from dicom_parser.header import Header as DicomHeader
 from dicom_parser.utils.value_representation import ValueRepresentation
 from django.apps import apps
 from django.conf import settings
@@ -28,7 +33,7 @@ IMPORT_CONFIGURATIONS = {
             ("0029", "0011"),
             ("0029", "0012"),
             ("0051", "0010"),
-            ("7fe1," "0010"),
+            ("7fe1", "0010"),
             # General Electric (GE) private tags
             ("0009", "0010"),
             ("0011", "0010"),
@@ -60,15 +65,93 @@ def get_import_configuration() -> dict:
     return IMPORT_CONFIGURATIONS.get(import_mode, default)
 
 
-def check_element_inclusion(data_element) -> bool:
-    import_configuration = get_import_configuration()
-    if import_configuration is None:
-        return False
-    tags = import_configuration["tags"]
-    vrs = import_configuration["vrs"]
-    excluded_tag = any([data_element.tag in (tag, PIXEL_ARRAY_TAG) for tag in tags])
-    excluded_vr = any([vr == data_element.VALUE_REPRESENTATION for vr in vrs])
-    return not (excluded_tag or excluded_vr)
+# Header Storage
+################
+class HeaderStorage(Enum):
+    FULL = "Full"
+    DELTA = "Delta"
+
+
+#: By default, every header stores its full set of data elements. In *delta*
+#: mode, a series keeps a single common set of data elements and each image
+#: header stores only the elements that differ from it.
+DEFAULT_HEADER_STORAGE: str = "FULL"
+
+
+def get_header_storage() -> HeaderStorage:
+    setting = getattr(settings, "DICOM_HEADER_STORAGE", DEFAULT_HEADER_STORAGE)
+    try:
+        return HeaderStorage[setting.upper()]
+    except KeyError:
+        return HeaderStorage[DEFAULT_HEADER_STORAGE]
+
+
+# Value Storage
+###############
+class ValueStorage(Enum):
+    MULTI_TABLE = "Multi-table"
+    COMPACT = "Compact"
+
+
+#: By default, values are saved using a table per value representation (see
+#: :class:`~django_dicom.models.values.data_element_value.DataElementValue`).
+#: In *compact* mode, values are saved to a single table (see
+#: :class:`~django_dicom.models.values.compact_value.CompactValue`).
+DEFAULT_VALUE_STORAGE: str = "MULTI_TABLE"
+
+
+def get_value_storage() -> ValueStorage:
+    setting = getattr(settings, "DICOM_VALUE_STORAGE", DEFAULT_VALUE_STORAGE)
+    try:
+        return ValueStorage[setting.upper().replace("-", "_")]
+    except KeyError:
+        return ValueStorage[DEFAULT_VALUE_STORAGE]
+
+
+# Sequence Storage
+##################
+#: By default, every *Sequence of Items* data element creates its own nested
+#: headers. If enabled, identical sequences are saved once and shared.
+DEFAULT_SEQUENCE_DEDUPLICATION: bool = False
+
+
+def get_sequence_deduplication() -> bool:
+    return getattr(
+        settings, "DICOM_SEQUENCE_DEDUPLICATION", DEFAULT_SEQUENCE_DEDUPLICATION
+    )
+
+
+# File Placement
+################
+class FilePlacement(Enum):
+    RENAME = "Rename"
+    HARDLINK = "Hardlink"
+    REFLINK = "Reflink"
+    COPY = "Copy"
+
+
+def get_file_placement() -> FilePlacement:
+    """
+    Returns the strategy used to place imported files at their default
+    location (see the *DICOM_FILE_PLACEMENT* setting). By default, files are
+    renamed, unless the *KEEP_ORIGINAL_DICOM* setting is enabled, in which
+    case they are copied. Files are never renamed if originals should be kept.
+
+    Returns
+    -------
+    FilePlacement
+        File placement strategy
+    """
+    keep_original = getattr(settings, "KEEP_ORIGINAL_DICOM", False)
+    default = "COPY" if keep_original else "RENAME"
+    setting = getattr(settings, "DICOM_FILE_PLACEMENT", default)
+    try:
+        placement = FilePlacement[setting.upper()]
+    except KeyError:
+        placement = FilePlacement[default]
+    if keep_original and placement is FilePlacement.RENAME:
+        return FilePlacement.COPY
+    return placement
 
 
 # Media directory locations
@@ -97,6 +180,70 @@ def get_dicom_root() -> Path:
     return get_mri_root() / DEFAULT_DICOM_DIR_NAME
 
 
+# DICOM Reading
+###############
+def read_header(path: Union[Path, bytes, BinaryIO, pydicom.Dataset]) -> DicomHeader:
+    """
+    Reads a DICOM header without its pixel data. Any warnings raised by
+    dicom_parser are caught and kept in the returned header's *warnings*
+    attribute (similarly to :class:`dicom_parser.image.Image`).
+
+    Parameters
+    ----------
+    path : Union[:class:`pathlib.Path`, bytes, BinaryIO, :class:`pydicom.dataset.Dataset`]
+        *.dcm* file path, the file's content (as bytes or a binary
+        file-like object), or an already decoded dataset
+
+    Returns
+    -------
+    :class:`dicom_parser.header.Header`
+        Header information
+
+
+    .. # noqa: E501
+    """
+    if isinstance(path, (bytes, bytearray)):
+        path = BytesIO(path)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        if hasattr(path, "read"):
+            dataset = pydicom.dcmread(path, stop_before_pixels=True)
+            header = DicomHeader(dataset)
+        else:
+            header = DicomHeader(path)
+    header.warnings = list(dict.fromkeys(str(w.message) for w in caught))
+    return header
+
+
+#: Data elements read by :func:`read_identifiers`.
+IDENTIFIER_KEYWORDS = "SOPInstanceUID", "PatientID"
+
+
+def read_identifiers(path: Path) -> dict:
+    """
+    Reads only the identifying data elements (see :attr:`IDENTIFIER_KEYWORDS`)
+    of a DICOM file, which is much faster than reading the entire header.
+
+    Parameters
+    ----------
+    path : :class:`pathlib.Path`
+        *.dcm* file path
+
+    Returns
+    -------
+    dict
+        Identifying data element values by keyword
+    """
+    dataset = pydicom.dcmread(
+        str(path), stop_before_pixels=True, specific_tags=list(IDENTIFIER_KEYWORDS)
+    )
+    values = {keyword: dataset.get(keyword) for keyword in IDENTIFIER_KEYWORDS}
+    return {
+        keyword: None if value is None else str(value)
+        for keyword, value in values.items()
+    }
+
+
 # Other
 #######
 def snake_case_to_camel_case(string: str) -> str:
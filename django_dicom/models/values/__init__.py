@@ -15,13 +15,16 @@ standard`_ (`part 05, section 6.2`_).
 from django_dicom.models.values.age_string import AgeString
 from django_dicom.models.values.application_entity import ApplicationEntity
 from django_dicom.models.values.code_string import CodeString
+from django_dicom.models.values.compact_value import CompactValue
 from django_dicom.models.values.csa_header import CsaHeader
 from django_dicom.models.values.data_element_value import DataElementValue
 from django_dicom.models.values.date import Date
 from django_dicom.models.values.datetime import DateTime
 from django_dicom.models.values.decimal_string import DecimalString
+from django_dicom.models.values.float_array import FloatArray
 from django_dicom.models.values.floating_point_double import FloatingPointDouble
 from django_dicom.models.values.floating_point_single import FloatingPointSingle
+from django_dicom.models.values.integer_array import IntegerArray
 from django_dicom.models.values.integer_string import IntegerString
 from django_dicom.models.values.long_string import LongString
 from django_dicom.models.values.long_text import LongText
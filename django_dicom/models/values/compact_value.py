@@ -0,0 +1,263 @@
+"""
+Definition of the :class:`CompactValue` model.
+"""
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django_dicom.models.managers.values.compact_value import CompactValueManager
+from django_dicom.models.utils.fields import (
+    BlobBinaryField,
+    BlobTextField,
+    NumpyArrayField,
+)
+from django_dicom.models.utils.meta import get_model
+from django_dicom.utils.html import Html
+
+#: The columns used to store the
+#: :attr:`~django_dicom.models.values.data_element_value.DataElementValue.raw`
+#: and
+#: :attr:`~django_dicom.models.values.data_element_value.DataElementValue.value`
+#: fields of each
+#: :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+#: subclass.
+COMPACT_COLUMNS = {
+    "AgeString": ("raw_text", "value_float"),
+    "ApplicationEntity": ("raw_text", "value_text"),
+    "CodeString": ("raw_text", "value_text"),
+    "CsaHeader": ("raw_text", "value_json"),
+    "Date": ("raw_text", "value_date"),
+    "DateTime": ("raw_text", "value_datetime"),
+    "DecimalString": ("raw_text", "value_float"),
+    "FloatArray": ("raw_array", "value_float_array"),
+    "FloatingPointDouble": ("raw_text", "value_float"),
+    "FloatingPointSingle": ("raw_text", "value_float"),
+    "IntegerArray": ("raw_array", "value_integer_array"),
+    "IntegerString": ("raw_text", "value_integer"),
+    "LongString": ("raw_text", "value_text"),
+    "LongText": ("raw_text", "value_text"),
+    "OtherWord": ("raw_bytes", "value_json"),
+    "PersonName": ("raw_text", "value_json"),
+    "ShortString": ("raw_text", "value_text"),
+    "ShortText": ("raw_text", "value_text"),
+    "SignedLong": ("raw_integer", "value_integer"),
+    "SignedShort": ("raw_integer", "value_integer"),
+    "Time": ("raw_text", "value_time"),
+    "UniqueIdentifier": ("raw_text", "value_text"),
+    "Unknown": ("raw_text", "value_text"),
+    "UnlimitedText": ("raw_text", "value_text"),
+    "UnsignedLong": ("raw_integer", "value_integer"),
+    "UnsignedShort": ("raw_integer", "value_integer"),
+}
+
+
+class CompactValue(models.Model):
+    """
+    A :class:`~django.db.models.Model` representing a single value contained
+    by some :class:`~django_dicom.models.data_element.DataElement` instance,
+    saved to a single table rather than a table per value representation (see
+    the *DICOM_VALUE_STORAGE* setting).
+
+    Values are saved to typed columns according to their
+    :attr:`value_model` and expose the same interface as the matching
+    :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    subclass. *Sequence of Items* values are always saved as
+    :class:`~django_dicom.models.values.sequence_of_items.SequenceOfItems`
+    instances, as nested headers refer to them.
+    """
+
+    #: The value representation discriminator, i.e. the name of the
+    #: :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    #: subclass this value would otherwise be saved as.
+    value_model = models.CharField(
+        max_length=32, choices=[(name, name) for name in COMPACT_COLUMNS]
+    )
+
+    #: If the value is one of a number of values within a DataElement
+    #: (a DataElement with a value multiplicity that is greater than 1),
+    #: this field keeps the index of this value.
+    index = models.PositiveIntegerField(blank=True, null=True)
+
+    #: If any warnings were raised by `dicom_parser`, log them in the database.
+    warnings = ArrayField(
+        models.TextField(blank=True, null=True), blank=True, null=True
+    )
+
+    #: SHA-256 digest of the value's fields, identical to the one of the
+    #: matching
+    #: :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    #: subclass instance (see
+    #: :func:`~django_dicom.models.managers.data_element_value.get_value_hash`).
+    content_hash = models.CharField(max_length=64, unique=True, editable=False)
+
+    #: Raw textual values.
+    raw_text = BlobTextField(blank=True, null=True, blob_field="raw_text_blob")
+
+    #: If :attr:`raw_text` exceeds the *DICOM_BLOB_THRESHOLD* setting, the key
+    #: of the blob it is kept in (see
+    #: :mod:`~django_dicom.models.utils.blob_store`).
+    raw_text_blob = models.CharField(
+        max_length=64, blank=True, null=True, editable=False
+    )
+
+    #: Raw integer values.
+    raw_integer = models.BigIntegerField(blank=True, null=True)
+
+    #: Raw binary values.
+    raw_bytes = BlobBinaryField(blank=True, null=True, blob_field="raw_bytes_blob")
+
+    #: Blob key of :attr:`raw_bytes` (see :attr:`raw_text_blob`).
+    raw_bytes_blob = models.CharField(
+        max_length=64, blank=True, null=True, editable=False
+    )
+
+    #: Raw multi-valued numeric values.
+    raw_array = ArrayField(
+        models.TextField(blank=True, null=True), blank=True, null=True
+    )
+
+    #: Parsed textual values.
+    value_text = models.TextField(blank=True, null=True)
+
+    #: Parsed integer values.
+    value_integer = models.BigIntegerField(blank=True, null=True)
+
+    #: Parsed floating point values.
+    value_float = models.FloatField(blank=True, null=True)
+
+    #: Parsed date values.
+    value_date = models.DateField(blank=True, null=True)
+
+    #: Parsed time values.
+    value_time = models.TimeField(blank=True, null=True)
+
+    #: Parsed datetime values.
+    value_datetime = models.DateTimeField(blank=True, null=True)
+
+    #: Parsed multi-valued floating point values.
+    value_float_array = NumpyArrayField(
+        models.FloatField(blank=True, null=True), blank=True, null=True
+    )
+
+    #: Parsed multi-valued integer values.
+    value_integer_array = NumpyArrayField(
+        models.BigIntegerField(blank=True, null=True), blank=True, null=True
+    )
+
+    #: Parsed structured values (e.g. person names or CSA headers).
+    value_json = models.JSONField(blank=True, null=True)
+
+    objects = CompactValueManager()
+
+    class Meta:
+        ordering = ["index"]
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of this instance.
+
+        Returns
+        -------
+        str
+            This instance's string representation
+        """
+
+        return str(self.as_value_model())
+
+    @property
+    def raw(self):
+        """
+        Raw data element value, as it appears in the DICOM header.
+        """
+
+        raw_column, _ = COMPACT_COLUMNS[self.value_model]
+        return getattr(self, raw_column)
+
+    @raw.setter
+    def raw(self, raw) -> None:
+        raw_column, _ = COMPACT_COLUMNS[self.value_model]
+        setattr(self, raw_column, raw)
+
+    @property
+    def value(self):
+        """
+        Interpreted data element value.
+        """
+
+        _, value_column = COMPACT_COLUMNS[self.value_model]
+        return getattr(self, value_column)
+
+    @value.setter
+    def value(self, value) -> None:
+        _, value_column = COMPACT_COLUMNS[self.value_model]
+        if hasattr(value, "tolist") and value_column == "value_json":
+            value = value.tolist()
+        setattr(self, value_column, value)
+
+    def as_value_model(self):
+        """
+        Returns an unsaved instance of the matching
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass, used to reuse its representations.
+
+        Returns
+        -------
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+            Unsaved value instance
+        """
+
+        ValueModel = get_model(self.value_model)
+        instance = ValueModel(
+            id=self.id,
+            index=self.index,
+            raw=self.raw,
+            value=self.value,
+            warnings=self.warnings,
+        )
+        instance.ADMIN_MODEL_NAME = self.__class__.__name__
+        return instance
+
+    def get_raw_peek(self, size: int = 100) -> str:
+        """
+        Returns a truncated string of the raw data element's value (appended
+        with *"..."* if changed).
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximal string length, by default 100
+
+        Returns
+        -------
+        str
+            Truncated string
+        """
+
+        return self.as_value_model().get_raw_peek(size=size)
+
+    def to_html(self, **kwargs) -> str:
+        """
+        Returns the HTML representation of this instance (as returned by the
+        matching
+        :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+        subclass).
+
+        Returns
+        -------
+        str
+            HTML representation of this instance
+        """
+
+        return self.as_value_model().to_html(**kwargs)
+
+    @property
+    def admin_link(self) -> str:
+        """
+        Creates an HTML tag to link to this instance within the admin site.
+
+        Returns
+        -------
+        str
+            Link to this instance in the admin site
+        """
+
+        model_name = self.__class__.__name__
+        return Html.admin_link(model_name, self.id)
@@ -2,6 +2,7 @@
 Definition of the :class:`CsaHeader` model.
 """
 from django.db import models
+from django_dicom.models.utils.fields import BlobTextField
 from django_dicom.models.values.data_element_value import DataElementValue
 from django_dicom.utils.html import Html
 
@@ -29,13 +30,18 @@ class CsaHeader(DataElementValue):
     to assign a :class:`~django.db.models.JSONField`.
     """
 
-    raw = models.TextField(blank=True, null=True)
+    raw = BlobTextField(blank=True, null=True, blob_field="raw_blob")
     """
     Overrides
     :attr:`~django_dicom.models.values.data_element_value.DataElementValue.raw`
-    to assign a :class:`~django.db.models.TextField`.
+    to assign a :class:`~django_dicom.models.utils.fields.BlobTextField`.
     """
 
+    #: If :attr:`raw` exceeds the *DICOM_BLOB_THRESHOLD* setting, the key of
+    #: the blob it is kept in (see
+    #: :mod:`~django_dicom.models.utils.blob_store`).
+    raw_blob = models.CharField(max_length=64, blank=True, null=True, editable=False)
+
     def to_html(self, verbose: bool = False, **kwargs) -> str:
         """
         Returns the HTML representation of this instance.
@@ -60,4 +66,4 @@ class CsaHeader(DataElementValue):
         if verbose:
             return Html.json(self.value)
         text = f"Csa Header #{self.id}"
-        return Html.admin_link("DataElementValue", self.id, text)
+        return Html.admin_link(self.ADMIN_MODEL_NAME, self.id, text)
@@ -32,6 +32,16 @@ class DataElementValue(models.Model):
     #: Interpreted data element value (meant to be overridden by child models).
     value = None  # Parsed value
 
+    #: SHA-256 digest of the value's fields, used to look up identical values
+    #: with a single unique index lookup (see
+    #: :func:`~django_dicom.models.managers.data_element_value.get_value_hash`).
+    content_hash = models.CharField(
+        max_length=64, unique=True, blank=True, null=True, editable=False
+    )
+
+    #: The model linked to by this value's admin site representations.
+    ADMIN_MODEL_NAME = "DataElementValue"
+
     objects = DataElementValueManager()
 
     class Meta:
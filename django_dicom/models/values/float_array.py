@@ -0,0 +1,43 @@
+"""
+Definition of the :class:`FloatArray` model.
+"""
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django_dicom.models.utils.fields import NumpyArrayField
+from django_dicom.models.values.data_element_value import DataElementValue
+
+
+class FloatArray(DataElementValue):
+    """
+    A :class:`~django.db.models.Model` representing all of the values of a
+    floating point data element (*DecimalString*, *FloatingPointDouble* or
+    *FloatingPointSingle*) with a value multiplicity greater than 1.
+    """
+
+    value = NumpyArrayField(
+        models.FloatField(blank=True, null=True), blank=True, null=True
+    )
+    """
+    Overrides
+    :attr:`~django_dicom.models.values.data_element_value.DataElementValue.value`
+    to assign a :class:`~django_dicom.models.utils.fields.NumpyArrayField`.
+    """
+
+    raw = ArrayField(models.TextField(blank=True, null=True), blank=True, null=True)
+    """
+    Overrides
+    :attr:`~django_dicom.models.values.data_element_value.DataElementValue.raw`
+    to assign an :class:`~django.contrib.postgres.fields.ArrayField`.
+    """
+
+    def to_html(self, **kwargs) -> str:
+        """
+        Returns the HTML representation of this instance.
+
+        Returns
+        -------
+        str
+            HTML representation of this instance
+        """
+
+        return str(self.value.tolist()) if self.value is not None else None
@@ -3,6 +3,7 @@ Definition of the :class:`OtherWord` model.
 """
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django_dicom.models.utils.fields import BlobBinaryField
 from django_dicom.models.values.data_element_value import DataElementValue
 
 
@@ -19,9 +20,14 @@ class OtherWord(DataElementValue):
     to assign a :class:`~django.db.models.IntegerField`.
     """
 
-    raw = models.BinaryField(blank=True, null=True)
+    raw = BlobBinaryField(blank=True, null=True, blob_field="raw_blob")
     """
     Overrides
     :attr:`~django_dicom.models.values.data_element_value.DataElementValue.raw`
-    to assign a :class:`~django.db.models.BinaryField`.
+    to assign a :class:`~django_dicom.models.utils.fields.BlobBinaryField`.
     """
+
+    #: If :attr:`raw` exceeds the *DICOM_BLOB_THRESHOLD* setting, the key of
+    #: the blob it is kept in (see
+    #: :mod:`~django_dicom.models.utils.blob_store`).
+    raw_blob = models.CharField(max_length=64, blank=True, null=True, editable=False)
@@ -2,6 +2,7 @@
 Definition of the :class:`Unknown` model.
 """
 from django.db import models
+from django_dicom.models.utils.fields import BlobTextField
 from django_dicom.models.values.data_element_value import DataElementValue
 
 
@@ -18,9 +19,14 @@ class Unknown(DataElementValue):
     to assign a :class:`~django.db.models.TextField`.
     """
 
-    raw = models.TextField(blank=True, null=True)
+    raw = BlobTextField(blank=True, null=True, blob_field="raw_blob")
     """
     Overrides
     :attr:`~django_dicom.models.values.data_element_value.DataElementValue.raw`
-    to assign a :class:`~django.db.models.TextField`.
+    to assign a :class:`~django_dicom.models.utils.fields.BlobTextField`.
     """
+
+    #: If :attr:`raw` exceeds the *DICOM_BLOB_THRESHOLD* setting, the key of
+    #: the blob it is kept in (see
+    #: :mod:`~django_dicom.models.utils.blob_store`).
+    raw_blob = models.CharField(max_length=64, blank=True, null=True, editable=False)
@@ -46,6 +46,42 @@ VR_TO_MODEL = {
 #: subclass based on the element's tag rather than its VR.
 TAG_TO_MODEL = {("0029", "1010"): "CsaHeader", ("0029", "1020"): "CsaHeader"}
 
+#: Numeric data elements with a value multiplicity greater than 1 are saved as
+#: a single array value rather than a value per index.
+ARRAY_VR_TO_MODEL = {
+    ValueRepresentation.DS: "FloatArray",
+    ValueRepresentation.FD: "FloatArray",
+    ValueRepresentation.FL: "FloatArray",
+    ValueRepresentation.IS: "IntegerArray",
+    ValueRepresentation.SL: "IntegerArray",
+    ValueRepresentation.SS: "IntegerArray",
+    ValueRepresentation.UL: "IntegerArray",
+    ValueRepresentation.US: "IntegerArray",
+}
+
+
+def is_array_element(data_element: DicomDataElement) -> bool:
+    """
+    Returns whether the given data element's values are saved as a single
+    array value.
+
+    Parameters
+    ----------
+    data_element : :class:`dicom_parser.data_element.DataElement`
+        Object representing a single data element in memory
+
+    Returns
+    -------
+    bool
+        Whether the data element is an array element or not
+    """
+
+    return (
+        data_element.VALUE_REPRESENTATION in ARRAY_VR_TO_MODEL
+        and data_element.tag not in TAG_TO_MODEL
+        and data_element.value_multiplicity > 1
+    )
+
 
 def get_value_model_name(data_element: DicomDataElement) -> str:
     """
@@ -64,6 +100,8 @@ def get_value_model_name(data_element: DicomDataElement) -> str:
         Name of the appropriate *"ValueModel"*
     """
 
+    if is_array_element(data_element):
+        return ARRAY_VR_TO_MODEL[data_element.VALUE_REPRESENTATION]
     return (
         TAG_TO_MODEL.get(data_element.tag)
         or VR_TO_MODEL[data_element.VALUE_REPRESENTATION]
@@ -13,10 +13,11 @@ class StorageScpSerializer(serializers.HyperlinkedModelSerializer):
     """
 
     status = serializers.SerializerMethodField()
+    queue_depth = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = StorageServiceClassProvider
-        fields = "id", "title", "ip", "port", "status"
+        fields = "id", "title", "ip", "port", "status", "queue_depth"
 
     def get_status(self, instance: StorageServiceClassProvider) -> str:
         """
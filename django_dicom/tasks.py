@@ -1,11 +1,23 @@
 import math
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Union
+from typing import Iterable, List, Union
 
 from celery import group, shared_task
+from celery.signals import worker_process_init
 
+from django_dicom.models.data_element_definition import DataElementDefinition
 from django_dicom.models.image import Image
+from django_dicom.models.networking.ingestion import import_spooled_files
+
+
+@worker_process_init.connect
+def warm_definition_cache(**kwargs):
+    """
+    Pre-warms the process-local data element definition registry when a
+    Celery worker process starts.
+    """
+    DataElementDefinition.objects.warm_cache()
 
 
 @shared_task(name="django_dicom.import-data")
@@ -34,7 +46,7 @@ def import_data(
             today = datetime.today()
             path = Path(path) / str(today.year) / str(today.month) / str(today.day)
         try:
-            return Image.objects.import_path(path, pattern="*")
+            return Image.objects.import_path(path, pattern="*", manifest=True)
         except Exception:
             pass
     else:
@@ -47,3 +59,22 @@ def import_data(
             return group(import_data.s(p) for p in path)()
         else:
             return import_data.chunks(((p,) for p in path), n_chunks)()
+
+
+@shared_task(name="django_dicom.import-spooled")
+def import_spooled(paths: List[str]) -> int:
+    """
+    Imports a batch of datasets spooled by the storage SCP (see
+    :class:`~django_dicom.models.networking.ingestion.IngestionQueue`).
+
+    Parameters
+    ----------
+    paths : List[str]
+        Spooled *.dcm* file paths
+
+    Returns
+    -------
+    int
+        Number of imported files
+    """
+    return import_spooled_files(paths)
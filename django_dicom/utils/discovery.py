@@ -0,0 +1,168 @@
+"""
+DICOM file discovery utilities.
+"""
+import os
+import tarfile
+import zipfile
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Iterator, NamedTuple, Union
+
+#: Length of the DICOM file preamble preceding the *DICM* prefix.
+PREAMBLE_LENGTH = 128
+
+#: DICOM file prefix following the preamble.
+DICOM_PREFIX = b"DICM"
+
+
+def is_dicom_file(path: Union[str, Path]) -> bool:
+    """
+    Returns whether the given file begins with a DICOM preamble and prefix,
+    using a single small read.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        File path
+
+    Returns
+    -------
+    bool
+        Whether the file seems to be a DICOM file
+    """
+    try:
+        with open(path, "rb") as f:
+            return has_dicom_prefix(f) is not None
+    except OSError:
+        return False
+
+
+def has_dicom_prefix(stream: BinaryIO) -> Union[bytes, None]:
+    """
+    Reads the beginning of a binary stream and returns it if it consists of a
+    DICOM preamble and prefix.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Binary stream positioned at the beginning of a file
+
+    Returns
+    -------
+    Union[bytes, None]
+        The bytes read from the stream, or None if they are not a DICOM
+        preamble and prefix
+    """
+    start = stream.read(PREAMBLE_LENGTH + len(DICOM_PREFIX))
+    return start if start[PREAMBLE_LENGTH:] == DICOM_PREFIX else None
+
+
+def iter_files(
+    path: Union[str, Path], pattern: str = "*", sniff: bool = True
+) -> Iterator[Path]:
+    """
+    Lazily and recursively iterates the files under some directory using
+    :func:`os.scandir`.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Base directory path
+    pattern : str, optional
+        Glob-style file name pattern, by default "*"
+    sniff : bool, optional
+        Whether to only yield files that begin with a DICOM preamble and
+        prefix (see :func:`is_dicom_file`), by default True
+
+    Yields
+    -------
+    Path
+        File paths
+    """
+    directories = [str(path)]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            continue
+        with entries:
+            subdirectories = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif (
+                    fnmatch(entry.name, pattern)
+                    and entry.is_file()
+                    and (not sniff or is_dicom_file(entry.path))
+                ):
+                    yield Path(entry.path)
+        # Reverse to iterate subdirectories in their listing order.
+        directories += reversed(subdirectories)
+
+
+class ArchiveMember(NamedTuple):
+    """
+    A file read from an archive (see :func:`iter_archive`).
+    """
+
+    #: The archive's path joined with the member's name.
+    path: Path
+
+    #: The member's content.
+    data: bytes
+
+
+def read_member(stream: BinaryIO, sniff: bool = True) -> Union[bytes, None]:
+    """
+    Reads an archive member's content, or returns None if *sniff* is True and
+    the content does not begin with a DICOM preamble and prefix.
+    """
+    if not sniff:
+        return stream.read()
+    start = has_dicom_prefix(stream)
+    return None if start is None else start + stream.read()
+
+
+def iter_archive(
+    path: Union[str, Path], pattern: str = "*", sniff: bool = True
+) -> Iterator[ArchiveMember]:
+    """
+    Lazily iterates the files within a ZIP or (optionally compressed) TAR
+    archive, reading a single member into memory at a time. TAR archives are
+    read as a stream, so members are read in their stored order.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Archive path
+    pattern : str, optional
+        Glob-style file name pattern, by default "*"
+    sniff : bool, optional
+        Whether to only yield files that begin with a DICOM preamble and
+        prefix, by default True
+
+    Yields
+    ------
+    ArchiveMember
+        Archive members
+    """
+    path = Path(path)
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = PurePosixPath(info.filename).name
+                if info.is_dir() or not fnmatch(name, pattern):
+                    continue
+                with archive.open(info) as stream:
+                    data = read_member(stream, sniff=sniff)
+                if data is not None:
+                    yield ArchiveMember(path / info.filename, data)
+        return
+    with tarfile.open(path, mode="r|*") as archive:
+        for info in archive:
+            name = PurePosixPath(info.name).name
+            if not info.isfile() or not fnmatch(name, pattern):
+                continue
+            data = read_member(archive.extractfile(info), sniff=sniff)
+            if data is not None:
+                yield ArchiveMember(path / info.name, data)
@@ -11,6 +11,7 @@ from pygments.lexers import JsonLexer
 
 #: Admin site views by model name, used to generate the appropriate URLs.
 ADMIN_VIEW_NAMES = {
+    "CompactValue": "admin:django_dicom_compactvalue_change",
     "DataElement": "admin:django_dicom_dataelement_change",
     "DataElementDefinition": "admin:django_dicom_dataelementdefinition_change",
     "DataElementValue": "admin:django_dicom_dataelementvalue_change",
@@ -1,6 +1,7 @@
 """
 General DICOM Networking utilities.
 """
+from typing import NamedTuple
 
 from django.conf import settings
 
@@ -39,3 +40,91 @@ def get_application_entity_title() -> str:
     return getattr(
         settings, APPLICATION_ENTITY_TITLE_SETTING, DEFAULT_APPLICATION_ENTITY_TITLE,
     )
+
+
+INGESTION_QUEUE_SETTING = "DICOM_SCP_QUEUE"
+"""
+Django settings key used to enable and configure asynchronous import of the
+datasets received by C-STORE requests.
+"""
+
+DEFAULT_INGESTION_QUEUE = {
+    "backend": "thread",
+    "max_size": 1000,
+    "workers": 2,
+    "batch_size": 50,
+}
+"""
+Default asynchronous import configuration.
+
+See Also
+--------
+* :class:`~django_dicom.models.networking.ingestion.IngestionQueue`
+"""
+
+
+def get_ingestion_queue_configuration() -> dict:
+    """
+    Returns the asynchronous C-STORE import configuration, or None if received
+    datasets should be imported synchronously (the default).
+
+    Returns
+    -------
+    dict
+        Ingestion queue keyword arguments
+    """
+    configuration = getattr(settings, INGESTION_QUEUE_SETTING, None)
+    if not configuration:
+        return None
+    if configuration is True:
+        configuration = {}
+    return {**DEFAULT_INGESTION_QUEUE, **configuration}
+
+
+ASSOCIATION_BATCH_SETTING = "DICOM_SCP_ASSOCIATION_BATCH"
+"""
+Django settings key used to enable and configure the import of the datasets
+received within each association together, once the association is released
+or aborted.
+"""
+
+DEFAULT_ASSOCIATION_BATCH = {"spool": False, "memory_limit": 256 * 2 ** 20}
+"""
+Default association batch configuration.
+
+See Also
+--------
+* :class:`~django_dicom.models.networking.association_batch.AssociationBatch`
+"""
+
+
+def get_association_batch_configuration() -> dict:
+    """
+    Returns the association batch import configuration, or None if received
+    datasets should not be batched by association (the default).
+
+    Returns
+    -------
+    dict
+        Association batch keyword arguments
+    """
+    configuration = getattr(settings, ASSOCIATION_BATCH_SETTING, None)
+    if not configuration:
+        return None
+    if configuration is True:
+        configuration = {}
+    return {**DEFAULT_ASSOCIATION_BATCH, **configuration}
+
+
+class ReceivedDataset(NamedTuple):
+    """
+    A C-STORE request provided dataset held in memory pending import (see
+    :class:`~django_dicom.models.networking.association_batch.AssociationBatch`).
+    """
+
+    #: The dataset's SOP Instance UID.
+    instance_uid: str
+
+    #: Binary DICOM image data (see
+    #: :func:`~django_dicom.models.networking.utils.encode_dataset`).
+    data: bytes
@@ -8,6 +8,8 @@ from django_dicom.serializers import StorageScpSerializer
 from django_dicom.views.defaults import DefaultsMixin
 from django_dicom.views.pagination import StandardResultsSetPagination
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
 
 class StorageScpViewSet(DefaultsMixin, viewsets.ModelViewSet):
@@ -19,3 +21,22 @@ class StorageScpViewSet(DefaultsMixin, viewsets.ModelViewSet):
     pagination_class = StandardResultsSetPagination
     queryset = StorageServiceClassProvider.objects.order_by("title")
     serializer_class = StorageScpSerializer
+
+    @action(detail=True, methods=["get"])
+    def metrics(self, request, pk: int = None) -> Response:
+        """
+        Returns the storage SCP's throughput and latency metrics.
+
+        Parameters
+        ----------
+        request : Request
+            API request
+        pk : int, optional
+            Storage SCP ID, by default None
+
+        Returns
+        -------
+        Response
+            Storage SCP metrics
+        """
+        return Response(self.get_object().metrics)
@@ -170,3 +170,22 @@ TEST_DEFINITION2_TO_SERIES = {
     "Value Representation": "PN",
     "Description": "A Test Name",
 }
+
+TEST_HEADER_ELEMENTS = {
+    "ImageType": ["ORIGINAL", "PRIMARY", "M", "ND"],
+    "InstanceNumber": 1,
+    "Modality": "MR",
+    "PatientID": "304848286",
+    "PatientName": "Baratz^Zvi",
+    "PixelSpacing": [0.48828125, 0.48828125],
+    "SeriesDescription": "localizer_3D_2 (9X5X5)",
+    "StudyDate": "20180501",
+}
+
+# Modality values are saved as invalid data by the multi-table value models
+# (the parsed value exceeds the field's maximal length).
+TEST_VALID_HEADER_ELEMENTS = {
+    keyword: value
+    for keyword, value in TEST_HEADER_ELEMENTS.items()
+    if keyword != "Modality"
+}
@@ -6,7 +6,8 @@ from django_dicom.models import DataElementDefinition
 from tests.fixtures import (TEST_DATA_ELEMENT_DEFINITION,
                             TEST_DATA_ELEMENT_DEFINITION2,
                             TEST_DEFINITION2_TO_SERIES,
-                            TEST_DEFINITION_TO_SERIES)
+                            TEST_DEFINITION_TO_SERIES, TEST_HEADER_ELEMENTS)
+from tests.utils import create_dicom_header
 
 
 class DataElementTestCase(TestCase):
@@ -79,3 +80,62 @@ class DataElementTestCase(TestCase):
         result = self.definition.admin_link
         self.assertIsInstance(result, str)
         self.assertEqual(result, expected)
+
+
+class DataElementDefinitionManagerTestCase(TestCase):
+    """
+    Tests for the
+    :class:`~django_dicom.models.managers.data_element_definition.DataElementDefinitionManager`
+    class.
+
+    """
+
+    def setUp(self):
+        DataElementDefinition.objects.clear_cache()
+        dicom_header = create_dicom_header(**TEST_HEADER_ELEMENTS)
+        self.data_elements = list(dicom_header.data_elements)
+
+    def tearDown(self):
+        DataElementDefinition.objects.clear_cache()
+
+    def test_registry_is_only_updated_on_commit(self):
+        DataElementDefinition.objects.bulk_from_dicom_parser(self.data_elements)
+        self.assertFalse(DataElementDefinition.objects._registry)
+
+    def test_bulk_from_dicom_parser_uses_registry(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            definitions = DataElementDefinition.objects.bulk_from_dicom_parser(
+                self.data_elements
+            )
+        with self.assertNumQueries(0):
+            cached = DataElementDefinition.objects.bulk_from_dicom_parser(
+                self.data_elements
+            )
+        self.assertListEqual(
+            [definition.id for definition in cached],
+            [definition.id for definition in definitions],
+        )
+
+    def test_from_dicom_parser_uses_registry(self):
+        data_element = self.data_elements[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            definition, created = DataElementDefinition.objects.from_dicom_parser(
+                data_element
+            )
+        self.assertTrue(created)
+        with self.assertNumQueries(0):
+            cached, created = DataElementDefinition.objects.from_dicom_parser(
+                data_element
+            )
+        self.assertFalse(created)
+        self.assertEqual(cached.id, definition.id)
+        self.assertEqual(cached.keyword, definition.keyword)
+
+    def test_warm_cache(self):
+        DataElementDefinition.objects.bulk_from_dicom_parser(self.data_elements)
+        with self.captureOnCommitCallbacks(execute=True):
+            DataElementDefinition.objects.warm_cache()
+        self.assertEqual(
+            len(DataElementDefinition.objects._registry),
+            DataElementDefinition.objects.count(),
+        )
@@ -2,11 +2,15 @@
 Tests for custom fields.
 
 """
+import shutil
+import tempfile
 
 from django.db.models import CharField
 from django.forms import MultipleChoiceField
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django_dicom.models.utils.blob_store import get_blob_path
 from django_dicom.models.utils.fields import ChoiceArrayField
+from django_dicom.models.values import CompactValue, OtherWord, Unknown
 
 
 class ChoiceArrayFieldTestCase(TestCase):
@@ -44,3 +48,58 @@ class ChoiceArrayFieldTestCase(TestCase):
         result = self.field.formfield()
         self.assertIsInstance(result, expected["form_class"])
         self.assertEqual(result.choices, list(expected["choices"]))
+
+
+class BlobFieldTestCase(TestCase):
+    """
+    Tests for the :class:`~django_dicom.models.utils.fields.BlobTextField` and
+    :class:`~django_dicom.models.utils.fields.BlobBinaryField` classes.
+
+    """
+
+    def setUp(self):
+        self.blob_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.blob_root)
+        settings = override_settings(
+            DICOM_BLOB_ROOT=self.blob_root, DICOM_BLOB_THRESHOLD=16
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_large_text_is_saved_to_blob_store(self):
+        raw = "x" * 64
+        value = Unknown.objects.create(raw=raw, value=raw)
+        self.assertEqual(Unknown.objects.filter(raw__isnull=True).count(), 1)
+        self.assertTrue(get_blob_path(value.raw_blob).exists())
+        self.assertEqual(Unknown.objects.get(id=value.id).raw, raw)
+
+    def test_large_bytes_are_saved_to_blob_store(self):
+        raw = bytes(range(64))
+        value = OtherWord.objects.create(raw=raw)
+        self.assertTrue(value.raw_blob)
+        self.assertEqual(bytes(OtherWord.objects.get(id=value.id).raw), raw)
+
+    def test_small_values_are_kept_inline(self):
+        value = Unknown.objects.create(raw="x", value="x")
+        self.assertIsNone(value.raw_blob)
+        self.assertEqual(Unknown.objects.get(id=value.id).raw, "x")
+
+    def test_identical_values_share_blobs(self):
+        raw = "y" * 64
+        first = Unknown.objects.create(raw=raw, value="first")
+        second = Unknown.objects.create(raw=raw, value="second")
+        self.assertEqual(first.raw_blob, second.raw_blob)
+
+    def test_bulk_created_compact_values(self):
+        raw = "z" * 64
+        (value,) = CompactValue.objects.bulk_create(
+            [CompactValue(value_model="Unknown", content_hash="0", raw_text=raw)]
+        )
+        fetched = CompactValue.objects.get(content_hash="0")
+        self.assertIsNotNone(fetched.raw_text_blob)
+        self.assertEqual(fetched.raw, raw)
+
+    @override_settings(DICOM_BLOB_THRESHOLD=None)
+    def test_blob_store_is_disabled_by_default(self):
+        value = Unknown.objects.create(raw="x" * 64, value="x")
+        self.assertIsNone(value.raw_blob)
@@ -0,0 +1,129 @@
+from django.test import TestCase, override_settings
+from django_dicom.models import DataElement, DataElementDefinition, Header, Series
+from django_dicom.models.values import DataElementValue
+from tests.fixtures import TEST_HEADER_ELEMENTS, TEST_VALID_HEADER_ELEMENTS
+from tests.utils import create_dicom_header, get_values_by_keyword
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class HeaderManagerTestCase(TestCase):
+    """
+    Tests for the :class:`~django_dicom.models.managers.header.HeaderManager`
+    class.
+
+    """
+
+    def setUp(self):
+        self.dicom_header = create_dicom_header(**TEST_HEADER_ELEMENTS)
+        self.other_dicom_header = create_dicom_header(
+            **{**TEST_HEADER_ELEMENTS, "InstanceNumber": 2}
+        )
+
+    def test_bulk_from_dicom_parser_matches_from_dicom_parser(self):
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        n_values = DataElementValue.objects.count()
+        bulk_header, other_header = Header.objects.bulk_from_dicom_parser(
+            [self.dicom_header, self.other_dicom_header]
+        )
+        self.assertEqual(
+            bulk_header.data_element_set.count(), len(TEST_HEADER_ELEMENTS)
+        )
+        self.assertDictEqual(
+            get_values_by_keyword(bulk_header), get_values_by_keyword(header),
+        )
+        self.assertEqual(other_header.get_value_by_keyword("InstanceNumber"), 2)
+        # Only the differing instance number should have been created.
+        self.assertEqual(DataElementValue.objects.count(), n_values + 1)
+
+    def test_bulk_from_dicom_parser_deduplicates_rows(self):
+        Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        n_definitions = DataElementDefinition.objects.count()
+        n_values = DataElementValue.objects.count()
+        Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        self.assertEqual(DataElementDefinition.objects.count(), n_definitions)
+        self.assertEqual(DataElementValue.objects.count(), n_values)
+        self.assertEqual(DataElement.objects.count(), 2 * len(TEST_HEADER_ELEMENTS))
+
+    def test_bulk_from_dicom_parser_falls_back_on_invalid_data(self):
+        dicom_header = create_dicom_header(
+            **{**TEST_HEADER_ELEMENTS, "Modality": "X" * 32}
+        )
+        (header,) = Header.objects.bulk_from_dicom_parser([dicom_header])
+        modality = header.data_element_set.get(definition__keyword="Modality")
+        value = modality._values.select_subclasses().get()
+        self.assertIsNone(value.value)
+        self.assertTrue(value.warnings)
+
+    def test_bulk_from_dicom_parser_with_no_headers(self):
+        self.assertEqual(Header.objects.bulk_from_dicom_parser([]), [])
+
+    def test_values_are_deduplicated_by_content_hash(self):
+        Header.objects.from_dicom_parser(self.dicom_header)
+        values = DataElementValue.objects.select_subclasses()
+        hashes = [value.content_hash for value in values]
+        self.assertNotIn(None, hashes)
+        self.assertEqual(len(hashes), len(set(hashes)))
+        Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        self.assertEqual(DataElementValue.objects.count(), len(hashes))
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class HeaderDeltaTestCase(TestCase):
+    """
+    Tests for headers stored relative to a common header.
+
+    """
+
+    def setUp(self):
+        self.dicom_header = create_dicom_header(**TEST_VALID_HEADER_ELEMENTS)
+        self.base = Header.objects.from_dicom_parser(self.dicom_header)
+
+    def test_from_dicom_parser_with_base_saves_delta(self):
+        dicom_header = create_dicom_header(
+            **{**TEST_VALID_HEADER_ELEMENTS, "InstanceNumber": 2}
+        )
+        header = Header.objects.from_dicom_parser(dicom_header, base=self.base)
+        full_header = Header.objects.from_dicom_parser(dicom_header)
+        self.assertEqual(header.data_element_set.count(), 1)
+        self.assertEqual(header.get_value_by_keyword("InstanceNumber"), 2)
+        self.assertEqual(header.get_value_by_keyword("PatientID"), "304848286")
+        self.assertDictEqual(
+            get_values_by_keyword(header), get_values_by_keyword(full_header)
+        )
+
+    def test_from_dicom_parser_with_base_omits_missing_elements(self):
+        elements = {
+            k: v
+            for k, v in TEST_VALID_HEADER_ELEMENTS.items()
+            if k != "SeriesDescription"
+        }
+        dicom_header = create_dicom_header(**elements)
+        header = Header.objects.from_dicom_parser(dicom_header, base=self.base)
+        self.assertEqual(header.data_element_set.count(), 1)
+        self.assertIsNone(header.get_value_by_keyword("SeriesDescription"))
+        keywords = [element["keyword"] for element in header.to_verbose_list()]
+        self.assertCountEqual(keywords, elements)
+
+    def test_bulk_from_dicom_parser_with_base(self):
+        dicom_headers = [
+            create_dicom_header(**{**TEST_VALID_HEADER_ELEMENTS, "InstanceNumber": i})
+            for i in (1, 2)
+        ]
+        same, other = Header.objects.bulk_from_dicom_parser(
+            dicom_headers, base=self.base
+        )
+        self.assertFalse(same.data_element_set.exists())
+        self.assertEqual(other.data_element_set.count(), 1)
+        self.assertEqual(same.get_value_by_keyword("InstanceNumber"), 1)
+        self.assertEqual(other.get_value_by_keyword("InstanceNumber"), 2)
+        self.assertEqual(len(other.to_verbose_list()), len(TEST_VALID_HEADER_ELEMENTS))
+
+    def test_get_or_create_common_header(self):
+        series = Series.objects.create(uid="1.2.3")
+        common_header = series.get_or_create_common_header(self.dicom_header)
+        self.assertEqual(series.get_or_create_common_header(None), common_header)
+        series.refresh_from_db()
+        self.assertEqual(series.common_header, common_header)
+        self.assertEqual(
+            common_header.data_element_set.count(), len(TEST_VALID_HEADER_ELEMENTS)
+        )
@@ -1,13 +1,30 @@
+import shutil
+import tarfile
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
 import numpy as np
+import pydicom
+from dicom_parser.header import Header as DicomHeader
 from dicom_parser.image import Image as DicomImage
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django_dicom.apps import DjangoDicomConfig
-from django_dicom.models import Header, Image, Patient, Series, Study
+from django_dicom.models import (Header, Image, ImportManifestEntry, Patient,
+                                 Series, Study)
 from django_dicom.models.dicom_entity import DicomEntity
-from django_dicom.models.utils import snake_case_to_camel_case
+from django_dicom.models.utils import read_header, snake_case_to_camel_case
+from django_dicom.models.utils.entity_cache import entity_cache, get_entity_cache
+from django_dicom.models.utils.locks import get_lock_key
+from django_dicom.models.utils.utils import get_mri_root
 from tests.fixtures import (TEST_DWI_IMAGE_FIELDS, TEST_DWI_SERIES_FIELDS,
-                            TEST_IMAGE_FIELDS, TEST_PATIENT_FIELDS,
+                            TEST_FILES_PATH, TEST_IMAGE_FIELDS,
+                            TEST_IMAGE_PATH,
+                            TEST_PATIENT_FIELDS, TEST_ZIP_PATH,
                             TEST_SERIES_FIELDS, TEST_STUDY_FIELDS)
 
 
@@ -331,3 +348,375 @@ class ImageTestCase(TestCase):
         expected = f'<a href="{url}">{self.image.id}</a>'
         result = self.image.admin_link
         self.assertEqual(result, expected)
+
+
+TEST_DCM_PATHS = sorted(Path(TEST_FILES_PATH).glob("*.dcm"))
+
+
+class ImageImportTestCase(TestCase):
+    """
+    Tests for the :class:`~django_dicom.models.managers.image.ImageManager`
+    class's DICOM file import.
+
+    """
+
+    def tearDown(self):
+        shutil.rmtree(get_mri_root(), ignore_errors=True)
+
+    def test_get_or_create_from_dcm_reads_header_once(self):
+        with mock.patch(
+            "django_dicom.models.utils.utils.DicomHeader", wraps=DicomHeader
+        ) as read, mock.patch.object(DicomImage, "read_raw_data") as read_data:
+            image, created = Image.objects.get_or_create_from_dcm(
+                Path(TEST_IMAGE_PATH)
+            )
+        self.assertTrue(created)
+        read.assert_called_once()
+        read_data.assert_not_called()
+        self.assertEqual(image.uid, TEST_IMAGE_FIELDS["uid"])
+        self.assertEqual(image.patient.uid, TEST_PATIENT_FIELDS["uid"])
+        self.assertEqual(image.series.uid, TEST_SERIES_FIELDS["uid"])
+        self.assertEqual(image.dcm.path, str(image.default_path))
+
+    def test_get_or_create_from_dcm_with_existing_image(self):
+        Image.objects.get_or_create_from_dcm(Path(TEST_IMAGE_PATH))
+        header = read_header(TEST_IMAGE_PATH)
+        with self.assertNumQueries(1):
+            image, created = Image.objects.get_or_create_from_dcm(
+                Path(TEST_IMAGE_PATH), header=header
+            )
+        self.assertFalse(created)
+
+    @override_settings(DICOM_FILE_PLACEMENT="hardlink")
+    def test_import_path_outside_media_root_with_hardlink(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        source = Path(shutil.copy(TEST_IMAGE_PATH, temp_dir))
+        images = Image.objects.import_path(temp_dir, progressbar=False, report=False)
+        image = images.get()
+        self.assertEqual(image.dcm.path, str(image.default_path))
+        self.assertEqual(source.stat().st_nlink, 2)
+        self.assertTrue(source.samefile(image.dcm.path))
+
+    def test_get_or_create_from_data(self):
+        data = Path(TEST_IMAGE_PATH).read_bytes()
+        with mock.patch(
+            "django_dicom.models.utils.utils.DicomHeader", wraps=DicomHeader
+        ) as read:
+            image, created = Image.objects.get_or_create_from_data(data)
+        self.assertTrue(created)
+        read.assert_called_once()
+        self.assertEqual(image.uid, TEST_IMAGE_FIELDS["uid"])
+        self.assertEqual(image.dcm.path, str(image.default_path))
+        self.assertEqual(Path(image.dcm.path).read_bytes(), data)
+        self.assertEqual(list(image.default_path.parent.glob("*.tmp")), [])
+        self.assertTrue(Path(TEST_IMAGE_PATH).is_file())
+
+    def test_get_or_create_from_data_with_file_object(self):
+        with open(TEST_IMAGE_PATH, "rb") as data:
+            image, created = Image.objects.get_or_create_from_data(data)
+        self.assertTrue(created)
+        with open(TEST_IMAGE_PATH, "rb") as data:
+            existing, created = Image.objects.get_or_create_from_data(data)
+        self.assertFalse(created)
+        self.assertEqual(existing, image)
+
+    def test_import_path(self):
+        images = Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False
+        )
+        self.assertEqual(images.count(), 4)
+        images = Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False
+        )
+        self.assertFalse(images.exists())
+
+    def test_import_archive(self):
+        images = Image.objects.import_archive(
+            TEST_ZIP_PATH, progressbar=False, report=False
+        )
+        self.assertEqual(images.count(), 3)
+        for image in images:
+            self.assertEqual(image.dcm.path, str(image.default_path))
+            self.assertTrue(Path(image.dcm.path).is_file())
+        images = Image.objects.import_archive(
+            TEST_ZIP_PATH, progressbar=False, report=False
+        )
+        self.assertFalse(images.exists())
+
+    def test_import_archive_with_tar_and_workers(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        archive_path = temp_dir / "images.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as archive:
+            for path in TEST_DCM_PATHS:
+                archive.add(path, arcname=f"data/{path.name}")
+        images = Image.objects.import_archive(
+            archive_path, progressbar=False, report=False, workers=2
+        )
+        self.assertSetEqual(
+            set(images.values_list("uid", flat=True)),
+            {read_header(path).get("SOPInstanceUID") for path in TEST_DCM_PATHS},
+        )
+
+    def test_import_path_with_workers(self):
+        images = Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, workers=2
+        )
+        self.assertSetEqual(
+            set(images.values_list("uid", flat=True)),
+            {read_header(path).get("SOPInstanceUID") for path in TEST_DCM_PATHS},
+        )
+
+    @override_settings(DICOM_HEADER_STORAGE="delta")
+    def test_import_path_with_delta_headers(self):
+        images = Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False
+        )
+        self.assertEqual(images.count(), len(TEST_DCM_PATHS))
+        for image in images:
+            common_header = image.series.common_header
+            self.assertIsNotNone(common_header)
+            self.assertEqual(image.header.base, common_header)
+
+    def test_import_path_with_commit_every(self):
+        images = Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, commit_every=3
+        )
+        self.assertEqual(images.count(), len(TEST_DCM_PATHS))
+
+    def create_series_files(self, n_images: int) -> Path:
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        dataset = pydicom.dcmread(TEST_IMAGE_PATH)
+        for number in range(1, n_images + 1):
+            dataset.SOPInstanceUID = f"{TEST_IMAGE_FIELDS['uid']}.{number}"
+            dataset.InstanceNumber = number
+            dataset.save_as(temp_dir / f"{number}.dcm")
+        return temp_dir
+
+    def count_inserts(self, queries: list, table: str) -> int:
+        statement = f'INSERT INTO "{table}"'
+        return sum(query["sql"].startswith(statement) for query in queries)
+
+    def test_import_path_with_commit_every_creates_headers_in_bulk(self):
+        path = self.create_series_files(5)
+        with CaptureQueriesContext(connection) as single:
+            Image.objects.import_path(
+                self.create_series_files(1), progressbar=False, report=False
+            )
+        Image.objects.all().delete()
+        with CaptureQueriesContext(connection) as chunk:
+            images = Image.objects.import_path(
+                path, progressbar=False, report=False, commit_every=5
+            )
+        self.assertEqual(images.count(), 5)
+        queries = chunk.captured_queries
+        self.assertEqual(self.count_inserts(queries, "django_dicom_header"), 1)
+        self.assertEqual(
+            self.count_inserts(queries, "django_dicom_dataelement"),
+            self.count_inserts(single.captured_queries, "django_dicom_dataelement"),
+        )
+        self.assertLess(len(queries), 2 * len(single.captured_queries))
+
+    @override_settings(DICOM_HEADER_STORAGE="delta")
+    def test_import_path_with_commit_every_and_delta_headers(self):
+        path = self.create_series_files(3)
+        with CaptureQueriesContext(connection) as context:
+            images = Image.objects.import_path(
+                path, progressbar=False, report=False, commit_every=3
+            )
+        self.assertEqual(images.count(), 3)
+        # The series' common header and its images' headers.
+        inserts = self.count_inserts(context.captured_queries, "django_dicom_header")
+        self.assertEqual(inserts, 2)
+        common_header = images.first().series.common_header
+        for image in images:
+            self.assertEqual(image.header.base, common_header)
+
+    def test_import_path_with_commit_every_keeps_valid_images(self):
+        get_or_create_from_dcm = Image.objects.get_or_create_from_dcm
+        failing_path = TEST_DCM_PATHS[1]
+
+        def fail_on_path(path, **kwargs):
+            if path == failing_path:
+                raise RuntimeError("Import failure!")
+            return get_or_create_from_dcm(path, **kwargs)
+
+        with mock.patch.object(
+            Image.objects, "get_or_create_from_dcm", side_effect=fail_on_path
+        ):
+            with self.assertRaises(RuntimeError):
+                Image.objects.import_path(
+                    TEST_FILES_PATH,
+                    progressbar=False,
+                    report=False,
+                    commit_every=len(TEST_DCM_PATHS),
+                )
+        self.assertEqual(Image.objects.count(), len(TEST_DCM_PATHS) - 1)
+
+    def test_import_path_skips_existing_images(self):
+        Image.objects.import_path(TEST_FILES_PATH, progressbar=False, report=False)
+        with mock.patch(
+            "django_dicom.models.utils.utils.DicomHeader", wraps=DicomHeader
+        ) as read:
+            # Definitions registry warm-up and existing images lookup.
+            with self.assertNumQueries(2):
+                images = Image.objects.import_path(
+                    TEST_FILES_PATH, progressbar=False, report=False
+                )
+                self.assertFalse(images)
+        read.assert_not_called()
+
+    def test_count_imported(self):
+        self.assertEqual(Image.objects.count_imported(TEST_FILES_PATH), 0)
+        Image.objects.get_or_create_from_dcm(Path(TEST_IMAGE_PATH))
+        self.assertEqual(Image.objects.count_imported(TEST_FILES_PATH), 1)
+
+    def test_import_path_with_manifest(self):
+        Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, pattern="*", manifest=True
+        )
+        statuses = dict(ImportManifestEntry.objects.values_list("path", "status"))
+        self.assertEqual(len(statuses), len(TEST_DCM_PATHS))
+        for path in TEST_DCM_PATHS:
+            self.assertEqual(statuses[str(path.absolute())], "CREATED")
+
+    def test_import_path_with_manifest_records_invalid_files(self):
+        Image.objects.import_path(
+            TEST_FILES_PATH,
+            progressbar=False,
+            report=False,
+            pattern="*.zip",
+            manifest=True,
+            sniff=False,
+        )
+        statuses = set(ImportManifestEntry.objects.values_list("status", flat=True))
+        self.assertSetEqual(statuses, {"INVALID"})
+
+    def test_import_path_with_manifest_skips_unchanged_files(self):
+        Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, manifest=True
+        )
+        with mock.patch(
+            "django_dicom.models.managers.image.read_identifiers"
+        ) as read_identifiers:
+            Image.objects.import_path(
+                TEST_FILES_PATH, progressbar=False, report=False, manifest=True
+            )
+        read_identifiers.assert_not_called()
+
+    def test_import_path_with_manifest_rescans_modified_files(self):
+        Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, manifest=True
+        )
+        entry = ImportManifestEntry.objects.get(path=TEST_DCM_PATHS[0].absolute())
+        entry.mtime -= 1
+        entry.save()
+        Image.objects.import_path(
+            TEST_FILES_PATH, progressbar=False, report=False, manifest=True
+        )
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "EXISTING")
+        self.assertEqual(entry.mtime, TEST_DCM_PATHS[0].stat().st_mtime_ns)
+
+    def test_from_header_with_entity_cache(self):
+        image, _ = Image.objects.get_or_create_from_dcm(Path(TEST_IMAGE_PATH))
+        with entity_cache() as cache:
+            Series.objects.from_header(image.header)
+            with self.assertNumQueries(0):
+                series, created = Series.objects.from_header(image.header)
+            self.assertEqual(len(cache), 1)
+        self.assertFalse(created)
+        self.assertEqual(series, image.series)
+        self.assertIsNone(get_entity_cache())
+
+    def test_get_or_create_from_dcm_with_concurrently_created_image(self):
+        image, _ = Image.objects.get_or_create_from_dcm(Path(TEST_IMAGE_PATH))
+        get = Image.objects.get
+        # Simulate an image created by another importer after the lookup.
+        with mock.patch.object(
+            Image.objects, "get", side_effect=[Image.DoesNotExist, get(id=image.id)]
+        ):
+            result, created = Image.objects.get_or_create_from_dcm(
+                Path(TEST_IMAGE_PATH)
+            )
+        self.assertFalse(created)
+        self.assertEqual(result, image)
+
+    def test_from_header_with_concurrently_created_entity(self):
+        image, _ = Image.objects.get_or_create_from_dcm(Path(TEST_IMAGE_PATH))
+        with mock.patch.object(
+            Series.objects, "get", side_effect=[Series.DoesNotExist, image.series]
+        ):
+            series, created = Series.objects.from_header(image.header)
+        self.assertFalse(created)
+        self.assertEqual(series, image.series)
+
+    def test_get_lock_key(self):
+        key = get_lock_key(Image, TEST_IMAGE_FIELDS["uid"])
+        self.assertEqual(key, get_lock_key(Image, TEST_IMAGE_FIELDS["uid"]))
+        self.assertNotEqual(key, get_lock_key(Series, TEST_IMAGE_FIELDS["uid"]))
+        self.assertLess(abs(key), 2 ** 63)
+
+
+class ConcurrentImportTestCase(TransactionTestCase):
+    """
+    Tests for concurrent imports using the
+    :class:`~django_dicom.models.managers.image.ImageManager` class.
+
+    """
+
+    def tearDown(self):
+        shutil.rmtree(get_mri_root(), ignore_errors=True)
+
+    def test_import_overlapping_chunks_in_opposite_order(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        records = []
+        for path in TEST_DCM_PATHS:
+            copy = Path(shutil.copy(path, temp_dir))
+            records.append((copy, read_header(copy)))
+        chunks = records, records[::-1]
+        get_or_create_from_record = Image.objects.get_or_create_from_record
+        barrier = threading.Barrier(len(chunks), timeout=1)
+        state = threading.local()
+        errors = []
+
+        def get_or_create_and_wait(path, header, **kwargs):
+            result = get_or_create_from_record(path, header, **kwargs)
+            # Let the other importer create its first image before the rest.
+            if not getattr(state, "waited", False):
+                state.waited = True
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+            return result
+
+        def import_chunk(chunk):
+            try:
+                Image.objects.import_chunk(chunk)
+            except Exception as exception:
+                errors.append(exception)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=import_chunk, args=(c,)) for c in chunks]
+        with mock.patch.object(
+            Image.objects,
+            "get_or_create_from_record",
+            side_effect=get_or_create_and_wait,
+        ), mock.patch.object(
+            Image.objects,
+            "restore_moved_files",
+            wraps=Image.objects.restore_moved_files,
+        ) as retry:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+        # Neither chunk failed and was retried file by file.
+        retry.assert_not_called()
+        self.assertEqual(Image.objects.count(), len(records))
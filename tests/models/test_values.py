@@ -1,7 +1,25 @@
-from django.test import TestCase
-from django_dicom.models.values import PersonName
+from importlib import import_module
+from unittest import mock
+
+import numpy as np
+import pydicom
+from dicom_parser.header import Header as DicomHeader
+from django.apps import apps
+from django.test import TestCase, override_settings
+from django_dicom.models import Header
+from django_dicom.models.values import (
+    CompactValue,
+    DataElementValue,
+    FloatArray,
+    IntegerArray,
+    PersonName,
+    SequenceOfItems,
+)
 from django_dicom.utils.html import Html
 from tests.fixtures import TEST_PERSON_NAME  # , TEST_DATETIME
+from tests.fixtures import TEST_IMAGE_PATH, TEST_VALID_HEADER_ELEMENTS
+from pydicom.dataset import Dataset
+from tests.utils import create_dicom_header, get_values_by_keyword
 
 # from django_dicom.models import DateTime
 
@@ -85,3 +103,226 @@ class PersonNameTestCase(TestCase):
 #         expected = Html.json(TEST_DATETIME["value"])
 #         result = self.datetime.to_html()
 #         self.assertEqual(result, expected)
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class ContentHashMigrationTestCase(TestCase):
+    """
+    Tests for the data migration populating the
+    :class:`~django_dicom.models.values.data_element_value.DataElementValue`
+    model's *content_hash* field.
+
+    """
+
+    def test_populate_content_hash(self):
+        dicom_header = create_dicom_header(**TEST_VALID_HEADER_ELEMENTS)
+        Header.objects.from_dicom_parser(dicom_header)
+        values = DataElementValue.objects.order_by("pk")
+        expected = list(values.values_list("content_hash", flat=True))
+        DataElementValue.objects.update(content_hash=None)
+        migration = import_module(
+            "django_dicom.migrations.0011_dataelementvalue_content_hash"
+        )
+        with mock.patch.object(migration, "CHUNK_SIZE", 2):
+            migration.Migration.populate_content_hash(apps, None)
+        result = list(values.values_list("content_hash", flat=True))
+        self.assertEqual(result, expected)
+
+
+@override_settings(DICOM_IMPORT_MODE="full", DICOM_VALUE_STORAGE="compact")
+class CompactValueTestCase(TestCase):
+    """
+    Tests for the :class:`~django_dicom.models.values.compact_value.CompactValue`
+    model.
+
+    """
+
+    def setUp(self):
+        self.dicom_header = create_dicom_header(**TEST_VALID_HEADER_ELEMENTS)
+
+    def test_from_dicom_parser(self):
+        with override_settings(DICOM_VALUE_STORAGE="multi-table"):
+            header = Header.objects.from_dicom_parser(self.dicom_header)
+            expected = get_values_by_keyword(header)
+        n_values = DataElementValue.objects.count()
+        compact_header = Header.objects.from_dicom_parser(self.dicom_header)
+        self.assertEqual(DataElementValue.objects.count(), n_values)
+        self.assertDictEqual(get_values_by_keyword(compact_header), expected)
+
+    def test_bulk_from_dicom_parser(self):
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        n_values = CompactValue.objects.count()
+        (bulk_header,) = Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        self.assertEqual(CompactValue.objects.count(), n_values)
+        self.assertDictEqual(
+            get_values_by_keyword(bulk_header), get_values_by_keyword(header)
+        )
+
+    def test_content_hashes_match_multi_table_values(self):
+        with override_settings(DICOM_VALUE_STORAGE="multi-table"):
+            Header.objects.from_dicom_parser(self.dicom_header)
+        Header.objects.from_dicom_parser(self.dicom_header)
+        self.assertSetEqual(
+            set(CompactValue.objects.values_list("content_hash", flat=True)),
+            set(DataElementValue.objects.values_list("content_hash", flat=True)),
+        )
+
+    def test_migrate_values(self):
+        with override_settings(DICOM_VALUE_STORAGE="multi-table"):
+            header = Header.objects.from_dicom_parser(self.dicom_header)
+            expected = get_values_by_keyword(header)
+        n_values = DataElementValue.objects.count()
+        self.assertEqual(CompactValue.objects.migrate_values(chunk_size=3), n_values)
+        n_compact = CompactValue.objects.count()
+        self.assertEqual(n_compact, n_values)
+        self.assertDictEqual(get_values_by_keyword(header), expected)
+        CompactValue.objects.migrate_values()
+        self.assertEqual(CompactValue.objects.count(), n_compact)
+
+    def test_toggle_value_storage(self):
+        with override_settings(DICOM_VALUE_STORAGE="multi-table"):
+            header = Header.objects.from_dicom_parser(self.dicom_header)
+            expected = get_values_by_keyword(header)
+            signatures = header.get_element_signatures()
+        # Switched to compact storage before migrating the values.
+        header = Header.objects.get(id=header.id)
+        self.assertDictEqual(get_values_by_keyword(header), expected)
+        self.assertDictEqual(header.get_element_signatures(), signatures)
+        # Switched back to multi-table storage after creating compact values.
+        compact_header = Header.objects.from_dicom_parser(self.dicom_header)
+        with override_settings(DICOM_VALUE_STORAGE="multi-table"):
+            self.assertDictEqual(get_values_by_keyword(compact_header), expected)
+            self.assertDictEqual(
+                compact_header.get_element_signatures(),
+                Header.objects.get(id=header.id).get_element_signatures(),
+            )
+
+    def test_to_html(self):
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        data_element = header.data_element_set.get(definition__keyword="PatientName")
+        value = data_element.get_value_instances().get()
+        self.assertIsInstance(value, CompactValue)
+        self.assertEqual(value.to_html(), Html.json(value.value))
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class ArrayValueTestCase(TestCase):
+    """
+    Tests for the :class:`~django_dicom.models.values.float_array.FloatArray` and
+    :class:`~django_dicom.models.values.integer_array.IntegerArray` models.
+
+    """
+
+    def setUp(self):
+        self.dicom_header = create_dicom_header(
+            **TEST_VALID_HEADER_ELEMENTS, AcquisitionMatrix=[0, 256, 256, 0]
+        )
+
+    def assert_array_values(self, header: Header):
+        pixel_spacing = header.get_value_by_keyword("PixelSpacing")
+        self.assertIsInstance(pixel_spacing, np.ndarray)
+        self.assertEqual(pixel_spacing.dtype, np.float64)
+        np.testing.assert_array_equal(
+            pixel_spacing, TEST_VALID_HEADER_ELEMENTS["PixelSpacing"]
+        )
+        acquisition_matrix = header.get_value_by_keyword("AcquisitionMatrix")
+        self.assertEqual(acquisition_matrix.dtype, np.int64)
+        np.testing.assert_array_equal(acquisition_matrix, [0, 256, 256, 0])
+
+    def test_from_dicom_parser(self):
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        data_element = header.data_element_set.get(definition__keyword="PixelSpacing")
+        self.assertEqual(data_element.value_multiplicity, 2)
+        self.assertEqual(FloatArray.objects.count(), 1)
+        self.assertEqual(IntegerArray.objects.count(), 1)
+        self.assert_array_values(header)
+
+    def test_bulk_from_dicom_parser(self):
+        (header,) = Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        self.assertEqual(FloatArray.objects.count(), 1)
+        self.assert_array_values(header)
+        Header.objects.from_dicom_parser(self.dicom_header)
+        self.assertEqual(FloatArray.objects.count(), 1)
+
+    @override_settings(DICOM_VALUE_STORAGE="compact")
+    def test_compact_value_storage(self):
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        self.assertFalse(FloatArray.objects.exists())
+        self.assert_array_values(header)
+
+    def assert_value_multiplicity(self):
+        dataset = pydicom.dcmread(TEST_IMAGE_PATH, stop_before_pixels=True)
+        dataset.remove_private_tags()
+        header = Header.objects.from_dicom_parser(DicomHeader(dataset))
+        expected = {"ImagePositionPatient": 3, "ImageOrientationPatient": 6}
+        for keyword, value_multiplicity in expected.items():
+            element = header.data_element_set.get(definition__keyword=keyword)
+            self.assertEqual(element.value_multiplicity, value_multiplicity)
+            self.assertEqual(len(element.value), value_multiplicity)
+
+    def test_value_multiplicity(self):
+        self.assert_value_multiplicity()
+
+    @override_settings(DICOM_VALUE_STORAGE="compact")
+    def test_compact_value_multiplicity(self):
+        self.assert_value_multiplicity()
+
+
+def create_item(uid: str, nested_uids: list = ()) -> Dataset:
+    item = Dataset()
+    item.ReferencedSOPInstanceUID = uid
+    if nested_uids:
+        item.ReferencedImageSequence = [create_item(nested) for nested in nested_uids]
+    return item
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class SequenceOfItemsTestCase(TestCase):
+    """
+    Tests for the
+    :class:`~django_dicom.models.values.sequence_of_items.SequenceOfItems`
+    model.
+
+    """
+
+    def setUp(self):
+        items = [create_item("1.1", ["1.1.1", "1.1.2"]), create_item("1.2", ["1.1.1"])]
+        self.dicom_header = create_dicom_header(
+            PatientID="1", ReferencedSeriesSequence=items
+        )
+
+    def get_nested_uids(self, header) -> list:
+        items = header.get_value_by_keyword("ReferencedSeriesSequence")
+        return [
+            [
+                item.get_value_by_keyword("ReferencedSOPInstanceUID"),
+                [
+                    nested.get_value_by_keyword("ReferencedSOPInstanceUID")
+                    for nested in item.get_value_by_keyword(
+                        "ReferencedImageSequence"
+                    ).order_by("index")
+                ],
+            ]
+            for item in items.order_by("index")
+        ]
+
+    def test_nested_sequences(self):
+        expected = [["1.1", ["1.1.1", "1.1.2"]], ["1.2", ["1.1.1"]]]
+        Header.objects.from_dicom_parser(self.dicom_header)
+        (header,) = Header.objects.bulk_from_dicom_parser([self.dicom_header])
+        self.assertEqual(self.get_nested_uids(header), expected)
+        # One top-level sequence and two nested sequences per header.
+        self.assertEqual(SequenceOfItems.objects.count(), 6)
+        self.assertEqual(Header.objects.filter(parent__isnull=False).count(), 10)
+
+    @override_settings(DICOM_SEQUENCE_DEDUPLICATION=True)
+    def test_deduplicated_sequences(self):
+        expected = [["1.1", ["1.1.1", "1.1.2"]], ["1.2", ["1.1.1"]]]
+        Header.objects.bulk_from_dicom_parser([self.dicom_header, self.dicom_header])
+        header = Header.objects.from_dicom_parser(self.dicom_header)
+        self.assertEqual(self.get_nested_uids(header), expected)
+        self.assertEqual(SequenceOfItems.objects.count(), 3)
+        self.assertEqual(Header.objects.filter(parent__isnull=False).count(), 5)
+        self.assertFalse(
+            SequenceOfItems.objects.filter(content_hash__isnull=True).exists()
+        )
@@ -0,0 +1,70 @@
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+from django_dicom.utils.discovery import is_dicom_file, iter_archive, iter_files
+from tests.fixtures import TEST_IMAGE_PATH
+
+
+class DiscoveryTestCase(SimpleTestCase):
+    """
+    Tests for the :mod:`~django_dicom.utils.discovery` module.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        nested = self.temp_dir / "a" / "b"
+        nested.mkdir(parents=True)
+        self.dicom_paths = {
+            self.temp_dir / "1.dcm",
+            nested / "2.dcm",
+            nested / "no_extension",
+        }
+        for path in self.dicom_paths:
+            shutil.copy(TEST_IMAGE_PATH, path)
+        self.junk_path = self.temp_dir / "a" / "junk.dcm"
+        self.junk_path.write_bytes(b"\x00" * 256)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_is_dicom_file(self):
+        self.assertTrue(is_dicom_file(TEST_IMAGE_PATH))
+        self.assertFalse(is_dicom_file(self.junk_path))
+        self.assertFalse(is_dicom_file(self.temp_dir / "missing.dcm"))
+
+    def test_iter_files(self):
+        self.assertSetEqual(set(iter_files(self.temp_dir)), self.dicom_paths)
+
+    def test_iter_files_with_pattern(self):
+        expected = {path for path in self.dicom_paths if path.suffix == ".dcm"}
+        self.assertSetEqual(set(iter_files(self.temp_dir, "*.dcm")), expected)
+
+    def test_iter_files_without_sniffing(self):
+        result = set(iter_files(self.temp_dir, sniff=False))
+        self.assertSetEqual(result, self.dicom_paths | {self.junk_path})
+
+    def test_iter_archive(self):
+        zip_path = self.temp_dir / "archive.zip"
+        tar_path = self.temp_dir / "archive.tar.gz"
+        with zipfile.ZipFile(zip_path, "w") as zip_archive, tarfile.open(
+            tar_path, "w:gz"
+        ) as tar_archive:
+            for path in self.dicom_paths | {self.junk_path}:
+                name = str(path.relative_to(self.temp_dir))
+                zip_archive.write(path, arcname=name)
+                tar_archive.add(path, arcname=name)
+        expected = {"1.dcm", "a/b/2.dcm", "a/b/no_extension"}
+        data = Path(TEST_IMAGE_PATH).read_bytes()
+        for archive_path in (zip_path, tar_path):
+            members = list(iter_archive(archive_path))
+            names = {str(member.path.relative_to(archive_path)) for member in members}
+            self.assertSetEqual(names, expected)
+            self.assertTrue(all(member.data == data for member in members))
+            members = iter_archive(archive_path, pattern="*.dcm", sniff=False)
+            names = {str(member.path.relative_to(archive_path)) for member in members}
+            self.assertSetEqual(names, {"1.dcm", "a/b/2.dcm", "a/junk.dcm"})
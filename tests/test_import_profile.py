@@ -0,0 +1,98 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+from django_dicom.models import Header
+from django_dicom.models.utils.import_profile import (
+    ImportProfile,
+    get_import_profile,
+    import_profile,
+)
+from tests.fixtures import TEST_HEADER_ELEMENTS
+from tests.utils import create_dicom_header
+
+
+class ImportProfileTestCase(SimpleTestCase):
+    """
+    Tests for the :class:`~django_dicom.models.utils.import_profile.ImportProfile`
+    class.
+
+    """
+
+    def setUp(self):
+        self.dicom_header = create_dicom_header(
+            **TEST_HEADER_ELEMENTS, Manufacturer="SIEMENS"
+        )
+
+    def get_keywords(self, profile: ImportProfile) -> set:
+        return {
+            data_element.keyword for data_element in profile.filter(self.dicom_header)
+        }
+
+    @override_settings(DICOM_IMPORT_MODE="minimal")
+    def test_minimal_mode_excludes_all_elements(self):
+        self.assertEqual(self.get_keywords(ImportProfile.from_settings()), set())
+
+    @override_settings(DICOM_IMPORT_MODE="full")
+    def test_full_mode_includes_all_elements(self):
+        keywords = self.get_keywords(ImportProfile.from_settings())
+        self.assertEqual(keywords, {*TEST_HEADER_ELEMENTS, "Manufacturer"})
+
+    def test_exclude_rules(self):
+        profile = ImportProfile(exclude_tags=[("0020", "0013")], exclude_vrs=["PN"])
+        keywords = self.get_keywords(profile)
+        self.assertNotIn("InstanceNumber", keywords)
+        self.assertNotIn("PatientName", keywords)
+        self.assertIn("PatientID", keywords)
+
+    def test_include_rules(self):
+        profile = ImportProfile(include=["PatientID", ("0020", "0013")])
+        keywords = self.get_keywords(profile)
+        self.assertEqual(keywords, {"PatientID", "InstanceNumber"})
+
+    def test_max_size(self):
+        profile = ImportProfile(max_size=10)
+        keywords = self.get_keywords(profile)
+        self.assertNotIn("SeriesDescription", keywords)
+        self.assertIn("PatientID", keywords)
+
+    def test_modality_and_manufacturer_rules(self):
+        profile = ImportProfile(
+            exclude_vrs=["PN"],
+            modalities={"MR": {"include": ["PatientID", "PatientName"]}},
+            manufacturers={"siemens": {"exclude_vrs": ["LO"]}},
+        )
+        self.assertEqual(self.get_keywords(profile), set())
+        other = create_dicom_header(**TEST_HEADER_ELEMENTS, Manufacturer="GE")
+        specialized = profile.for_header(other)
+        self.assertIs(profile.for_header(other), specialized)
+        keywords = {data_element.keyword for data_element in specialized.filter(other)}
+        self.assertEqual(keywords, {"PatientID"})
+
+    @override_settings(
+        DICOM_IMPORT_MODE="full", DICOM_IMPORT_PROFILE={"include": ["PatientID"]}
+    )
+    def test_from_settings(self):
+        self.assertEqual(
+            self.get_keywords(ImportProfile.from_settings()), {"PatientID"}
+        )
+
+    def test_import_profile_context(self):
+        profile = ImportProfile()
+        with import_profile(profile):
+            self.assertIs(get_import_profile(), profile)
+            with import_profile() as nested:
+                self.assertIs(nested, profile)
+        self.assertIsNot(get_import_profile(), profile)
+
+
+@override_settings(DICOM_IMPORT_MODE="full")
+class HeaderImportProfileTestCase(TestCase):
+    """
+    Tests for header creation using an active import profile.
+
+    """
+
+    def test_bulk_from_dicom_parser_uses_active_profile(self):
+        dicom_header = create_dicom_header(**TEST_HEADER_ELEMENTS)
+        with import_profile(ImportProfile(include=["PatientID", "InstanceNumber"])):
+            (header,) = Header.objects.bulk_from_dicom_parser([dicom_header])
+        keywords = header.data_element_set.values_list("definition__keyword", flat=True)
+        self.assertCountEqual(keywords, ["PatientID", "InstanceNumber"])
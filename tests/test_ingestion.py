@@ -0,0 +1,250 @@
+import shutil
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+import pydicom
+from django.apps import apps
+from django.test import SimpleTestCase, TestCase, override_settings
+from django_dicom.models import Image
+from django_dicom.models.networking.handlers import (
+    OUT_OF_RESOURCES,
+    handle_release,
+    handle_store,
+)
+from django_dicom.models.networking.association_batch import ASSOCIATION_BATCHES
+from django_dicom.models.networking.ingestion import (
+    IngestionQueue,
+    get_spooled_files,
+    import_spooled_files,
+    read_received_header,
+    recover_spool,
+)
+from django_dicom.models.networking.utils import (
+    DICOM_ROOT,
+    get_temp_path,
+    import_dataset_to_db,
+)
+from django_dicom.models.utils.utils import get_mri_root
+from django_dicom.utils.networking import get_ingestion_queue_configuration
+from pynetdicom.dsutils import encode
+from pynetdicom.status import Status
+from tests.fixtures import TEST_DWI_IMAGE_PATH, TEST_IMAGE_FIELDS, TEST_IMAGE_PATH
+
+
+def create_store_event(path: str = TEST_IMAGE_PATH, assoc=None) -> mock.Mock:
+    dataset = pydicom.dcmread(path)
+    encoded = encode(dataset, dataset.is_implicit_VR, dataset.is_little_endian)
+    event = mock.Mock(dataset=dataset, file_meta=dataset.file_meta)
+    if assoc is not None:
+        event.assoc = assoc
+    event.request.AffectedSOPInstanceUID = dataset.SOPInstanceUID
+    event.request.DataSet = BytesIO(encoded)
+    return event
+
+
+class IngestionQueueTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :class:`~django_dicom.models.networking.ingestion.IngestionQueue` class.
+
+    """
+
+    def test_backpressure(self):
+        ingestion_queue = IngestionQueue(max_size=2, batch_size=5)
+        self.assertTrue(ingestion_queue.put(Path("a.dcm")))
+        self.assertTrue(ingestion_queue.put(Path("b.dcm")))
+        self.assertTrue(ingestion_queue.is_full)
+        self.assertFalse(ingestion_queue.put(Path("c.dcm")))
+        self.assertEqual(ingestion_queue.depth, 2)
+        batch = [item.path for item in ingestion_queue.get_batch()]
+        self.assertEqual(batch, [Path("a.dcm"), Path("b.dcm")])
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            IngestionQueue(backend="invalid")
+
+    def test_celery_dispatch(self):
+        ingestion_queue = IngestionQueue(backend="celery")
+        with mock.patch("django_dicom.tasks.import_spooled.delay") as delay:
+            ingestion_queue.dispatch([Path("a.dcm")])
+        delay.assert_called_once_with(["a.dcm"])
+
+    def test_configuration(self):
+        self.assertIsNone(get_ingestion_queue_configuration())
+        with self.settings(DICOM_SCP_QUEUE={"workers": 4}):
+            configuration = get_ingestion_queue_configuration()
+        self.assertEqual(configuration["workers"], 4)
+        self.assertEqual(configuration["backend"], "thread")
+
+    def test_spool_recovery_without_queue(self):
+        config = apps.get_app_config("django_dicom")
+        self.assertIsNone(config.create_ingestion_queue())
+        with mock.patch(
+            "django_dicom.models.networking.ingestion.recover_spool"
+        ) as recover:
+            config.recover_spool()
+        recover.assert_called_once_with(None)
+
+    @override_settings(TESTING_MODE=False, DICOM_AE_AUTOSTART=True)
+    def test_spool_recovered_only_by_serving_process(self):
+        config = apps.get_app_config("django_dicom")
+        for servers, recovered in (([], False), ([mock.Mock()], True)):
+            with mock.patch.object(
+                config, "application_entity", None
+            ), mock.patch.object(config, "ingestion_queue", None), mock.patch.object(
+                config, "create_application_entity"
+            ), mock.patch.object(
+                config, "start_servers", return_value=servers
+            ), mock.patch.object(
+                config, "recover_spool"
+            ) as recover:
+                config.ready()
+            self.assertIs(recover.called, recovered)
+
+    def test_handle_store_refuses_when_full(self):
+        ingestion_queue = IngestionQueue(max_size=1)
+        ingestion_queue.put(Path("a.dcm"))
+        with mock.patch(
+            "django_dicom.models.networking.handlers.get_ingestion_queue",
+            return_value=ingestion_queue,
+        ), mock.patch(
+            "django_dicom.models.networking.utils.save_dataset"
+        ) as save_dataset, self.assertLogs(
+            "data.dicom.networking", "WARNING"
+        ):
+            status = handle_store(create_store_event())
+        self.assertEqual(status, OUT_OF_RESOURCES)
+        save_dataset.assert_not_called()
+
+    def test_handle_store_queues_dataset(self):
+        ingestion_queue = IngestionQueue()
+        with mock.patch(
+            "django_dicom.models.networking.handlers.get_ingestion_queue",
+            return_value=ingestion_queue,
+        ), mock.patch(
+            "django_dicom.models.networking.utils.save_dataset",
+            return_value=Path("a.dcm"),
+        ) as save_dataset:
+            status = handle_store(create_store_event())
+        self.assertEqual(status, Status.SUCCESS)
+        self.assertTrue(save_dataset.call_args.kwargs["durable"])
+        self.assertEqual(ingestion_queue.depth, 1)
+
+
+@override_settings(KEEP_ORIGINAL_DICOM=False)
+class ImportSpooledFilesTestCase(TestCase):
+    """
+    Tests for the
+    :func:`~django_dicom.models.networking.ingestion.import_spooled_files`
+    function.
+
+    """
+
+    def setUp(self):
+        DICOM_ROOT.mkdir(parents=True, exist_ok=True)
+        self.path = get_temp_path(TEST_IMAGE_FIELDS["uid"])
+        shutil.copy(TEST_IMAGE_PATH, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(get_mri_root(), ignore_errors=True)
+
+    def test_import_spooled_files(self):
+        self.assertEqual(get_spooled_files(), [self.path])
+        self.assertEqual(import_spooled_files([self.path]), 1)
+        self.assertFalse(self.path.exists())
+        image = Image.objects.get(uid=TEST_IMAGE_FIELDS["uid"])
+        self.assertTrue(Path(image.dcm.path).is_file())
+
+
+class ImportDatasetTestCase(TestCase):
+    """
+    Tests for the
+    :func:`~django_dicom.models.networking.utils.import_dataset_to_db`
+    function.
+
+    """
+
+    def tearDown(self):
+        shutil.rmtree(get_mri_root(), ignore_errors=True)
+
+    def test_import_dataset_to_db_writes_once(self):
+        event = create_store_event()
+        with mock.patch("pydicom.dcmread") as dcmread:
+            import_dataset_to_db(event)
+        dcmread.assert_not_called()
+        image = Image.objects.get(uid=TEST_IMAGE_FIELDS["uid"])
+        self.assertEqual(Path(image.dcm.path), image.default_path)
+        self.assertFalse(get_temp_path(image.uid).exists())
+        saved = pydicom.dcmread(image.dcm.path)
+        self.assertEqual(saved.SOPInstanceUID, image.uid)
+
+
+class AssociationBatchTestCase(TestCase):
+    """
+    Tests for the
+    :class:`~django_dicom.models.networking.association_batch.AssociationBatch`
+    class.
+
+    """
+
+    def setUp(self):
+        DICOM_ROOT.mkdir(parents=True, exist_ok=True)
+        self.assoc = mock.Mock()
+
+    def tearDown(self):
+        shutil.rmtree(get_mri_root(), ignore_errors=True)
+
+    def receive(self) -> Status:
+        paths = TEST_IMAGE_PATH, TEST_DWI_IMAGE_PATH
+        return [handle_store(create_store_event(path, self.assoc)) for path in paths]
+
+    @override_settings(DICOM_SCP_ASSOCIATION_BATCH=True)
+    def test_import_on_release(self):
+        self.assertEqual(self.receive(), [Status.SUCCESS] * 2)
+        self.assertFalse(Image.objects.exists())
+        with self.assertLogs("data.dicom.networking", "INFO"):
+            handle_release(mock.Mock(assoc=self.assoc))
+        self.assertEqual(Image.objects.count(), 2)
+        self.assertEqual(list(DICOM_ROOT.glob("*.dcm")), [])
+
+    @override_settings(DICOM_SCP_ASSOCIATION_BATCH={"memory_limit": 0})
+    def test_spool_beyond_memory_limit(self):
+        self.receive()
+        self.assertEqual(len(list(DICOM_ROOT.glob("*.dcm"))), 2)
+        with self.assertLogs("data.dicom.networking", "INFO"):
+            handle_release(mock.Mock(assoc=self.assoc))
+        self.assertEqual(Image.objects.count(), 2)
+        self.assertEqual(list(DICOM_ROOT.glob("*.dcm")), [])
+
+    @override_settings(DICOM_SCP_ASSOCIATION_BATCH={"spool": True})
+    def test_spooled_records_hold_no_pixel_data(self):
+        self.receive()
+        records = ASSOCIATION_BATCHES[self.assoc].records
+        self.assertEqual(len(records), 2)
+        for record in records:
+            self.assertIsInstance(record, Path)
+            header = read_received_header(record)
+            self.assertNotIn("PixelData", header.raw)
+        with self.assertLogs("data.dicom.networking", "INFO"):
+            handle_release(mock.Mock(assoc=self.assoc))
+        self.assertEqual(Image.objects.count(), 2)
+
+    @override_settings(DICOM_SCP_ASSOCIATION_BATCH=True)
+    def test_spool_failed_datasets(self):
+        self.receive()
+        self.assertEqual(list(DICOM_ROOT.glob("*.dcm")), [])
+        with mock.patch.object(
+            Image.objects, "import_chunk", side_effect=RuntimeError
+        ), self.assertLogs("data.dicom.networking", "WARNING"):
+            handle_release(mock.Mock(assoc=self.assoc))
+        self.assertFalse(Image.objects.exists())
+        spooled = get_spooled_files()
+        self.assertEqual(len(spooled), 2)
+        with mock.patch(
+            "django_dicom.models.networking.ingestion.import_spooled_batches"
+        ) as import_spooled_batches, self.assertLogs("data.dicom.networking", "INFO"):
+            recover_spool().join()
+        import_spooled_batches.assert_called_once_with(spooled)
+        self.assertEqual(import_spooled_files(spooled), 2)
+        self.assertEqual(get_spooled_files(), [])
@@ -0,0 +1,208 @@
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from django_dicom.models.networking import (
+    ScpMetricsSnapshot,
+    StorageServiceClassProvider,
+)
+from django_dicom.models.networking.handlers import (
+    OUT_OF_RESOURCES,
+    handle_release,
+    handle_store,
+)
+from django_dicom.models.networking.ingestion import IngestionQueue
+from django_dicom.models.networking.metrics import (
+    ASSOCIATION_METRICS,
+    PROVIDER_METRICS,
+    SNAPSHOT_EXPIRY,
+    Histogram,
+    ScpMetrics,
+    get_active_association_metrics,
+    get_worker_id,
+    merge_metrics,
+    publish_metrics,
+)
+from rest_framework import status
+
+from .test_ingestion import create_store_event
+from .utils import LoggedInTestCase
+
+TEST_PORT = 11119
+
+
+def create_association(port: int = TEST_PORT) -> mock.Mock:
+    assoc = mock.Mock(is_established=True)
+    assoc.acceptor.port = port
+    assoc.requestor.address = "127.0.0.1"
+    assoc.requestor.port = 50000
+    return assoc
+
+
+class ScpMetricsTestCase(SimpleTestCase):
+    """
+    Tests for the :class:`~django_dicom.models.networking.metrics.ScpMetrics`
+    class.
+
+    """
+
+    def tearDown(self):
+        PROVIDER_METRICS.pop(TEST_PORT, None)
+
+    def test_histogram(self):
+        histogram = Histogram()
+        histogram.observe(0.002)
+        histogram.observe(0.2, count=3)
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 4)
+        self.assertAlmostEqual(summary["mean"], 0.1505)
+        self.assertEqual(summary["buckets"]["0.001"], 0)
+        self.assertEqual(summary["buckets"]["0.005"], 1)
+        self.assertEqual(summary["buckets"]["0.5"], 4)
+        self.assertEqual(summary["buckets"]["+Inf"], 4)
+
+    def test_parent_propagation(self):
+        parent = ScpMetrics()
+        metrics = ScpMetrics(parent=parent)
+        metrics.record_instance(100)
+        metrics.record_failures()
+        metrics.record_failures(2, refused=True)
+        with metrics.measure("write"):
+            pass
+        for summary in metrics.to_dict(), parent.to_dict():
+            self.assertEqual(summary["instances"], 1)
+            self.assertEqual(summary["bytes_received"], 100)
+            self.assertEqual(summary["failures"], 1)
+            self.assertEqual(summary["refused"], 2)
+            self.assertEqual(summary["latency"]["write"]["count"], 1)
+            self.assertEqual(summary["latency"]["import"]["count"], 0)
+
+    def test_measure_skips_errors(self):
+        metrics = ScpMetrics()
+        with self.assertRaises(RuntimeError), metrics.measure("import"):
+            raise RuntimeError
+        self.assertEqual(metrics.to_dict()["latency"]["import"]["count"], 0)
+
+    def test_handle_store_records_refusal(self):
+        assoc = create_association()
+        ingestion_queue = IngestionQueue(max_size=1)
+        ingestion_queue.put(Path("a.dcm"))
+        with mock.patch(
+            "django_dicom.models.networking.handlers.get_ingestion_queue",
+            return_value=ingestion_queue,
+        ), self.assertLogs("data.dicom.networking", "WARNING"):
+            status = handle_store(create_store_event(assoc=assoc))
+        self.assertEqual(status, OUT_OF_RESOURCES)
+        summary = PROVIDER_METRICS[TEST_PORT].to_dict()
+        self.assertEqual(summary["instances"], 1)
+        self.assertEqual(summary["refused"], 1)
+        associations = get_active_association_metrics(TEST_PORT)
+        self.assertEqual(len(associations), 1)
+        self.assertEqual(associations[0]["address"], "127.0.0.1")
+        handle_release(mock.Mock(assoc=assoc))
+        self.assertNotIn(assoc, ASSOCIATION_METRICS)
+        self.assertEqual(get_active_association_metrics(TEST_PORT), [])
+
+    def test_merge_metrics(self):
+        first, second = ScpMetrics(), ScpMetrics()
+        first.record_instance(100)
+        first.observe("import", 0.002)
+        second.record_instance(50)
+        second.record_failures()
+        second.observe("import", 0.2, count=3)
+        summaries = [{**first.to_dict(), "queue_depth": 2}, second.to_dict()]
+        merged = merge_metrics(summaries)
+        self.assertEqual(merged["workers"], 2)
+        self.assertEqual(merged["queue_depth"], 2)
+        self.assertEqual(merged["instances"], 2)
+        self.assertEqual(merged["bytes_received"], 150)
+        self.assertEqual(merged["failures"], 1)
+        self.assertEqual(merged["started"], first.started_at)
+        latency = merged["latency"]["import"]
+        self.assertEqual(latency["count"], 4)
+        self.assertAlmostEqual(latency["mean"], 0.1505)
+        self.assertEqual(latency["buckets"]["0.005"], 1)
+        self.assertEqual(latency["buckets"]["+Inf"], 4)
+
+    def test_merge_no_metrics(self):
+        merged = merge_metrics([])
+        self.assertEqual(merged["workers"], 0)
+        self.assertEqual(merged["instances"], 0)
+        self.assertEqual(merged["uptime"], 0)
+        self.assertIsNone(merged["queue_depth"])
+        self.assertIsNone(merged["latency"]["import"]["mean"])
+
+    def test_queue_wait(self):
+        metrics = ScpMetrics()
+        ingestion_queue = IngestionQueue()
+        ingestion_queue.put(Path("a.dcm"), metrics=metrics)
+        with mock.patch.object(ingestion_queue, "dispatch", return_value=1):
+            ingestion_queue.process(ingestion_queue.get_batch())
+        latency = metrics.to_dict()["latency"]
+        self.assertEqual(latency["queue_wait"]["count"], 1)
+        self.assertEqual(latency["import"]["count"], 1)
+
+
+class StorageScpMetricsViewTestCase(LoggedInTestCase):
+    """
+    Tests for the storage SCP metrics endpoint.
+
+    """
+
+    def setUp(self):
+        super().setUp()
+        registry = mock.patch.dict(PROVIDER_METRICS, clear=True)
+        registry.start()
+        self.addCleanup(registry.stop)
+        self.provider = StorageServiceClassProvider.objects.create(
+            title="METRICS", port=TEST_PORT, supported_contexts=[]
+        )
+        self.url = reverse(
+            "dicom:storageserviceclassprovider-metrics", args=(self.provider.id,)
+        )
+
+    def test_metrics(self):
+        PROVIDER_METRICS[TEST_PORT] = ScpMetrics()
+        PROVIDER_METRICS[TEST_PORT].record_instance(100)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["instances"], 1)
+        self.assertEqual(response.data["bytes_received"], 100)
+        self.assertIsNone(response.data["queue_depth"])
+        self.assertEqual(response.data["associations"], [])
+
+    def test_read_does_not_register_metrics(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["instances"], 0)
+        self.assertEqual(response.data["workers"], 0)
+        self.assertEqual(response.data["uptime"], 0)
+        self.assertNotIn(TEST_PORT, PROVIDER_METRICS)
+
+    def test_published_metrics(self):
+        PROVIDER_METRICS[TEST_PORT] = ScpMetrics()
+        PROVIDER_METRICS[TEST_PORT].record_instance(100)
+        # Published snapshots of the current process are read from memory.
+        publish_metrics()
+        self.assertTrue(
+            ScpMetricsSnapshot.objects.filter(
+                port=TEST_PORT, worker=get_worker_id()
+            ).exists()
+        )
+        other, expired = ScpMetrics(), ScpMetrics()
+        other.record_instance(50)
+        expired.record_instance(25)
+        ScpMetricsSnapshot.objects.publish({TEST_PORT: other}, "other:1", 3)
+        ScpMetricsSnapshot.objects.publish({TEST_PORT: expired}, "other:2", 4)
+        expiry = timezone.now() - timedelta(seconds=SNAPSHOT_EXPIRY + 1)
+        ScpMetricsSnapshot.objects.filter(worker="other:2").update(updated=expiry)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["workers"], 2)
+        self.assertEqual(response.data["instances"], 2)
+        self.assertEqual(response.data["bytes_received"], 150)
+        self.assertEqual(response.data["queue_depth"], 3)
+        # Expired snapshots are deleted once metrics are published again.
+        publish_metrics()
+        self.assertFalse(ScpMetricsSnapshot.objects.filter(worker="other:2").exists())
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django_dicom.models.utils import FilePlacement, get_file_placement
+from django_dicom.models.utils.placement import (
+    directory_cache,
+    make_directory,
+    place_file,
+)
+
+
+class FilePlacementTestCase(SimpleTestCase):
+    """
+    Tests for the :mod:`~django_dicom.models.utils.placement` module.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.source = self.root / "source.dcm"
+        self.source.write_bytes(b"DICM")
+        self.target = self.root / "target.dcm"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @override_settings(KEEP_ORIGINAL_DICOM=False)
+    def test_get_file_placement(self):
+        self.assertIs(get_file_placement(), FilePlacement.RENAME)
+        with self.settings(DICOM_FILE_PLACEMENT="hardlink"):
+            self.assertIs(get_file_placement(), FilePlacement.HARDLINK)
+        with self.settings(KEEP_ORIGINAL_DICOM=True):
+            self.assertIs(get_file_placement(), FilePlacement.COPY)
+            with self.settings(DICOM_FILE_PLACEMENT="rename"):
+                self.assertIs(get_file_placement(), FilePlacement.COPY)
+
+    def test_rename(self):
+        used = place_file(self.source, self.target, FilePlacement.RENAME)
+        self.assertIs(used, FilePlacement.RENAME)
+        self.assertFalse(self.source.exists())
+        self.assertEqual(self.target.read_bytes(), b"DICM")
+
+    def test_hardlink(self):
+        self.target.write_bytes(b"OLD")
+        used = place_file(self.source, self.target, FilePlacement.HARDLINK)
+        self.assertIs(used, FilePlacement.HARDLINK)
+        self.assertTrue(os.path.samefile(self.source, self.target))
+
+    def test_hardlink_fallback(self):
+        error = OSError("Cross-device link")
+        with mock.patch("os.link", side_effect=error), mock.patch(
+            "django_dicom.models.utils.placement.reflink", side_effect=error
+        ):
+            used = place_file(self.source, self.target, FilePlacement.HARDLINK)
+        self.assertIs(used, FilePlacement.COPY)
+        self.assertTrue(self.source.exists())
+        self.assertFalse(os.path.samefile(self.source, self.target))
+        self.assertEqual(self.target.read_bytes(), b"DICM")
+        self.assertEqual(list(self.root.glob("*.tmp")), [])
+
+    def test_rename_fallback(self):
+        with mock.patch("os.rename", side_effect=OSError("Cross-device link")):
+            used = place_file(self.source, self.target, FilePlacement.RENAME)
+        self.assertIs(used, FilePlacement.COPY)
+        self.assertFalse(self.source.exists())
+        self.assertEqual(self.target.read_bytes(), b"DICM")
+
+    def test_directory_cache(self):
+        directory = self.root / "a" / "b"
+        with directory_cache() as cache:
+            make_directory(directory)
+            with mock.patch.object(Path, "mkdir") as mkdir:
+                make_directory(directory)
+            mkdir.assert_not_called()
+            self.assertEqual(cache, {directory})
+        self.assertTrue(directory.is_dir())
@@ -0,0 +1,108 @@
+import socket
+import threading
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django_dicom.models.networking import StorageServiceClassProvider
+from django_dicom.models.networking.handlers import handlers
+from django_dicom.models.networking.runner import (
+    SharedSocketAssociationServer,
+    StorageScpRunner,
+)
+from pynetdicom import AE
+from pynetdicom.sop_class import VerificationSOPClass
+
+
+class StorageScpRunnerTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :class:`~django_dicom.models.networking.runner.StorageScpRunner` class.
+
+    """
+
+    def create_server(self, address, **kwargs) -> SharedSocketAssociationServer:
+        application_entity = AE()
+        application_entity.add_supported_context(VerificationSOPClass)
+        server = application_entity.make_server(
+            address,
+            evt_handlers=handlers,
+            server_class=SharedSocketAssociationServer,
+            **kwargs,
+        )
+        application_entity._servers.append(server)
+        self.addCleanup(server.server_close)
+        return server
+
+    def echo(self, port: int) -> int:
+        application_entity = AE()
+        application_entity.add_requested_context(VerificationSOPClass)
+        association = application_entity.associate("127.0.0.1", port)
+        self.assertTrue(association.is_established)
+        status = association.send_c_echo()
+        association.release()
+        return status.Status
+
+    def test_shared_socket(self):
+        provider = StorageServiceClassProvider(id=1, ip="127.0.0.1", port=0)
+        runner = StorageScpRunner(workers=1, providers=[provider])
+        sockets = runner.bind_sockets()
+        listening_socket = sockets[provider.id]
+        server = self.create_server(("127.0.0.1", 0), listening_socket=listening_socket)
+        self.assertIs(server.socket, listening_socket)
+        port = server.server_address[1]
+        self.assertEqual(port, listening_socket.getsockname()[1])
+        acceptor = threading.Thread(target=server.serve_forever)
+        acceptor.start()
+        try:
+            self.assertEqual(self.echo(port), 0)
+        finally:
+            server.shutdown()
+            acceptor.join()
+
+    def test_reuse_port(self):
+        first = self.create_server(("127.0.0.1", 0))
+        port = first.server_address[1]
+        second = self.create_server(("127.0.0.1", port))
+        self.assertEqual(second.server_address[1], port)
+        option = second.socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+        self.assertTrue(option)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            StorageScpRunner(mode="invalid", providers=[])
+
+    def test_command_requires_autostart_disabled(self):
+        config = apps.get_app_config("django_dicom")
+        with mock.patch.object(config, "application_entity", AE()):
+            with self.assertRaises(CommandError):
+                call_command("run_storage_scp")
+
+    def test_spool_recovered_once_before_forking(self):
+        runner = StorageScpRunner(workers=2, providers=[])
+        calls = mock.Mock()
+        calls.get_spooled_files.return_value = ["a.dcm"]
+        calls.start_worker.return_value.is_alive.return_value = False
+        with mock.patch(
+            "django_dicom.models.networking.runner.get_spooled_files",
+            calls.get_spooled_files,
+        ), mock.patch(
+            "django_dicom.models.networking.runner.import_spooled_batches",
+            calls.import_spooled_batches,
+        ), mock.patch.object(
+            runner, "start_worker", calls.start_worker
+        ), mock.patch.object(
+            runner._stopped, "wait", side_effect=[False, True]
+        ), mock.patch(
+            "signal.signal"
+        ), self.assertLogs(
+            "data.dicom.networking", "INFO"
+        ):
+            runner.run()
+        names = [call[0] for call in calls.mock_calls if "." not in call[0]]
+        self.assertEqual(
+            names,
+            ["get_spooled_files", "import_spooled_batches"] + ["start_worker"] * 4,
+        )
+        calls.import_spooled_batches.assert_called_once_with(["a.dcm"])
@@ -1,8 +1,11 @@
 import os
 from pathlib import Path
 
+import numpy as np
+from dicom_parser.header import Header as DicomHeader
 from django.contrib.auth import get_user_model
 from django_dicom.models import Image
+from pydicom.dataset import Dataset
 from rest_framework.test import APITestCase
 
 TEST_PASSWORD = "Aa123456"
@@ -36,3 +39,20 @@ def seperate_raw_name(raw_name: str, fields: list) -> dict:
         name_dict[field] = splitted[i] if i < len(splitted) else ""
         i += 1
     return name_dict
+
+
+def create_dicom_header(**elements) -> DicomHeader:
+    dataset = Dataset()
+    for keyword, value in elements.items():
+        setattr(dataset, keyword, value)
+    return DicomHeader(dataset)
+
+
+def get_values_by_keyword(header) -> dict:
+    values = {}
+    for element in header.to_verbose_list():
+        value = element["value"]
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        values[element["keyword"]] = value
+    return values